@@ -6,7 +6,9 @@ et afficher des informations détaillées sur la base de données.
 
 import sys
 import os
+import io
 import argparse
+from itertools import islice
 from typing import Dict, Optional, List
 
 # Essayer d'importer oracledb
@@ -17,6 +19,31 @@ except ImportError:
     print("Installez-la avec: pip install oracledb")
     sys.exit(1)
 
+# Privilèges importants à vérifier (dans l'ordre d'affichage)
+_KEY_PRIVILEGES = (
+    "CREATE SESSION", "CREATE USER", "CREATE TABLE",
+    "CREATE VIEW", "CREATE SEQUENCE", "UNLIMITED TABLESPACE"
+)
+_KEY_PRIV_SET = frozenset(_KEY_PRIVILEGES)
+
+# Ouvre un curseur sur la première vue de tablespaces accessible (sans aller-retour par vue)
+_TABLESPACES_PLSQL = """
+DECLARE
+    views SYS.ODCIVARCHAR2LIST := SYS.ODCIVARCHAR2LIST('USER_TABLESPACES', 'DBA_TABLESPACES', 'ALL_TABLESPACES');
+BEGIN
+    :view_name := NULL;
+    FOR i IN 1 .. views.COUNT LOOP
+        BEGIN
+            OPEN :rc FOR 'SELECT TABLESPACE_NAME FROM ' || views(i);
+            :view_name := views(i);
+            EXIT;
+        EXCEPTION
+            WHEN OTHERS THEN NULL;
+        END;
+    END LOOP;
+END;
+"""
+
 def parse_args():
     """Analyse les arguments de ligne de commande."""
     parser = argparse.ArgumentParser(description="Outil de diagnostic pour la connexion Oracle")
@@ -31,43 +58,48 @@ def get_connection_params(args) -> Dict[str, str]:
     """Récupère les paramètres de connexion depuis les arguments ou les variables d'environnement."""
     params = {}
     
-    # Priorité aux arguments
-    if args.user:
-        params["user"] = args.user
-    elif os.environ.get("ORACLE_USER"):
-        params["user"] = os.environ.get("ORACLE_USER")
-    elif os.environ.get("ORACLE_ADMIN_USER"):
-        params["user"] = os.environ.get("ORACLE_ADMIN_USER")
-    else:
-        params["user"] = input("Nom d'utilisateur Oracle: ")
+    # Priorité aux arguments, puis une seule lecture par variable d'environnement
+    params["user"] = (
+        args.user
+        or os.environ.get("ORACLE_USER")
+        or os.environ.get("ORACLE_ADMIN_USER")
+        or input("Nom d'utilisateur Oracle: ")
+    )
     
-    if args.password:
-        params["password"] = args.password
-    elif os.environ.get("ORACLE_PASSWORD"):
-        params["password"] = os.environ.get("ORACLE_PASSWORD")
-    elif os.environ.get("ORACLE_ADMIN_PASSWORD"):
-        params["password"] = os.environ.get("ORACLE_ADMIN_PASSWORD")
-    else:
+    password = (
+        args.password
+        or os.environ.get("ORACLE_PASSWORD")
+        or os.environ.get("ORACLE_ADMIN_PASSWORD")
+    )
+    if not password:
         import getpass
-        params["password"] = getpass.getpass("Mot de passe Oracle: ")
+        password = getpass.getpass("Mot de passe Oracle: ")
+    params["password"] = password
     
-    if args.dsn:
-        params["dsn"] = args.dsn
-    elif args.tns:
-        params["dsn"] = args.tns
-    elif os.environ.get("ORACLE_DSN"):
-        params["dsn"] = os.environ.get("ORACLE_DSN")
-    elif os.environ.get("ORACLE_ADMIN_DSN"):
-        params["dsn"] = os.environ.get("ORACLE_ADMIN_DSN")
-    else:
-        params["dsn"] = input("DSN Oracle (format host:port/service): ")
+    params["dsn"] = (
+        args.dsn
+        or args.tns
+        or os.environ.get("ORACLE_DSN")
+        or os.environ.get("ORACLE_ADMIN_DSN")
+        or input("DSN Oracle (format host:port/service): ")
+    )
     
     return params
 
 def test_connection(params: Dict[str, str]) -> bool:
     """Teste la connexion à Oracle et affiche des informations détaillées."""
-    print("\n=== TEST DE CONNEXION ORACLE ===")
-    print(f"Tentative de connexion avec l'utilisateur {params['user']} sur {params['dsn']}")
+    # Le rapport est accumulé en mémoire puis écrit en une seule fois
+    out = io.StringIO()
+    try:
+        return _test_connection(params, out)
+    finally:
+        sys.stdout.write(out.getvalue())
+        sys.stdout.flush()
+
+def _test_connection(params: Dict[str, str], out: io.StringIO) -> bool:
+    """Effectue les tests de connexion en écrivant le rapport dans out."""
+    print("\n=== TEST DE CONNEXION ORACLE ===", file=out)
+    print(f"Tentative de connexion avec l'utilisateur {params['user']} sur {params['dsn']}", file=out)
     
     try:
         conn = oracledb.connect(
@@ -75,83 +107,83 @@ def test_connection(params: Dict[str, str]) -> bool:
             password=params["password"],
             dsn=params["dsn"]
         )
-        print("✓ Connexion réussie!")
+        print("✓ Connexion réussie!", file=out)
         
         # Informations de base
         cursor = conn.cursor()
+        cursor.arraysize = 1000
+        cursor.prefetchrows = 1001
         cursor.execute("SELECT BANNER FROM V$VERSION")
         version = cursor.fetchone()[0]
-        print(f"Version Oracle: {version}")
+        print(f"Version Oracle: {version}", file=out)
         
         cursor.execute("SELECT SYS_CONTEXT('USERENV', 'DB_NAME') FROM DUAL")
         db_name = cursor.fetchone()[0]
-        print(f"Nom de la base: {db_name}")
+        print(f"Nom de la base: {db_name}", file=out)
         
         cursor.execute("SELECT SYS_CONTEXT('USERENV', 'INSTANCE_NAME') FROM DUAL")
         instance = cursor.fetchone()[0]
-        print(f"Instance: {instance}")
+        print(f"Instance: {instance}", file=out)
         
         cursor.execute("SELECT USER FROM DUAL")
         current_user = cursor.fetchone()[0]
-        print(f"Utilisateur connecté: {current_user}")
+        print(f"Utilisateur connecté: {current_user}", file=out)
         
         # Privilèges
-        print("\n=== PRIVILÈGES UTILISATEUR ===")
+        print("\n=== PRIVILÈGES UTILISATEUR ===", file=out)
         try:
             cursor.execute("SELECT * FROM SESSION_PRIVS")
             privileges = [row[0] for row in cursor.fetchall()]
-            print(f"Nombre de privilèges: {len(privileges)}")
-            
-            # Privilèges importants à vérifier
-            key_privileges = [
-                "CREATE SESSION", "CREATE USER", "CREATE TABLE", 
-                "CREATE VIEW", "CREATE SEQUENCE", "UNLIMITED TABLESPACE"
-            ]
+            print(f"Nombre de privilèges: {len(privileges)}", file=out)
             
-            for priv in key_privileges:
-                if priv in privileges:
-                    print(f"✓ {priv}: Présent")
+            granted = set(privileges)
+            for priv in _KEY_PRIVILEGES:
+                if priv in granted:
+                    print(f"✓ {priv}: Présent", file=out)
                 else:
-                    print(f"✗ {priv}: Absent")
+                    print(f"✗ {priv}: Absent", file=out)
             
-            print("\nAutres privilèges:")
-            other_privs = [p for p in privileges if p not in key_privileges]
-            for i in range(0, len(other_privs), 3):
-                print("  " + ", ".join(other_privs[i:i+3]))
+            print("\nAutres privilèges:", file=out)
+            other_privs = iter([p for p in privileges if p not in _KEY_PRIV_SET])
+            # Trois privilèges par ligne, sans découper la liste en tranches
+            lines = ["  " + ", ".join(chunk) for chunk in iter(lambda: tuple(islice(other_privs, 3)), ())]
+            if lines:
+                print("\n".join(lines), file=out)
             
         except Exception as e:
-            print(f"Erreur lors de la récupération des privilèges: {str(e)}")
+            print(f"Erreur lors de la récupération des privilèges: {str(e)}", file=out)
         
         # Rôles
-        print("\n=== RÔLES ATTRIBUÉS ===")
+        print("\n=== RÔLES ATTRIBUÉS ===", file=out)
         try:
             cursor.execute("SELECT * FROM USER_ROLE_PRIVS")
             roles = [row[0] for row in cursor.fetchall()]
             if roles:
                 for role in roles:
-                    print(f"Rôle: {role}")
+                    print(f"Rôle: {role}", file=out)
             else:
-                print("Aucun rôle attribué")
+                print("Aucun rôle attribué", file=out)
         except Exception as e:
-            print(f"Erreur lors de la récupération des rôles: {str(e)}")
+            print(f"Erreur lors de la récupération des rôles: {str(e)}", file=out)
         
         # Tablespaces
-        print("\n=== TABLESPACES DISPONIBLES ===")
+        print("\n=== TABLESPACES DISPONIBLES ===", file=out)
         try:
-            for view in ["USER_TABLESPACES", "DBA_TABLESPACES", "ALL_TABLESPACES"]:
-                try:
-                    cursor.execute(f"SELECT TABLESPACE_NAME FROM {view}")
-                    tablespaces = [row[0] for row in cursor.fetchall()]
-                    print(f"Tablespaces (via {view}):")
-                    for ts in tablespaces:
-                        print(f"  - {ts}")
-                    break
-                except:
-                    continue
+            # Un seul aller-retour : le bloc PL/SQL ouvre le curseur sur la première vue accessible
+            ts_cursor = conn.cursor()
+            view_var = cursor.var(str)
+            cursor.execute(_TABLESPACES_PLSQL, rc=ts_cursor, view_name=view_var)
+            view = view_var.getvalue()
+            if view:
+                tablespaces = [row[0] for row in ts_cursor.fetchall()]
+                print(f"Tablespaces (via {view}):", file=out)
+                for ts in tablespaces:
+                    print(f"  - {ts}", file=out)
             else:
-                print("Impossible d'accéder aux vues de tablespaces")
+                print("Impossible d'accéder aux vues de tablespaces", file=out)
+            ts_cursor.close()
         except Exception as e:
-            print(f"Erreur lors de la récupération des tablespaces: {str(e)}")
+            print(f"Erreur lors de la récupération des tablespaces: {str(e)}", file=out)
         
         cursor.close()
         conn.close()
@@ -162,37 +194,37 @@ def test_connection(params: Dict[str, str]) -> bool:
         error_code = getattr(error, 'code', 'N/A')
         error_message = getattr(error, 'message', str(error))
         
-        print(f"\n✗ Échec de la connexion: Erreur Oracle {error_code}")
-        print(f"Message: {error_message}")
+        print(f"\n✗ Échec de la connexion: Erreur Oracle {error_code}", file=out)
+        print(f"Message: {error_message}", file=out)
         
         # Suggestions selon le code d'erreur
         if "ORA-01017" in str(error):
-            print("\nSuggestion: Les identifiants sont incorrects. Vérifiez:")
-            print("- Le nom d'utilisateur est valide et existe dans la base de données")
-            print("- Le mot de passe est correct")
-            print("- L'utilisateur n'est pas verrouillé (demandez à un DBA)")
+            print("\nSuggestion: Les identifiants sont incorrects. Vérifiez:", file=out)
+            print("- Le nom d'utilisateur est valide et existe dans la base de données", file=out)
+            print("- Le mot de passe est correct", file=out)
+            print("- L'utilisateur n'est pas verrouillé (demandez à un DBA)", file=out)
         
         elif "ORA-12541" in str(error):
-            print("\nSuggestion: Le serveur Oracle n'est pas accessible. Vérifiez:")
-            print("- Le serveur Oracle est démarré")
-            print("- Le listener Oracle est actif")
-            print("- Le pare-feu n'empêche pas la connexion")
-            print("- L'adresse et le port sont corrects")
+            print("\nSuggestion: Le serveur Oracle n'est pas accessible. Vérifiez:", file=out)
+            print("- Le serveur Oracle est démarré", file=out)
+            print("- Le listener Oracle est actif", file=out)
+            print("- Le pare-feu n'empêche pas la connexion", file=out)
+            print("- L'adresse et le port sont corrects", file=out)
         
         elif "ORA-12514" in str(error):
-            print("\nSuggestion: Le service spécifié n'existe pas. Vérifiez:")
-            print("- Le nom du service est correct")
-            print("- Le format du DSN est correct (host:port/service)")
-            print("- La base de données est démarrée")
+            print("\nSuggestion: Le service spécifié n'existe pas. Vérifiez:", file=out)
+            print("- Le nom du service est correct", file=out)
+            print("- Le format du DSN est correct (host:port/service)", file=out)
+            print("- La base de données est démarrée", file=out)
         
         else:
-            print("\nSuggestion: Vérifiez les paramètres de connexion et l'état du serveur Oracle")
+            print("\nSuggestion: Vérifiez les paramètres de connexion et l'état du serveur Oracle", file=out)
         
         return False
     
     except Exception as e:
-        print(f"\n✗ Erreur inattendue: {str(e)}")
-        print(f"Type d'erreur: {type(e).__name__}")
+        print(f"\n✗ Erreur inattendue: {str(e)}", file=out)
+        print(f"Type d'erreur: {type(e).__name__}", file=out)
         return False
 
 def main():
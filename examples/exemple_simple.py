@@ -32,7 +32,7 @@ def main():
     oracle_config, _ = load_oracle_config()
     
     # Vérifier que la configuration est complète
-    if not all(key in oracle_config and oracle_config[key] for key in ["user", "password", "dsn"]):
+    if not all(map(oracle_config.get, ("user", "password", "dsn"))):
         logger.error("Configuration Oracle incomplète. Définissez les variables d'environnement suivantes:")
         logger.error("ORACLE_ADMIN_USER, ORACLE_ADMIN_PASSWORD, ORACLE_ADMIN_DSN")
         sys.exit(1)
@@ -33,9 +33,16 @@ Requirements:
 """
 
 import argparse
+import atexit
+import datetime
+import decimal
+import mmap
 import re
 import sys
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from pathlib import Path
 import oracledb
 
 # Default Oracle configuration for admin connections.
@@ -45,6 +52,318 @@ ORACLE_CONFIG = {
     "dsn": "localhost:1521/free"
 }
 
+# Expressions régulières utilisées par execute_sql_file, compilées une seule fois
+_RE_ON_UPDATE = re.compile(r'\s+ON\s+UPDATE\s+(?:CASCADE|RESTRICT|NO\s+ACTION|SET\s+(?:NULL|DEFAULT))', re.IGNORECASE)
+# Virgules superflues : après "(", avant ")" ou répétées
+_RE_STRAY_COMMAS = re.compile(r'\(\s*,(?:\s*,)*|,(?:\s*,)*\s*\)|,(?:\s*,)+')
+_RE_LEAD_COMMA = re.compile(r'^\s*,\s*', re.MULTILINE)
+# Variantes sur octets, appliquées aux instructions du fichier avant leur décodage
+_RE_ON_UPDATE_B = re.compile(_RE_ON_UPDATE.pattern.encode(), re.IGNORECASE)
+_RE_STRAY_COMMAS_B = re.compile(_RE_STRAY_COMMAS.pattern.encode())
+_RE_LEAD_COMMA_B = re.compile(_RE_LEAD_COMMA.pattern.encode(), re.MULTILINE)
+_RE_LINE_LEAD_COMMA = re.compile(r'(\n\s*),\s*')
+# Littéraux entre quotes, commentaires de ligne et points-virgules : seuls éléments à examiner
+# pour découper un script en instructions
+_RE_STATEMENT_TOKEN = re.compile(r"'[^']*(?:''[^']*)*'|--[^\n]*|;")
+_RE_STATEMENT_TOKEN_BYTES = re.compile(_RE_STATEMENT_TOKEN.pattern.encode())
+_RE_CREATE_TABLE = re.compile(r'CREATE TABLE (\w+)', re.IGNORECASE)
+_RE_INSERT = re.compile(r'INSERT INTO (\w+)', re.IGNORECASE)
+_RE_FK_REF = re.compile(r'REFERENCES\s+(\w+)', re.IGNORECASE)
+_RE_FK_CLAUSE = re.compile(r',\s*(?:CONSTRAINT\s+\w+\s+)?FOREIGN\s+KEY\s+\([^)]+\)\s+REFERENCES\s+\w+\s*\([^)]+\)(?:\s+ON\s+DELETE\s+\w+)?', re.IGNORECASE)
+# Contrainte FK nommée complète (group(0)) et table référencée (group(1))
+_RE_FK_CONSTRAINT = re.compile(r'CONSTRAINT\s+\w+\s+FOREIGN\s+KEY\s+\([^)]+\)\s+REFERENCES\s+(\w+)\s*\([^)]+\)(?:\s+ON\s+DELETE\s+\w+)?', re.IGNORECASE)
+_RE_DATE_WORD = re.compile(r'date', re.IGNORECASE)
+_RE_DATE_NULL = re.compile(r"(pubdate|hire_date|ord_date)([^,\)]*),\s*NULL", re.IGNORECASE)
+_RE_ISO_DATETIME = re.compile(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}')
+_RE_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+# Littéral de date ISO, avec ou sans heure, converti par _to_date_literal
+_RE_ISO_DATE_LITERAL = re.compile(r"'(\d{4}-\d{2}-\d{2})(?:\s+(\d{2}:\d{2}:\d{2}))?'")
+_RE_CREATE_INDEX = re.compile(r'^\s*CREATE\s+(?:UNIQUE\s+)?INDEX\s+(\w+)', re.IGNORECASE)
+_RE_INSERT_VALUES = re.compile(r'^INSERT\s+INTO\s+\w+\s*(?:\(([^)]*)\))?\s*VALUES\s*\((.*)\)\s*$', re.IGNORECASE | re.DOTALL)
+_RE_TO_DATE_CALL = re.compile(r"^TO_DATE\(\s*'([^']*)'\s*,\s*'(YYYY-MM-DD(?: HH24:MI:SS)?)'\s*\)$", re.IGNORECASE)
+_RE_NUMBER_LITERAL = re.compile(r'^[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?$')
+
+# Nombre de lignes envoyées par appel executemany
+_INSERT_BATCH_SIZE = 1000
+
+_NONUNIQUE_INDEXES_SQL = "SELECT index_name, table_name FROM user_indexes WHERE uniqueness = 'NONUNIQUE' AND index_type = 'NORMAL'"
+_FK_CONSTRAINTS_SQL = "SELECT table_name, constraint_name FROM user_constraints WHERE constraint_type = 'R'"
+_COLUMN_TYPES_SQL = "SELECT column_name, data_type, data_length, nullable FROM user_tab_columns WHERE table_name = :1 ORDER BY column_id"
+
+# Lecture seule de la base source : pages projetées en mémoire, cache de 32 Mo, tables
+# temporaires en mémoire
+_SQLITE_READONLY_PRAGMAS = """
+PRAGMA mmap_size = 268435456;
+PRAGMA cache_size = -32768;
+PRAGMA temp_store = MEMORY;
+"""
+
+# Colonnes et clés étrangères de toutes les tables utilisateur, chaque ligne préfixée
+# par le nom de la table (parcours de sqlite_master dans son ordre de stockage)
+_SQLITE_COLUMNS_SQL = """
+    SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+    FROM sqlite_master m JOIN pragma_table_info(m.name) p
+    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+"""
+_SQLITE_FOREIGN_KEYS_SQL = """
+    SELECT m.name, f.*
+    FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) f
+    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+"""
+
+# Taille maximale de chaque pool, qui borne aussi le nombre de tables chargées en parallèle
+_POOL_MAX_SIZE = 4
+
+# Pools de connexions créés à la demande : administrateur et un pool par utilisateur (user, dsn)
+_admin_pool = None
+_user_pools = {}
+
+def _fix_stray_commas(match):
+    """Remplace une suite de virgules superflues par le délimiteur à conserver (chaîne ou octets)."""
+    text = match.group()
+    if text[:1] in ('(', b'('):
+        return text[:1]
+    if text[-1:] in (')', b')'):
+        return text[-1:]
+    return text[:1]
+
+def _to_date_literal(match):
+    """Remplace un littéral de date ISO par l'appel TO_DATE correspondant à sa précision."""
+    if match.group(2):
+        return f"TO_DATE('{match.group(1)} {match.group(2)}', 'YYYY-MM-DD HH24:MI:SS')"
+    return f"TO_DATE('{match.group(1)}', 'YYYY-MM-DD')"
+
+def _iter_statements(sql_script):
+    """
+    Découpe un script SQL en instructions en un seul passage.
+    Les points-virgules situés dans une chaîne ou un commentaire ne terminent pas l'instruction.
+    Le script peut être une chaîne ou des octets (fichier projeté en mémoire avec mmap).
+    """
+    if isinstance(sql_script, str):
+        token_pattern, semicolon = _RE_STATEMENT_TOKEN, ';'
+    else:
+        token_pattern, semicolon = _RE_STATEMENT_TOKEN_BYTES, b';'
+    start = 0
+    for match in token_pattern.finditer(sql_script):
+        if match.group() == semicolon:
+            yield sql_script[start:match.start()]
+            start = match.end()
+    yield sql_script[start:]
+
+def _iter_file_statements(sql_file_path):
+    """
+    Produit les instructions non vides d'un fichier SQL, nettoyées (backticks, clauses
+    ON UPDATE, virgules incorrectes).
+    Le fichier est projeté en mémoire plutôt que lu en entier : seule chaque instruction
+    est copiée, nettoyée sur les octets puis décodée ; le script complet n'est jamais décodé.
+    """
+    with open(sql_file_path, 'rb') as f:
+        # mmap refuse de projeter un fichier vide
+        if not f.seek(0, 2):
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as sql_script:
+            for raw_stmt in _iter_statements(sql_script):
+                raw_stmt = raw_stmt.strip()
+                if not raw_stmt:
+                    continue
+                raw_stmt = _RE_ON_UPDATE_B.sub(b'', raw_stmt.replace(b'`', b''))
+                raw_stmt = _RE_STRAY_COMMAS_B.sub(_fix_stray_commas, raw_stmt)
+                raw_stmt = _RE_LEAD_COMMA_B.sub(b'', raw_stmt).strip()
+                if raw_stmt:
+                    yield raw_stmt.decode('utf-8')
+
+def _statement_head(stmt):
+    """
+    Retourne les premiers caractères d'une instruction en majuscules, après les
+    commentaires de ligne qui la précèdent, pour classer l'instruction sans copier
+    ni convertir tout son texte.
+    """
+    start = 0
+    while stmt.startswith('--', start):
+        newline = stmt.find('\n', start)
+        if newline == -1:
+            return ''
+        start = newline + 1
+        while start < len(stmt) and stmt[start].isspace():
+            start += 1
+    return stmt[start:start + 12].upper()
+
+def _split_values(values_str):
+    """Découpe la liste VALUES d'un INSERT en littéraux, en ignorant les virgules entre quotes ou parenthèses."""
+    tokens = []
+    depth = 0
+    start = 0
+    in_quotes = False
+    for i, char in enumerate(values_str):
+        if char == "'":
+            in_quotes = not in_quotes
+        elif in_quotes:
+            continue
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            tokens.append(values_str[start:i].strip())
+            start = i + 1
+    tokens.append(values_str[start:].strip())
+    return tokens
+
+def _parse_literal(token):
+    """
+    Convertit un littéral SQL en valeur Python pour une variable de liaison.
+    Lève ValueError pour les expressions qui doivent rester exécutées telles quelles.
+    """
+    if token.upper() == 'NULL':
+        return None
+    if len(token) >= 2 and token[0] == "'" and token[-1] == "'":
+        return token[1:-1].replace("''", "'")
+    if _RE_NUMBER_LITERAL.match(token):
+        # Decimal conserve la valeur exacte du littéral pour les colonnes NUMBER
+        return int(token) if token.lstrip('+-').isdigit() else decimal.Decimal(token)
+    date_match = _RE_TO_DATE_CALL.match(token)
+    if date_match:
+        date_format = '%Y-%m-%d %H:%M:%S' if 'HH24' in date_match.group(2).upper() else '%Y-%m-%d'
+        return datetime.datetime.strptime(date_match.group(1), date_format)
+    raise ValueError(f"Littéral non pris en charge: {token[:50]}")
+
+def _group_insert_binds(cursor, table_name, statements):
+    """
+    Transforme les INSERT ... VALUES littéraux d'une table en lignes de variables de liaison,
+    regroupées par instruction paramétrée pour executemany.
+    
+    Les types des variables sont fixés d'après user_tab_columns (setinputsizes) plutôt que
+    déduits de la première ligne de chaque lot ; les valeurs sont converties vers le type de
+    leur colonne, et une ligne inconvertible est exécutée telle quelle.
+    
+    Retourne (dictionnaire {instruction paramétrée: (types des variables,
+    [(valeurs, instruction d'origine)])}, liste des instructions à exécuter telles quelles).
+    """
+    try:
+        cursor.execute(_COLUMN_TYPES_SQL, [table_name])
+        table_columns = cursor.fetchall()
+    except oracledb.Error:
+        table_columns = []
+    column_types = {row[0]: row[1:] for row in table_columns}
+    now = datetime.datetime.now()
+    
+    groups = {}
+    shapes = {}
+    fallback = []
+    for stmt in statements:
+        match = _RE_INSERT_VALUES.match(stmt)
+        if not match:
+            fallback.append(stmt)
+            continue
+        try:
+            values = [_parse_literal(token) for token in _split_values(match.group(2))]
+        except ValueError:
+            fallback.append(stmt)
+            continue
+        
+        # Instruction paramétrée et types des colonnes, calculés une fois par forme d'INSERT
+        shape = (match.group(1), len(values))
+        if shape not in shapes:
+            columns, count = shape
+            if columns:
+                names = [name.strip().upper() for name in columns.split(',')]
+                column_clause = f" ({columns})"
+            else:
+                names = [row[0] for row in table_columns]
+                column_clause = ""
+            binds = ", ".join(f":{i}" for i in range(1, count + 1))
+            input_sizes = [None] * count
+            typed_positions = []
+            for i, name in enumerate(names[:count]):
+                data_type, data_length, nullable = column_types.get(name, ('', None, 'Y'))
+                if data_type == 'DATE' or data_type.startswith('TIMESTAMP'):
+                    input_sizes[i] = oracledb.DB_TYPE_DATE if data_type == 'DATE' else oracledb.DB_TYPE_TIMESTAMP
+                    typed_positions.append((i, 'date', nullable == 'N'))
+                elif data_type in ('NUMBER', 'FLOAT'):
+                    input_sizes[i] = oracledb.DB_TYPE_NUMBER
+                    typed_positions.append((i, 'number', False))
+                elif data_type in ('VARCHAR2', 'NVARCHAR2', 'CHAR', 'NCHAR'):
+                    input_sizes[i] = data_length
+                    typed_positions.append((i, 'text', False))
+            insert_sql = f"INSERT INTO {table_name}{column_clause} VALUES ({binds})"
+            shapes[shape] = (insert_sql, input_sizes, typed_positions)
+        insert_sql, input_sizes, typed_positions = shapes[shape]
+        
+        # Convertir chaque valeur vers le type de sa colonne. Les dates ISO deviennent des
+        # datetime, et un NULL dans une colonne DATE obligatoire prend la date courante
+        # (équivalent de SYSDATE)
+        convertible = True
+        for i, kind, required in typed_positions:
+            value = values[i]
+            if value is None:
+                if required:
+                    values[i] = now
+            elif kind == 'date':
+                if isinstance(value, str) and _RE_ISO_DATE.match(value):
+                    try:
+                        values[i] = datetime.datetime.strptime(
+                            value, '%Y-%m-%d %H:%M:%S' if _RE_ISO_DATETIME.match(value) else '%Y-%m-%d'
+                        )
+                    except ValueError:
+                        convertible = False
+                elif not isinstance(value, datetime.date):
+                    convertible = False
+            elif kind == 'number':
+                if isinstance(value, str) and _RE_NUMBER_LITERAL.match(value.strip()):
+                    values[i] = _parse_literal(value.strip())
+                elif not isinstance(value, (int, decimal.Decimal)):
+                    convertible = False
+            elif not isinstance(value, str):
+                if isinstance(value, (int, decimal.Decimal)):
+                    values[i] = str(value)
+                else:
+                    convertible = False
+        
+        if not convertible:
+            # Laisser Oracle appliquer ses conversions implicites sur l'instruction d'origine
+            fallback.append(stmt)
+            continue
+        
+        groups.setdefault(insert_sql, (input_sizes, []))[1].append((tuple(values), stmt))
+    return groups, fallback
+
+def _set_constraints(conn, constraints, action):
+    """
+    Applique ENABLE ou DISABLE à une liste de contraintes (table, contrainte) en un seul
+    bloc PL/SQL, donc en un seul aller-retour. Retourne les messages des échecs.
+    """
+    lines = ["DECLARE", "    errs SYS.ODCIVARCHAR2LIST := SYS.ODCIVARCHAR2LIST();", "BEGIN"]
+    for table_name, constraint_name in constraints:
+        ddl = f'ALTER TABLE "{table_name}" {action} CONSTRAINT "{constraint_name}"'.replace("'", "''")
+        label = f"{table_name}.{constraint_name}: ".replace("'", "''")
+        lines.append(
+            f"    BEGIN EXECUTE IMMEDIATE '{ddl}'; EXCEPTION WHEN OTHERS THEN "
+            f"errs.EXTEND; errs(errs.LAST) := SUBSTR('{label}' || SQLERRM, 1, 4000); END;"
+        )
+    lines.append("    OPEN :errs FOR SELECT column_value FROM TABLE(errs);")
+    lines.append("END;")
+    
+    cursor = conn.cursor()
+    errors_cursor = conn.cursor()
+    try:
+        cursor.execute("\n".join(lines), errs=errors_cursor)
+        return [row[0] for row in errors_cursor.fetchall()]
+    finally:
+        errors_cursor.close()
+        cursor.close()
+
+def _note_duplicate(messages, table_name, table_duplicate_count, values=None):
+    """Ajoute à messages les premiers doublons ignorés d'une table, sans inonder la sortie."""
+    if table_duplicate_count <= 3:
+        # Les valeurs de la ligne rejetée sont connues directement grâce à l'offset du lot
+        if values is not None:
+            duplicate_values = ", ".join("NULL" if value is None else str(value) for value in values)
+            messages.append(f"Ignoré: Enregistrement dupliqué dans {table_name} avec {duplicate_values}")
+        else:
+            messages.append(f"Ignoré: Enregistrement dupliqué dans {table_name}")
+    elif table_duplicate_count == 4:
+        messages.append(f"D'autres doublons dans {table_name} seront ignorés silencieusement...")
+
 def filter_sqlite_specific_statements(sql):
     """
     Remove SQLite-specific commands that are not valid in Oracle.
@@ -197,9 +516,10 @@ def process_create_table(statement):
     
     return new_statement, extra_statements
 
-def convert_sqlite_dump(sqlite_sql):
+def iter_converted_statements(sqlite_sql):
     """
-    Convert the SQLite dump SQL into Oracle-compatible SQL.
+    Convert the SQLite dump SQL into Oracle-compatible statements, yielded in
+    execution order (tables by dependency, then other statements, then INSERTs).
     This function first filters out SQLite-specific commands, then processes
     CREATE TABLE statements, and passes through other statements (like INSERTs)
     with minor cleanup.
@@ -285,32 +605,94 @@ def convert_sqlite_dump(sqlite_sql):
     # Inverser la liste pour que les tables sans dépendances soient créées en premier
     sorted_tables.reverse()
     
-    # Construire le script final dans un ordre optimisé
-    final_statements = []
-    
+    # Produire le script final dans un ordre optimisé, sans l'assembler en mémoire
     # 1. D'abord les tables dans l'ordre de dépendances
     for table_name in sorted_tables:
         if table_name in create_table_statements:
-            final_statements.append(create_table_statements[table_name])
+            yield create_table_statements[table_name]
     
     # 2. Puis les autres déclarations non-INSERT
-    final_statements.extend(other_statements)
+    yield from other_statements
     
     # 3. Enfin les INSERTs, mais seulement pour les tables que nous avons créées
     for table_name in sorted_tables:
         if table_name in insert_statements:
-            final_statements.extend(insert_statements[table_name])
-    
-    converted_sql = "\n\n".join(final_statements)
-    return converted_sql
+            yield from insert_statements[table_name]
+
+def convert_sqlite_dump(sqlite_sql):
+    """
+    Convert the SQLite dump SQL into a single Oracle-compatible SQL script.
+    """
+    return "\n\n".join(iter_converted_statements(sqlite_sql))
+
+def write_converted_sql(sqlite_sql, output_file):
+    """
+    Écrit le script Oracle converti instruction par instruction, sans construire
+    la chaîne complète du script en mémoire. Le fichier produit est identique à
+    convert_sqlite_dump().
+    """
+    # Tampon de 8 Mio pour limiter le nombre d'appels système write()
+    with open(output_file, 'w', buffering=1 << 23, encoding='utf-8', newline='\n') as f:
+        separator = ""
+        for stmt in iter_converted_statements(sqlite_sql):
+            f.write(separator)
+            f.write(stmt)
+            separator = "\n\n"
+
+def _create_pool(config):
+    """
+    Crée un pool de connexions Oracle réduit pour éviter une poignée de main TCP et
+    une authentification à chaque appel.
+    """
+    return oracledb.create_pool(
+        user=config["user"],
+        password=config["password"],
+        dsn=config["dsn"],
+        min=1,
+        max=_POOL_MAX_SIZE,
+        increment=1,
+        getmode=oracledb.POOL_GETMODE_WAIT,
+        homogeneous=True
+    )
+
+def _get_admin_pool(admin_config):
+    """
+    Retourne le pool de connexions administrateur, créé au premier appel.
+    """
+    global _admin_pool
+    if _admin_pool is None:
+        _admin_pool = _create_pool(admin_config)
+    return _admin_pool
+
+def _get_user_pool(user_config):
+    """
+    Retourne le pool de connexions de l'utilisateur, créé au premier appel.
+    """
+    key = (user_config["user"], user_config["dsn"])
+    pool = _user_pools.get(key)
+    if pool is None:
+        pool = _user_pools[key] = _create_pool(user_config)
+    return pool
+
+@atexit.register
+def _close_pools():
+    """
+    Ferme les pools de connexions à la sortie de l'interpréteur.
+    """
+    global _admin_pool
+    for pool in [_admin_pool, *_user_pools.values()]:
+        if pool is None:
+            continue
+        try:
+            pool.close(force=True)
+        except oracledb.Error:
+            pass
+    _admin_pool = None
+    _user_pools.clear()
 
 def create_oracle_user(admin_config, new_username, new_password):
     try:
-        admin_conn = oracledb.connect(
-            user=admin_config["user"],
-            password=admin_config["password"],
-            dsn=admin_config["dsn"]
-        )
+        admin_conn = _get_admin_pool(admin_config).acquire()
         cursor = admin_conn.cursor()
         try:
             cursor.execute(f"CREATE USER {new_username} IDENTIFIED BY {new_password}")
@@ -354,44 +736,145 @@ def create_oracle_user(admin_config, new_username, new_password):
         print("Error creating Oracle user:", e)
         sys.exit(1)
 
+def _load_table_inserts(pool, table_name, statements):
+    """
+    Insère les INSERT d'une table sur une connexion dédiée du pool, pour que plusieurs
+    tables puissent être chargées en parallèle (les clés étrangères sont désactivées).
+    
+    Les messages sont collectés puis affichés par le thread principal, pour que ceux de
+    plusieurs tables ne s'entremêlent pas.
+    
+    Retourne (nombre d'insertions réussies, nombre de doublons ignorés, messages).
+    """
+    messages = []
+    with pool.acquire() as conn:
+        cursor = conn.cursor()
+        messages.append(f"Insertion des données dans la table {table_name}...")
+        
+        table_duplicate_count = 0
+        table_success_count = 0
+        
+        # Envoyer les INSERT littéraux par lots de variables de liaison
+        bind_groups, fallback_stmts = _group_insert_binds(cursor, table_name, statements)
+        
+        # Chemin direct (APPEND_VALUES) tant qu'aucun lot n'échoue. Oracle impose une
+        # validation après chaque lot direct (ORA-12838), si bien qu'un rollback n'annule
+        # que le lot en échec
+        direct_path = bool(bind_groups)
+        
+        for insert_sql, (input_sizes, entries) in bind_groups.items():
+            direct_sql = insert_sql.replace("INSERT INTO", "INSERT /*+ APPEND_VALUES */ INTO", 1)
+            for start in range(0, len(entries), _INSERT_BATCH_SIZE):
+                batch = entries[start:start + _INSERT_BATCH_SIZE]
+                if direct_path:
+                    try:
+                        cursor.setinputsizes(*input_sizes)
+                        cursor.executemany(direct_sql, [values for values, _ in batch])
+                        conn.commit()
+                        table_success_count += len(batch)
+                        continue
+                    except oracledb.Error:
+                        # Doublon ou ligne invalide : le chemin direct ne sait pas écarter
+                        # une ligne, le lot est renvoyé en insertion classique
+                        conn.rollback()
+                        direct_path = False
+                
+                try:
+                    cursor.setinputsizes(*input_sizes)
+                    cursor.executemany(insert_sql, [values for values, _ in batch], batcherrors=True)
+                except oracledb.Error:
+                    # Lot refusé en bloc (types incompatibles, etc.) : instruction par instruction
+                    fallback_stmts.extend(stmt for _, stmt in batch)
+                    continue
+                
+                errors = cursor.getbatcherrors()
+                table_success_count += len(batch) - len(errors)
+                for error in errors:
+                    if error.code == 1:  # ORA-00001: unique constraint violated
+                        table_duplicate_count += 1
+                        _note_duplicate(messages, table_name, table_duplicate_count, batch[error.offset][0])
+                    else:
+                        # Rejouer la ligne avec le traitement instruction par instruction
+                        fallback_stmts.append(batch[error.offset][1])
+        
+        for stmt in fallback_stmts:
+            try:
+                # Traitement des dates pour les colonnes NOT NULL
+                if _RE_DATE_WORD.search(stmt):
+                    # Remplacer NULL par SYSDATE pour les colonnes de date
+                    stmt = _RE_DATE_NULL.sub(r"\1\2, SYSDATE", stmt)
+                    
+                    # Gérer les dates au format ISO, avec ou sans heure, en un seul passage
+                    stmt = _RE_ISO_DATE_LITERAL.sub(_to_date_literal, stmt)
+                
+                cursor.execute(stmt)
+                table_success_count += 1
+            except oracledb.DatabaseError as e:
+                error, = e.args
+                # Traitement spécifique pour les violations de contrainte d'unicité
+                if error.code == 1:  # ORA-00001: unique constraint violated
+                    table_duplicate_count += 1
+                    _note_duplicate(messages, table_name, table_duplicate_count)
+                elif error.code == 955:  # ORA-00955: name is already used by an existing object
+                    messages.append(f"Ignoré: Objet existe déjà (probablement index ou contrainte)")
+                else:
+                    messages.append(f"Erreur Oracle lors de l'insertion dans {table_name} ({error.code}): {error.message}")
+                    if error.code == 1400:  # NULL non autorisé
+                        try:
+                            # Remplacer tous les NULL par SYSDATE dans les colonnes de date
+                            stmt = _RE_DATE_NULL.sub(r"\1\2, SYSDATE", stmt)
+                            cursor.execute(stmt)
+                            table_success_count += 1
+                        except Exception as e2:
+                            messages.append(f"Échec de la correction: {str(e2)}")
+            except Exception as e:
+                messages.append(f"Erreur non-Oracle lors de l'insertion dans {table_name}: {str(e)}")
+        
+        # Résumé pour cette table
+        if table_duplicate_count > 0:
+            messages.append(f"Résumé {table_name}: {table_success_count} insertion(s) réussie(s), {table_duplicate_count} doublon(s) ignoré(s)")
+        
+        conn.commit()
+        cursor.close()
+    return table_success_count, table_duplicate_count, messages
+
 def execute_sql_file(new_user_config, sql_file_path, drop_tables=False):
     """
     Exécute un fichier SQL sur une base de données Oracle.
     """
-    import re
-    import datetime
-    
+    conn = cursor = None
     try:
-        conn = oracledb.connect(
-            user=new_user_config["user"],
-            password=new_user_config["password"],
-            dsn=new_user_config["dsn"]
-        )
+        conn = _get_user_pool(new_user_config).acquire()
         cursor = conn.cursor()
         
-        # Lire le fichier SQL et supprimer les backticks et les virgules incorrectes
-        with open(sql_file_path, 'r') as f:
-            sql_script = f.read()
-            # Nettoyer le script SQL
-            sql_script = sql_script.replace('`', '')
-            # Supprimer toutes les clauses ON UPDATE
-            sql_script = re.sub(r'\s+ON\s+UPDATE\s+CASCADE', '', sql_script, flags=re.IGNORECASE)
-            sql_script = re.sub(r'\s+ON\s+UPDATE\s+SET\s+NULL', '', sql_script, flags=re.IGNORECASE)
-            sql_script = re.sub(r'\s+ON\s+UPDATE\s+RESTRICT', '', sql_script, flags=re.IGNORECASE)
-            sql_script = re.sub(r'\s+ON\s+UPDATE\s+NO\s+ACTION', '', sql_script, flags=re.IGNORECASE)
-            sql_script = re.sub(r'\s+ON\s+UPDATE\s+SET\s+DEFAULT', '', sql_script, flags=re.IGNORECASE)
-            # Corriger les virgules superflues
-            sql_script = re.sub(r',\s*,', ',', sql_script)
-            sql_script = re.sub(r'\(\s*,', '(', sql_script)
-            sql_script = re.sub(r',\s*\)', ')', sql_script)
-            sql_script = re.sub(r'^\s*,\s*', '', sql_script, flags=re.MULTILINE)
-        
-        # Analyse avancée pour détecter les ordres de création et d'insertion
-        create_table_pattern = re.compile(r'CREATE TABLE (\w+)', re.IGNORECASE)
-        insert_pattern = re.compile(r'INSERT INTO (\w+)', re.IGNORECASE)
+        # Découper le script en instructions (les ';' entre quotes sont ignorés) et les classer
+        # en un seul passage : créations de tables, insertions par table et autres instructions
+        creates = []  # (nom de table, instruction, tables référencées, contraintes FK nommées)
+        inserts_by_table = {}
+        other_statements = []
         
-        # Utiliser une meilleure expression régulière pour diviser les déclarations SQL
-        statements = re.split(r';\s*$|\s*;\s*\n', sql_script, flags=re.MULTILINE)
+        for stmt in _iter_file_statements(sql_file_path):
+            # Seul le début de l'instruction est mis en majuscules pour la classer
+            head = _statement_head(stmt)
+            if head.startswith('CREATE TABLE'):
+                create_match = _RE_CREATE_TABLE.search(stmt)
+                if create_match:
+                    # Corriger la déclaration des colonnes (virgules en début de ligne) et
+                    # relever une seule fois les références FK utilisées en phases 1 et 1.5
+                    stmt = _RE_LINE_LEAD_COMMA.sub(r'\1', stmt)
+                    fk_refs = {ref_match.group(1).upper() for ref_match in _RE_FK_REF.finditer(stmt)}
+                    fk_clauses = [
+                        (fk_match.group(0), fk_match.group(1).upper())
+                        for fk_match in _RE_FK_CONSTRAINT.finditer(stmt)
+                    ]
+                    creates.append((create_match.group(1).upper(), stmt, fk_refs, fk_clauses))
+                    continue
+            elif head.startswith('INSERT INTO'):
+                insert_match = _RE_INSERT.search(stmt)
+                if insert_match:
+                    inserts_by_table.setdefault(insert_match.group(1).upper(), []).append(stmt)
+                    continue
+            other_statements.append(stmt)
         
         # Phase 1: Création des tables uniquement
         tables_created = set()
@@ -410,132 +893,88 @@ def execute_sql_file(new_user_config, sql_file_path, drop_tables=False):
             print(f"Erreur lors de la vérification des objets existants: {str(e)}")
         
         print("Phase 1: Création des tables...")
-        for stmt in statements:
-            stmt = stmt.strip()
-            if not stmt:
+        for table_name, stmt, fk_refs, _ in creates:
+            # Vérifier si la table existe déjà
+            if table_name in oracle_objects:
+                print(f"Table {table_name} existe déjà, utilisation de la table existante")
+                tables_created.add(table_name)
                 continue
             
-            # Détecter si c'est une instruction CREATE TABLE
-            create_match = create_table_pattern.search(stmt)
-            if create_match:
-                table_name = create_match.group(1).upper()
+            try:
+                # L'instruction a déjà été nettoyée à la lecture du fichier
+                # Vérifier si la requête contient des FOREIGN KEY avec des références à des tables non créées
+                missing_tables = [
+                    ref for ref in sorted(fk_refs)
+                    if ref not in tables_created and ref not in oracle_objects
+                ]
                 
-                # Vérifier si la table existe déjà
-                if table_name in oracle_objects:
-                    print(f"Table {table_name} existe déjà, utilisation de la table existante")
+                if missing_tables:
+                    print(f"Avertissement: Table {table_name} fait référence à des tables non créées: {', '.join(missing_tables)}")
+                    print("Création de la table sans contraintes de clé étrangère...")
+                    # Créer la table sans les contraintes FK
+                    modified_stmt = _RE_FK_CLAUSE.sub('', stmt)
+                    cursor.execute(modified_stmt)
                     tables_created.add(table_name)
+                    print(f"Table {table_name} créée avec succès (sans FK)")
                     continue
                 
-                try:
-                    # S'assurer que la requête est propre
-                    stmt = stmt.replace('`', '')
-                    # Supprimer toutes les clauses ON UPDATE
-                    stmt = re.sub(r'\s+ON\s+UPDATE\s+CASCADE', '', stmt, flags=re.IGNORECASE)
-                    stmt = re.sub(r'\s+ON\s+UPDATE\s+SET\s+NULL', '', stmt, flags=re.IGNORECASE)
-                    stmt = re.sub(r'\s+ON\s+UPDATE\s+RESTRICT', '', stmt, flags=re.IGNORECASE)
-                    stmt = re.sub(r'\s+ON\s+UPDATE\s+NO\s+ACTION', '', stmt, flags=re.IGNORECASE)
-                    # Corriger les virgules superflues
-                    stmt = re.sub(r',\s*,', ',', stmt)
-                    stmt = re.sub(r'\(\s*,', '(', stmt)
-                    stmt = re.sub(r',\s*\)', ')', stmt)
-                    # Corriger la syntaxe déclaration des colonnes (enlever les virgules au début des lignes)
-                    stmt = re.sub(r'(\n\s*),\s*', r'\1', stmt)
-                    
-                    # Vérifier si la requête contient des FOREIGN KEY avec des références à des tables non créées
-                    fk_refs = re.findall(r'REFERENCES\s+(\w+)', stmt, re.IGNORECASE)
-                    missing_tables = []
-                    for ref in fk_refs:
-                        ref_upper = ref.upper()
-                        if ref_upper not in tables_created and ref_upper not in oracle_objects:
-                            missing_tables.append(ref_upper)
-                    
-                    if missing_tables:
-                        print(f"Avertissement: Table {table_name} fait référence à des tables non créées: {', '.join(missing_tables)}")
-                        print("Création de la table sans contraintes de clé étrangère...")
-                        # Créer la table sans les contraintes FK
-                        modified_stmt = re.sub(r',\s*(CONSTRAINT\s+\w+\s+)?FOREIGN KEY\s+\([^)]+\)\s+REFERENCES\s+\w+\s*\([^)]+\)(\s+ON\s+DELETE\s+\w+)?', '', stmt, flags=re.IGNORECASE)
+                cursor.execute(stmt)
+                tables_created.add(table_name)
+                oracle_objects.add(table_name)  # Ajouter à la liste des objets
+                print(f"Table {table_name} créée avec succès")
+            except oracledb.DatabaseError as e:
+                error, = e.args
+                if error.code == 942:  # ORA-00942: table or view does not exist (référence à une table qui n'existe pas)
+                    print(f"Erreur de référence: {error.message}")
+                    print("Tentative de création sans contraintes de clé étrangère...")
+                    # Créer la table sans les contraintes FK
+                    modified_stmt = _RE_FK_CLAUSE.sub('', stmt)
+                    try:
                         cursor.execute(modified_stmt)
                         tables_created.add(table_name)
+                        oracle_objects.add(table_name)
                         print(f"Table {table_name} créée avec succès (sans FK)")
-                        continue
-                    
-                    cursor.execute(stmt)
-                    tables_created.add(table_name)
-                    oracle_objects.add(table_name)  # Ajouter à la liste des objets
-                    print(f"Table {table_name} créée avec succès")
-                except oracledb.DatabaseError as e:
-                    error, = e.args
-                    if error.code == 942:  # ORA-00942: table or view does not exist (référence à une table qui n'existe pas)
-                        print(f"Erreur de référence: {error.message}")
-                        print("Tentative de création sans contraintes de clé étrangère...")
-                        # Créer la table sans les contraintes FK
-                        modified_stmt = re.sub(r',\s*(CONSTRAINT\s+\w+\s+)?FOREIGN KEY\s+\([^)]+\)\s+REFERENCES\s+\w+\s*\([^)]+\)(\s+ON\s+DELETE\s+\w+)?', '', stmt, flags=re.IGNORECASE)
-                        try:
-                            cursor.execute(modified_stmt)
-                            tables_created.add(table_name)
-                            oracle_objects.add(table_name)
-                            print(f"Table {table_name} créée avec succès (sans FK)")
-                        except Exception as e2:
-                            print(f"Échec de la création sans FK: {str(e2)}")
-        
+                    except Exception as e2:
+                        print(f"Échec de la création sans FK: {str(e2)}")
+    
         # Phase 1.5: Ajouter les contraintes de clé étrangère après la création de toutes les tables
         print("\nPhase 1.5: Ajout des contraintes de clé étrangère...")
-        for stmt in statements:
-            stmt = stmt.strip()
-            if not stmt or not stmt.upper().startswith("CREATE TABLE"):
+        for table_name, _, _, fk_clauses in creates:
+            if table_name not in tables_created:
                 continue
-                
-            create_match = create_table_pattern.search(stmt)
-            if create_match:
-                table_name = create_match.group(1).upper()
-                if table_name not in tables_created:
-                    continue
-                
-                # Extraire toutes les contraintes FK
-                fk_constraints = re.findall(r'(CONSTRAINT\s+\w+\s+FOREIGN KEY\s+\([^)]+\)\s+REFERENCES\s+\w+\s*\([^)]+\)(\s+ON\s+DELETE\s+\w+)?)', stmt, re.IGNORECASE)
-                for i, (fk_constraint, _) in enumerate(fk_constraints):
-                    try:
-                        # Vérifier si la contrainte fait référence à une table qui existe maintenant
-                        ref_match = re.search(r'REFERENCES\s+(\w+)', fk_constraint, re.IGNORECASE)
-                        if ref_match:
-                            ref_table = ref_match.group(1).upper()
-                            if ref_table in tables_created or ref_table in oracle_objects:
-                                # Créer une déclaration ALTER TABLE pour ajouter la contrainte
-                                alter_stmt = f"ALTER TABLE {table_name} ADD {fk_constraint}"
-                                try:
-                                    cursor.execute(alter_stmt)
-                                    print(f"Contrainte FK ajoutée à {table_name} référençant {ref_table}")
-                                except oracledb.DatabaseError as e:
-                                    error, = e.args
-                                    # Ignorer si la contrainte existe déjà
-                                    if error.code != 2275:  # ORA-02275: such a constraint already exists
-                                        print(f"Erreur lors de l'ajout de la contrainte FK: {error.message}")
-                    except Exception as e:
-                        print(f"Erreur lors du traitement des contraintes FK: {str(e)}")
-        
+            
+            # Contraintes FK relevées lors du classement des instructions
+            for fk_constraint, ref_table in fk_clauses:
+                try:
+                    # Vérifier si la contrainte fait référence à une table qui existe maintenant
+                    if ref_table in tables_created or ref_table in oracle_objects:
+                        # Créer une déclaration ALTER TABLE pour ajouter la contrainte
+                        alter_stmt = f"ALTER TABLE {table_name} ADD {fk_constraint}"
+                        try:
+                            cursor.execute(alter_stmt)
+                            print(f"Contrainte FK ajoutée à {table_name} référençant {ref_table}")
+                        except oracledb.DatabaseError as e:
+                            error, = e.args
+                            # Ignorer si la contrainte existe déjà
+                            if error.code != 2275:  # ORA-02275: such a constraint already exists
+                                print(f"Erreur lors de l'ajout de la contrainte FK: {error.message}")
+                except Exception as e:
+                    print(f"Erreur lors du traitement des contraintes FK: {str(e)}")
+    
         # Après avoir créé toutes les tables, désactiver temporairement les contraintes
         print("\nDésactivation temporaire des contraintes pour permettre le chargement des données...")
+        # La liste des clés étrangères est lue une fois et resservira pour la réactivation
+        fk_constraints = []
         try:
-            cursor.execute("BEGIN DBMS_CONSTRAINT.DISABLE_ALL_CONSTRAINTS(); END;")
-        except oracledb.DatabaseError as e:
-            # Si le paquet n'existe pas, désactiver manuellement toutes les contraintes
-            try:
-                cursor.execute("""
-                    BEGIN
-                        FOR c IN (SELECT constraint_name, table_name FROM user_constraints WHERE constraint_type = 'R')
-                        LOOP
-                            BEGIN
-                                EXECUTE IMMEDIATE 'ALTER TABLE ' || c.table_name || ' DISABLE CONSTRAINT ' || c.constraint_name;
-                            EXCEPTION
-                                WHEN OTHERS THEN NULL;
-                            END;
-                        END LOOP;
-                    END;
-                """)
-                print("Contraintes de clé étrangère désactivées")
-            except Exception as e2:
-                print(f"Avertissement: Impossible de désactiver automatiquement les contraintes: {str(e2)}")
-                print("Continuons avec les contraintes actives")
+            cursor.execute(_FK_CONSTRAINTS_SQL)
+            fk_constraints = cursor.fetchall()
+            if fk_constraints:
+                _set_constraints(conn, fk_constraints, "DISABLE")
+            print("Contraintes de clé étrangère désactivées")
+        except Exception as e:
+            fk_constraints = []
+            print(f"Avertissement: Impossible de désactiver automatiquement les contraintes: {str(e)}")
+            print("Continuons avec les contraintes actives")
         
         # Phase 2: Exécution des insertions selon l'ordre logique des tables
         print("\nPhase 2: Exécution des insertions de données...")
@@ -555,93 +994,46 @@ def execute_sql_file(new_user_config, sql_file_path, drop_tables=False):
             'ROYSCHED'     # Tables avec beaucoup de dépendances
         ]
         
-        # Regrouper les insertions par table
-        inserts_by_table = {}
-        other_statements = []
-        
-        for stmt in statements:
-            stmt = stmt.strip()
-            if not stmt:
-                continue
-            
-            # Vérifier si c'est un INSERT
-            insert_match = insert_pattern.search(stmt)
-            if insert_match:
-                table_name = insert_match.group(1).upper()
-                if table_name in tables_created:
-                    if table_name not in inserts_by_table:
-                        inserts_by_table[table_name] = []
-                    inserts_by_table[table_name].append(stmt)
-            else:
-                other_statements.append(stmt)
-        
         # Statistiques de suivi
         duplicate_count = 0
         insert_success_count = 0
         
-        # Insérer les données dans les tables selon l'ordre défini
-        for table_name in table_order:
-            if table_name in inserts_by_table and table_name in tables_created:
-                print(f"Insertion des données dans la table {table_name}...")
-                
-                table_duplicate_count = 0
-                table_success_count = 0
-                
-                for stmt in inserts_by_table[table_name]:
-                    try:
-                        # Traitement des dates pour les colonnes NOT NULL
-                        if "date" in stmt.lower():
-                            # Remplacer NULL par SYSDATE pour les colonnes de date
-                            stmt = re.sub(r"(pubdate|hire_date|ord_date)([^,\)]*),\s*NULL", 
-                                        r"\1\2, SYSDATE", stmt, flags=re.IGNORECASE)
-                            
-                            # Gérer les dates au format ISO
-                            if re.search(r'\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}', stmt):
-                                stmt = re.sub(r"'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'",
-                                            r"TO_DATE('\1', 'YYYY-MM-DD HH24:MI:SS')", stmt)
-                            elif re.search(r'\d{4}-\d{2}-\d{2}', stmt):
-                                stmt = re.sub(r"'(\d{4}-\d{2}-\d{2})'",
-                                            r"TO_DATE('\1', 'YYYY-MM-DD')", stmt)
-                        
-                        cursor.execute(stmt)
-                        table_success_count += 1
-                        insert_success_count += 1
-                    except oracledb.DatabaseError as e:
-                        error, = e.args
-                        # Traitement spécifique pour les violations de contrainte d'unicité
-                        if error.code == 1:  # ORA-00001: unique constraint violated
-                            table_duplicate_count += 1
-                            duplicate_count += 1
-                            if table_duplicate_count <= 3:  # Limiter l'affichage des messages pour éviter de spammer
-                                # Extraire les détails de la violation
-                                match = re.search(r"row with column values \(([^)]+)\) already exists", str(error))
-                                if match:
-                                    duplicate_values = match.group(1)
-                                    print(f"Ignoré: Enregistrement dupliqué dans {table_name} avec {duplicate_values}")
-                                else:
-                                    print(f"Ignoré: Enregistrement dupliqué dans {table_name}")
-                            elif table_duplicate_count == 4:
-                                print(f"D'autres doublons dans {table_name} seront ignorés silencieusement...")
-                        elif error.code == 955:  # ORA-00955: name is already used by an existing object
-                            print(f"Ignoré: Objet existe déjà (probablement index ou contrainte)")
-                        else:
-                            print(f"Erreur Oracle lors de l'insertion dans {table_name} ({error.code}): {error.message}")
-                            if error.code == 1400:  # NULL non autorisé
-                                try:
-                                    # Remplacer tous les NULL par SYSDATE dans les colonnes de date
-                                    stmt = re.sub(r"(pubdate|hire_date|ord_date)([^,\)]*),\s*NULL", 
-                                                r"\1\2, SYSDATE", stmt, flags=re.IGNORECASE)
-                                    cursor.execute(stmt)
-                                    table_success_count += 1
-                                    insert_success_count += 1
-                                except Exception as e2:
-                                    print(f"Échec de la correction: {str(e2)}")
-                    except Exception as e:
-                        print(f"Erreur non-Oracle lors de l'insertion dans {table_name}: {str(e)}")
-                
-                # Afficher un résumé pour cette table
-                if table_duplicate_count > 0:
-                    print(f"Résumé {table_name}: {table_success_count} insertion(s) réussie(s), {table_duplicate_count} doublon(s) ignoré(s)")
+        # Rendre inutilisables les index non uniques des tables à charger : ils sont
+        # reconstruits une seule fois après les insertions au lieu d'être maintenus ligne à ligne
+        loaded_tables = {name for name in table_order if name in inserts_by_table and name in tables_created}
+        unusable_indexes = []
+        if loaded_tables:
+            try:
+                cursor.execute("ALTER SESSION SET skip_unusable_indexes = TRUE")
+                cursor.execute(_NONUNIQUE_INDEXES_SQL)
+                for index_name, index_table in cursor.fetchall():
+                    if index_table in loaded_tables:
+                        cursor.execute(f"ALTER INDEX {index_name} UNUSABLE")
+                        unusable_indexes.append(index_name)
+            except oracledb.DatabaseError as e:
+                print(f"Avertissement: Impossible de désactiver les index avant le chargement: {str(e)}")
+        
+        # Insérer les données des tables en parallèle, chacune sur sa propre connexion du pool ;
+        # la connexion principale occupe déjà une place du pool
+        pool = _get_user_pool(new_user_config)
+        tables_to_load = [name for name in table_order if name in loaded_tables]
+        with ThreadPoolExecutor(max_workers=_POOL_MAX_SIZE - 1) as executor:
+            results = executor.map(
+                lambda name: _load_table_inserts(pool, name, inserts_by_table[name]),
+                tables_to_load
+            )
+            for table_success_count, table_duplicate_count, messages in results:
+                for message in messages:
+                    print(message)
+                insert_success_count += table_success_count
+                duplicate_count += table_duplicate_count
+        
+        # Reconstruire les index rendus inutilisables
+        for index_name in unusable_indexes:
+            try:
+                cursor.execute(f"ALTER INDEX {index_name} REBUILD")
+            except oracledb.DatabaseError as e:
+                print(f"Avertissement: Échec de la reconstruction de l'index {index_name}: {str(e)}")
         
         # Affichage d'un message récapitulatif pour les opérations d'insertion
         print(f"\nRésumé des insertions: {insert_success_count} réussie(s), {duplicate_count} doublon(s) ignoré(s)")
@@ -651,31 +1043,19 @@ def execute_sql_file(new_user_config, sql_file_path, drop_tables=False):
         other_execute_count = 0
         other_error_count = 0
         
-        # Filtrer les autres instructions pour éviter les erreurs connues
-        filtered_other_statements = []
+        # Les instructions sont déjà nettoyées et non vides : le découpage ignore les
+        # points-virgules entre quotes et les retire en fin d'instruction
         for stmt in other_statements:
-            # Éliminer les instructions vides ou mal formatées
-            if not stmt.strip() or stmt.strip() == ';':
+            # Ignorer la création d'un index qui existe déjà (avant ou plus tôt dans le script)
+            index_match = _RE_CREATE_INDEX.match(stmt)
+            index_name = index_match.group(1).upper() if index_match else None
+            if index_name in oracle_objects:
                 continue
-                
-            # Supprimer les points-virgules mal placés
-            stmt = re.sub(r'\);+', ')', stmt)
-            
-            # Pour les instructions CREATE INDEX, vérifier si l'index existe déjà
-            if stmt.upper().startswith('CREATE INDEX'):
-                index_match = re.search(r'CREATE\s+INDEX\s+(\w+)', stmt, re.IGNORECASE)
-                if index_match:
-                    index_name = index_match.group(1).upper()
-                    if index_name in oracle_objects:
-                        continue  # Ignorer la création d'index si l'index existe déjà
-            
-            filtered_other_statements.append(stmt)
-        
-        # Exécuter les instructions filtrées
-        for stmt in filtered_other_statements:
             try:
                 cursor.execute(stmt)
                 other_execute_count += 1
+                if index_name:
+                    oracle_objects.add(index_name)
             except oracledb.DatabaseError as e:
                 error, = e.args
                 other_error_count += 1
@@ -694,19 +1074,15 @@ def execute_sql_file(new_user_config, sql_file_path, drop_tables=False):
         # Réactiver les contraintes
         print("\nRéactivation des contraintes...")
         try:
-            cursor.execute("""
-                BEGIN
-                    FOR c IN (SELECT constraint_name, table_name FROM user_constraints WHERE constraint_type = 'R')
-                    LOOP
-                        BEGIN
-                            EXECUTE IMMEDIATE 'ALTER TABLE ' || c.table_name || ' ENABLE CONSTRAINT ' || c.constraint_name;
-                        EXCEPTION
-                            WHEN OTHERS THEN NULL;
-                        END;
-                    END LOOP;
-                END;
-            """)
-            print("Contraintes de clé étrangère réactivées")
+            # Seules les contraintes désactivées plus haut sont à réactiver
+            enable_errors = _set_constraints(conn, fk_constraints, "ENABLE") if fk_constraints else []
+            
+            if enable_errors:
+                print(f"Contraintes de clé étrangère réactivées avec {len(enable_errors)} échec(s):")
+                for enable_error in enable_errors:
+                    print(f"  - {enable_error}")
+            else:
+                print("Contraintes de clé étrangère réactivées")
         except Exception as e:
             print(f"Avertissement: Impossible de réactiver automatiquement les contraintes: {str(e)}")
         
@@ -717,11 +1093,21 @@ def execute_sql_file(new_user_config, sql_file_path, drop_tables=False):
         print("Erreur générale lors de l'exécution du fichier SQL:", e)
         raise
     finally:
-        if 'cursor' in locals():
+        if cursor is not None:
             cursor.close()
-        if 'conn' in locals():
+        if conn is not None:
             conn.close()
 
+def _open_sqlite_readonly(sqlite_db_path):
+    """
+    Ouvre la base SQLite source en lecture seule. Pas de immutable=1 : le fichier -wal
+    serait ignoré et les transactions non reportées d'une base en mode WAL perdues.
+    """
+    uri = Path(sqlite_db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    conn.executescript(_SQLITE_READONLY_PRAGMAS)
+    return conn
+
 def extract_sqlite_data(sqlite_db_path):
     """
     Extrait le schéma et les données d'une base SQLite en gérant correctement les BLOB
@@ -733,138 +1119,139 @@ def extract_sqlite_data(sqlite_db_path):
     Returns:
         str: Script SQL compatible avec la syntaxe Oracle
     """
-    conn = sqlite3.connect(sqlite_db_path)
-    conn.text_factory = bytes  # Pour éviter les erreurs de décodage UTF-8
-    cursor = conn.cursor()
-    
-    # Récupérer la liste des tables
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-    tables = cursor.fetchall()
-    
-    # Génération du script SQL
-    sql_script = []
-    
-    for table in tables:
-        table_name = table[0].decode('utf-8', errors='replace')
+    # La connexion est fermée même si l'extraction échoue
+    with closing(_open_sqlite_readonly(sqlite_db_path)) as conn:
+        conn.text_factory = bytes  # Pour éviter les erreurs de décodage UTF-8
+        cursor = conn.cursor()
         
-        # Récupérer les informations de schéma pour cette table
-        cursor.execute(f"PRAGMA table_info({table_name});")
-        columns = cursor.fetchall()
+        # Récupérer les colonnes et les clés étrangères de toutes les tables en deux requêtes
+        # plutôt que deux requêtes par table
+        columns_by_table = {}
+        for row in cursor.execute(_SQLITE_COLUMNS_SQL):
+            columns_by_table.setdefault(row[0], []).append(row[1:])
+        fks_by_table = {}
+        for row in cursor.execute(_SQLITE_FOREIGN_KEYS_SQL):
+            fks_by_table.setdefault(row[0], []).append(row[1:])
         
-        # Identifier les colonnes de type date et binaires
-        date_columns = []
-        blob_columns = []
-        for i, col in enumerate(columns):
-            col_type = col[2].decode('utf-8', errors='replace').upper()
-            col_name = col[1].decode('utf-8', errors='replace')
-            if col_type in ('DATE', 'DATETIME', 'TIMESTAMP') or 'DATE' in col_name.upper() or 'TIME' in col_name.upper():
-                date_columns.append(i)
-            if col_type in ('BLOB', 'LONGBLOB'):
-                blob_columns.append(i)
+        # Génération du script SQL
+        sql_script = []
         
-        # Construire la requête CREATE TABLE
-        create_table = f"CREATE TABLE {table_name} (\n"
-        column_defs = []
-        for col in columns:
-            col_name = col[1].decode('utf-8', errors='replace')
-            col_type = col[2].decode('utf-8', errors='replace').upper()
-            
-            # Corriger les types de données non supportés par Oracle
-            if col_type in ('LONGBLOB', 'BLOB'):
-                col_type = 'BLOB'
-            elif col_type in ('LONGTEXT', 'TEXT', 'MEDIUMTEXT'):
-                col_type = 'CLOB'
-            elif col_type == 'DATETIME':
-                col_type = 'TIMESTAMP'
-            elif 'CHAR(' in col_type and int(col_type.split('(')[1].split(')')[0]) > 2000:
-                # Oracle a une limite de 4000 bytes pour VARCHAR2
-                col_type = 'CLOB'
-            
-            nullable = "NOT NULL" if col[3] else ""
-            pk = "PRIMARY KEY" if col[5] else ""
-            
-            column_defs.append(f"  {col_name} {col_type} {nullable} {pk}".strip())
+        for raw_table_name, columns in columns_by_table.items():
+            table_name = raw_table_name.decode('utf-8', errors='replace')
+            quoted_table = '"' + table_name.replace('"', '""') + '"'
         
-        create_table += ",\n".join(column_defs)
+            # Identifier les colonnes de type date et binaires
+            date_columns = []
+            blob_columns = []
+            for i, col in enumerate(columns):
+                col_type = col[2].decode('utf-8', errors='replace').upper()
+                col_name = col[1].decode('utf-8', errors='replace')
+                if col_type in ('DATE', 'DATETIME', 'TIMESTAMP') or 'DATE' in col_name.upper() or 'TIME' in col_name.upper():
+                    date_columns.append(i)
+                if col_type in ('BLOB', 'LONGBLOB'):
+                    blob_columns.append(i)
         
-        # Récupérer les contraintes de clé étrangère
-        cursor.execute(f"PRAGMA foreign_key_list({table_name});")
-        fks = cursor.fetchall()
+            # Construire la requête CREATE TABLE
+            create_table = f"CREATE TABLE {table_name} (\n"
+            column_defs = []
+            for col in columns:
+                col_name = col[1].decode('utf-8', errors='replace')
+                col_type = col[2].decode('utf-8', errors='replace').upper()
         
-        if fks:
-            for fk in fks:
-                ref_table = fk[2].decode('utf-8', errors='replace')
-                from_col = fk[3].decode('utf-8', errors='replace')
-                to_col = fk[4].decode('utf-8', errors='replace')
-                constraint_name = f"fk_{table_name}_{from_col}"
-                
-                fk_constraint = f",\n  CONSTRAINT {constraint_name} FOREIGN KEY ({from_col}) REFERENCES {ref_table} ({to_col})"
-                create_table += fk_constraint
+                # Corriger les types de données non supportés par Oracle
+                if col_type in ('LONGBLOB', 'BLOB'):
+                    col_type = 'BLOB'
+                elif col_type in ('LONGTEXT', 'TEXT', 'MEDIUMTEXT'):
+                    col_type = 'CLOB'
+                elif col_type == 'DATETIME':
+                    col_type = 'TIMESTAMP'
+                elif 'CHAR(' in col_type and int(col_type.split('(')[1].split(')')[0]) > 2000:
+                    # Oracle a une limite de 4000 bytes pour VARCHAR2
+                    col_type = 'CLOB'
         
-        create_table += "\n);"
-        sql_script.append(create_table)
+                nullable = "NOT NULL" if col[3] else ""
+                pk = "PRIMARY KEY" if col[5] else ""
         
-        # Si la table contient des données binaires, on saute la génération des INSERT
-        # Ces données seront traitées par un appel à d'autres fonctions
-        if table_name.upper() == 'PUB_INFO':
-            sql_script.append(f"-- Table {table_name} contient des BLOB/CLOB, les INSERTs seront générés séparément")
-            continue
+                column_defs.append(f"  {col_name} {col_type} {nullable} {pk}".strip())
         
-        # Récupérer et générer les INSERT pour cette table
-        try:
-            cursor.execute(f"SELECT * FROM {table_name};")
-            rows = cursor.fetchall()
-            column_names = [col[1].decode('utf-8', errors='replace') for col in columns]
-            
-            # Générer les INSERT de manière sécurisée
-            for row in rows:
-                # Préparer les valeurs avec gestion des types
-                values = []
-                for i, val in enumerate(row):
-                    if val is None:
-                        values.append("NULL")
-                    elif isinstance(val, bytes):
-                        # Si c'est une colonne BLOB, éviter de générer un INSERT
-                        if i in blob_columns:
-                            values.append("EMPTY_BLOB()")
+            create_table += ",\n".join(column_defs)
+        
+            # Récupérer les contraintes de clé étrangère
+            fks = fks_by_table.get(raw_table_name)
+        
+            if fks:
+                for fk in fks:
+                    ref_table = fk[2].decode('utf-8', errors='replace')
+                    from_col = fk[3].decode('utf-8', errors='replace')
+                    to_col = fk[4].decode('utf-8', errors='replace')
+                    constraint_name = f"fk_{table_name}_{from_col}"
+        
+                    fk_constraint = f",\n  CONSTRAINT {constraint_name} FOREIGN KEY ({from_col}) REFERENCES {ref_table} ({to_col})"
+                    create_table += fk_constraint
+        
+            create_table += "\n);"
+            sql_script.append(create_table)
+        
+            # Si la table contient des données binaires, on saute la génération des INSERT
+            # Ces données seront traitées par un appel à d'autres fonctions
+            if table_name.upper() == 'PUB_INFO':
+                sql_script.append(f"-- Table {table_name} contient des BLOB/CLOB, les INSERTs seront générés séparément")
+                continue
+        
+            # Récupérer et générer les INSERT pour cette table
+            try:
+                cursor.execute(f"SELECT * FROM {quoted_table}")
+                rows = cursor.fetchall()
+                column_names = [col[1].decode('utf-8', errors='replace') for col in columns]
+        
+                # Générer les INSERT de manière sécurisée
+                for row in rows:
+                    # Préparer les valeurs avec gestion des types
+                    values = []
+                    for i, val in enumerate(row):
+                        if val is None:
+                            values.append("NULL")
+                        elif isinstance(val, bytes):
+                            # Si c'est une colonne BLOB, éviter de générer un INSERT
+                            if i in blob_columns:
+                                values.append("EMPTY_BLOB()")
+                            else:
+                                # Essayer de décoder en UTF-8
+                                try:
+                                    val_str = val.decode('utf-8')
+                                    # Si la valeur est trop longue, tronquer
+                                    if len(val_str) > 1000:
+                                        val_str = val_str[:1000] + "..."
+                                    escaped_val = val_str.replace("'", "''")
+                                    values.append(f"'{escaped_val}'")
+                                except UnicodeDecodeError:
+                                    # Si ce n'est pas de l'UTF-8, utiliser EMPTY_BLOB()
+                                    values.append("EMPTY_BLOB()")
+                        elif isinstance(val, (int, float)):
+                            values.append(str(val))
                         else:
-                            # Essayer de décoder en UTF-8
-                            try:
-                                val_str = val.decode('utf-8')
-                                # Si la valeur est trop longue, tronquer
+                            # Si c'est une colonne de date
+                            if i in date_columns:
+                                # Convertir le format de date
+                                date_val = convert_date_format(str(val))
+                                values.append(date_val)
+                            else:
+                                # Chaîne de caractères (déjà décodée)
+                                val_str = str(val)
+                                # Tronquer si trop long pour Oracle
                                 if len(val_str) > 1000:
                                     val_str = val_str[:1000] + "..."
                                 escaped_val = val_str.replace("'", "''")
                                 values.append(f"'{escaped_val}'")
-                            except UnicodeDecodeError:
-                                # Si ce n'est pas de l'UTF-8, utiliser EMPTY_BLOB()
-                                values.append("EMPTY_BLOB()")
-                    elif isinstance(val, (int, float)):
-                        values.append(str(val))
-                    else:
-                        # Si c'est une colonne de date
-                        if i in date_columns:
-                            # Convertir le format de date
-                            date_val = convert_date_format(str(val))
-                            values.append(date_val)
-                        else:
-                            # Chaîne de caractères (déjà décodée)
-                            val_str = str(val)
-                            # Tronquer si trop long pour Oracle
-                            if len(val_str) > 1000:
-                                val_str = val_str[:1000] + "..."
-                            escaped_val = val_str.replace("'", "''")
-                            values.append(f"'{escaped_val}'")
-                
-                # Construire la requête INSERT
-                insert_stmt = f"INSERT INTO {table_name} ({', '.join(column_names)}) VALUES ({', '.join(values)});"
-                sql_script.append(insert_stmt)
-        except Exception as e:
-            print(f"Erreur lors de la génération des INSERT pour la table {table_name}: {str(e)}")
-            # Continuer avec les autres tables en cas d'erreur
-    
-    conn.close()
-    return "\n\n".join(sql_script)
+        
+                    # Construire la requête INSERT
+                    insert_stmt = f"INSERT INTO {table_name} ({', '.join(column_names)}) VALUES ({', '.join(values)});"
+                    sql_script.append(insert_stmt)
+            except Exception as e:
+                print(f"Erreur lors de la génération des INSERT pour la table {table_name}: {str(e)}")
+                # Continuer avec les autres tables en cas d'erreur
+        
+        return "\n\n".join(sql_script)
 
 def convert_date_format(date_str):
     """
@@ -989,28 +1376,13 @@ def main():
         print(f"Error reading SQLite database file: {str(e)}")
         print("Trying alternative method...")
         try:
-            # Méthode de secours en cas d'échec
-            conn = sqlite3.connect(args.sqlite_db)
-            # Ignorer les tables contenant des données binaires
-            cursor = conn.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-            tables = cursor.fetchall()
-            
-            all_sql = []
-            for table in tables:
-                table_name = table[0]
-                try:
-                    # Tester si la table contient des données binaires
-                    cursor.execute(f"SELECT * FROM {table_name} LIMIT 1;")
-                    cursor.fetchall()
-                    # Si ça fonctionne, exporter cette table
-                    table_sql = "\n".join(conn.iterdump(table_name=table_name))
-                    all_sql.append(table_sql)
-                except:
-                    print(f"Skipping table {table_name} due to binary data")
-            
-            sqlite_dump = "\n".join(all_sql)
-            conn.close()
+            # Méthode de secours en cas d'échec : un seul parcours de la base avec iterdump(),
+            # qui exporte aussi les BLOB sous forme de littéraux X'...'
+            conn = _open_sqlite_readonly(args.sqlite_db)
+            try:
+                sqlite_sql = "\n".join(conn.iterdump())
+            finally:
+                conn.close()
         except Exception as e:
             print(f"Alternative method also failed: {str(e)}")
             sys.exit(1)
@@ -1039,11 +1411,7 @@ def main():
     if args.force_recreate:
         try:
             # Se connecter en tant qu'administrateur pour supprimer l'utilisateur existant
-            admin_conn = oracledb.connect(
-                user=ORACLE_CONFIG["user"],
-                password=ORACLE_CONFIG["password"],
-                dsn=ORACLE_CONFIG["dsn"]
-            )
+            admin_conn = _get_admin_pool(ORACLE_CONFIG).acquire()
             cursor = admin_conn.cursor()
             try:
                 # Afficher un message et supprimer l'utilisateur
@@ -1063,10 +1431,8 @@ def main():
         except Exception as e:
             print(f"Warning during user recreation: {str(e)}. Continuing...")
 
-    oracle_sql = convert_sqlite_dump(sqlite_sql)
     try:
-        with open(output_file, 'w') as f:
-            f.write(oracle_sql)
+        write_converted_sql(sqlite_sql, output_file)
         print(f"Converted Oracle SQL saved to {output_file}")
     except Exception as e:
         print("Error writing output file:", e)
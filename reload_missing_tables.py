@@ -7,14 +7,18 @@ Note: Cette fonctionnalité est également disponible via la commande principale
 """
 
 import argparse
-import os
+import sqlite3
 import sys
 import logging
 from sqlite3_to_oracle import logger, ORACLE_CONFIG
 from sqlite3_to_oracle.config import load_oracle_config
-from sqlite3_to_oracle.data_loader import load_performance_table, reload_missing_tables
+from sqlite3_to_oracle.data_loader import is_performance_table, load_performance_table, reload_missing_tables
+from sqlite3_to_oracle.oracle_utils import get_oracle_pool
+from sqlite3_to_oracle.sqlite_utils import open_sqlite_readonly
+from sqlite3_to_oracle.bulk_loader import load_table_sqlldr, sqlldr_available
 
-def parse_args():
+def _build_parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments de ligne de commande."""
     parser = argparse.ArgumentParser(description="Recharger les tables manquantes après une validation")
     parser.add_argument("--sqlite-path", required=True, help="Chemin vers le fichier SQLite")
     parser.add_argument("--table-name", help="Nom spécifique de la table à recharger (optionnel)")
@@ -24,20 +28,28 @@ def parse_args():
     parser.add_argument("--oracle-user", help="Nom d'utilisateur Oracle")
     parser.add_argument("--oracle-password", help="Mot de passe Oracle")
     parser.add_argument("--oracle-dsn", help="DSN Oracle (format: host:port/service)")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Nombre de tables rechargées en parallèle (défaut: 1)")
+    parser.add_argument("--bulk", action="store_true", help="Charger via SQL*Loader en chemin direct si sqlldr est disponible")
+    parser.add_argument("--nologging", action="store_true", help="Charger les tables volumineuses en chemin direct sans redo (sauvegarde recommandée ensuite)")
     parser.add_argument("--use-varchar", action="store_true", help="Utiliser VARCHAR2 pour les colonnes décimales problématiques")
     parser.add_argument("--verbose", "-v", action="store_true", help="Afficher les messages de débogage")
-    return parser.parse_args()
+    return parser
+
+# Construit une seule fois au chargement du module
+_PARSER = _build_parser()
+
+def parse_args():
+    return _PARSER.parse_args()
 
 def main():
     args = parse_args()
     
     # Afficher le message d'information sur l'option --retry
-    logging.info("Note: Cette fonctionnalité est également disponible via la commande principale:")
-    logging.info("    sqlite3-to-oracle --sqlite_db <db_path> --retry [--use-varchar]")
+    logger.info("Note: Cette fonctionnalité est également disponible via la commande principale:")
+    logger.info("    sqlite3-to-oracle --sqlite_db <db_path> --retry [--use-varchar]")
     
-    # Configurer le niveau de log
-    log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(level=log_level)
+    # Configurer le niveau de log (le logger du package a déjà son handler)
+    logger.setLevel(logging.DEBUG if args.verbose else logging.INFO)
     
     # Charger la configuration Oracle
     global ORACLE_CONFIG
@@ -51,67 +63,95 @@ def main():
         env_file=args.env_file
     )
     
-    if not all(key in ORACLE_CONFIG and ORACLE_CONFIG[key] for key in ("user", "password", "dsn")):
-        logging.error("Configuration Oracle incomplète")
-        logging.info("Utilisez --oracle-user, --oracle-password, et --oracle-dsn, ou un fichier de configuration")
+    user, password, dsn = (ORACLE_CONFIG.get(key) for key in ("user", "password", "dsn"))
+    if not (user and password and dsn):
+        logger.error("Configuration Oracle incomplète")
+        logger.info("Utilisez --oracle-user, --oracle-password, et --oracle-dsn, ou un fichier de configuration")
         sys.exit(1)
     
-    logging.info(f"Utilisation de Oracle: {ORACLE_CONFIG['user']}@{ORACLE_CONFIG['dsn']}")
+    logger.info("Utilisation de Oracle: %s@%s", user, dsn)
+    
+    # Vérifier le fichier SQLite en l'ouvrant directement (mode lecture seule)
+    try:
+        open_sqlite_readonly(args.sqlite_path).close()
+    except sqlite3.DatabaseError as e:
+        # Fichier absent, illisible ou qui n'est pas une base SQLite
+        logger.error("Impossible d'ouvrir le fichier SQLite %s: %s", args.sqlite_path, e)
+        sys.exit(1)
     
-    # Vérifier le fichier SQLite
-    if not os.path.exists(args.sqlite_path):
-        logging.error(f"Le fichier SQLite {args.sqlite_path} n'existe pas")
+    # Pool de sessions partagé par tous les chargements (évite une connexion par table)
+    try:
+        pool = get_oracle_pool(ORACLE_CONFIG)
+    except Exception as e:
+        logger.error("Impossible de se connecter à Oracle: %s", e)
         sys.exit(1)
     
+    # Chargement massif : SQL*Loader a besoin des identifiants, pas du pool
+    bulk_config = None
+    if args.bulk:
+        if sqlldr_available():
+            bulk_config = ORACLE_CONFIG
+        else:
+            logger.warning("sqlldr ou sqlite3 introuvable, utilisation du chargement standard")
+    
     # Si une table spécifique est fournie, la recharger directement
     if args.table_name:
-        logging.info(f"Rechargement de la table spécifique: {args.table_name}")
+        logger.info("Rechargement de la table spécifique: %s", args.table_name)
         
-        if "ON_TIME" in args.table_name.upper():
+        bulk_status = load_table_sqlldr(bulk_config, args.sqlite_path, args.table_name) if bulk_config else False
+        
+        if bulk_status is None:
+            # Des lignes partielles restent en base : le chargeur Python les dupliquerait
+            success = False
+        elif bulk_status:
+            success = True
+        elif is_performance_table(args.table_name):
             # Utiliser VARCHAR2 pour les colonnes décimales si demandé
-            success = load_performance_table(ORACLE_CONFIG, args.sqlite_path, args.table_name, use_varchar_for_decimals=args.use_varchar)
+            success = load_performance_table(pool, args.sqlite_path, args.table_name, use_varchar_for_decimals=args.use_varchar, nologging=args.nologging)
             
             if args.use_varchar:
-                logging.info("Utilisation de VARCHAR2 pour stocker les valeurs numériques problématiques")
+                logger.info("Utilisation de VARCHAR2 pour stocker les valeurs numériques problématiques")
         else:
             from sqlite3_to_oracle.data_loader import load_table_alternative
-            success = load_table_alternative(ORACLE_CONFIG, args.sqlite_path, args.table_name)
+            success = load_table_alternative(pool, args.sqlite_path, args.table_name)
         
         if success:
-            logging.info(f"Rechargement réussi pour {args.table_name}")
+            logger.info("Rechargement réussi pour %s", args.table_name)
         else:
-            logging.error(f"Échec du rechargement pour {args.table_name}")
+            logger.error("Échec du rechargement pour %s", args.table_name)
         
         sys.exit(0 if success else 1)
     
     # Si un rapport est fourni, l'analyser pour identifier les tables manquantes
     if args.report_file:
-        if not os.path.exists(args.report_file):
-            logging.error(f"Le fichier de rapport {args.report_file} n'existe pas")
+        try:
+            report = open(args.report_file, 'r')
+        except FileNotFoundError:
+            logger.error("Le fichier de rapport %s n'existe pas", args.report_file)
             sys.exit(1)
         
-        with open(args.report_file, 'r') as f:
-            report_content = f.read()
-        
-        results = reload_missing_tables(report_content, ORACLE_CONFIG, args.sqlite_path)
+        # Le rapport est analysé ligne par ligne, sans être chargé en mémoire
+        with report as f:
+            results = reload_missing_tables(f, pool, args.sqlite_path, jobs=args.jobs, bulk_config=bulk_config, nologging=args.nologging)
         
         if results:
             successful = sum(1 for success in results.values() if success)
-            logging.info(f"Rechargement terminé: {successful}/{len(results)} tables rechargées avec succès")
+            logger.info("Rechargement terminé: %d/%d tables rechargées avec succès", successful, len(results))
             
+            log_successes = logger.isEnabledFor(logging.INFO)
             for table, success in results.items():
-                if success:
-                    logging.info(f"✓ {table}: Rechargement réussi")
-                else:
-                    logging.error(f"✗ {table}: Échec du rechargement")
+                if not success:
+                    logger.error("✗ %s: Échec du rechargement", table)
+                elif log_successes:
+                    logger.info("✓ %s: Rechargement réussi", table)
             
             sys.exit(0 if successful == len(results) else 1)
         else:
-            logging.info("Aucune table n'a été rechargée")
+            logger.info("Aucune table n'a été rechargée")
             sys.exit(0)
     
     # Si ni table spécifique ni rapport n'est fourni
-    logging.error("Vous devez spécifier soit une table spécifique (--table-name), soit un fichier de rapport (--report-file)")
+    logger.error("Vous devez spécifier soit une table spécifique (--table-name), soit un fichier de rapport (--report-file)")
     sys.exit(1)
 
 if __name__ == "__main__":
@@ -5,6 +5,7 @@ Module pour convertir des bases de données SQLite en Oracle.
 import os
 import logging
 import json
+import importlib
 from typing import Dict, Any
 
 # Configuration initiale du logger
@@ -25,38 +26,50 @@ ORACLE_CONFIG = {
 home_dir = os.path.expanduser("~")
 config_file = os.path.join(home_dir, ".oracle_config.json")
 
-if os.path.exists(config_file):
-    try:
-        with open(config_file, 'r') as f:
-            user_config = json.load(f)
-            # Mettre à jour uniquement les clés existantes
-            for key in ORACLE_CONFIG:
-                if key in user_config and user_config[key]:
-                    ORACLE_CONFIG[key] = user_config[key]
-        logger.debug(f"Configuration Oracle chargée depuis {config_file}")
-    except Exception as e:
-        logger.debug(f"Erreur lors du chargement de la configuration: {e}")
-
-# Exposer les modules nouvellement créés
-from .data_loader import (
-    extract_table_structure,
-    load_table_alternative,
-    load_failing_tables,
-    reload_missing_tables
-)
-
-from .lookup_loader import (
-    create_simplified_lookup_table,
-    parse_and_load_lookup_data
-)
-
-from .performance_loader import load_performance_table
-
-from .table_utils import (
-    process_large_table,
-    diagnose_and_fix_ora_00922,
-    sanitize_create_table_statement
-)
+try:
+    # Une seule lecture en octets puis un décodage JSON d'un bloc
+    with open(config_file, 'rb') as f:
+        user_config = json.loads(f.read())
+    # Mettre à jour uniquement les clés existantes
+    for key in ORACLE_CONFIG:
+        if key in user_config and user_config[key]:
+            ORACLE_CONFIG[key] = user_config[key]
+    logger.debug(f"Configuration Oracle chargée depuis {config_file}")
+except FileNotFoundError:
+    pass
+except Exception as e:
+    logger.debug(f"Erreur lors du chargement de la configuration: {e}")
+
+# Exposer les modules nouvellement créés, importés à la première utilisation (PEP 562)
+# pour ne pas charger oracledb lors d'un simple --help
+_LAZY = {
+    "extract_table_structure": "data_loader",
+    "load_table_alternative": "data_loader",
+    "load_failing_tables": "data_loader",
+    "reload_missing_tables": "data_loader",
+    "create_simplified_lookup_table": "lookup_loader",
+    "parse_and_load_lookup_data": "lookup_loader",
+    "load_performance_table": "performance_loader",
+    "get_connection": "oracle_utils",
+    "get_oracle_pool": "oracle_utils",
+    "process_large_table": "table_utils",
+    "diagnose_and_fix_ora_00922": "table_utils",
+    "sanitize_create_table_statement": "table_utils",
+}
+
+__all__ = ["logger", "ORACLE_CONFIG", "__version__", *_LAZY]
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module("." + _LAZY[name], __name__)
+    value = getattr(module, name)
+    # Mémoriser pour que les accès suivants ne repassent pas par __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 # Version du package
 __version__ = "1.0.0"
\ No newline at end of file
@@ -0,0 +1,294 @@
+"""
+Chargement massif d'une table SQLite via SQL*Loader en mode direct.
+
+Les données ne transitent pas par Python : le client sqlite3 écrit la table au
+format CSV dans un tube nommé que sqlldr lit en parallèle (DIRECT=TRUE).
+"""
+
+import os
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+import oracledb
+
+from . import logger
+from .sqlite_utils import open_sqlite_readonly
+
+# Codes de retour de sqlldr : 0 = succès, 2 = succès avec lignes rejetées
+_SQLLDR_EX_OK = 0
+_SQLLDR_EX_WARN = 2
+
+def sqlldr_available() -> bool:
+    """
+    Indique si le chargement massif est possible sur cette machine.
+
+    Returns:
+        True si sqlldr et le client sqlite3 sont dans le PATH et que les tubes nommés sont supportés
+    """
+    return (
+        hasattr(os, "mkfifo")
+        and shutil.which("sqlldr") is not None
+        and shutil.which("sqlite3") is not None
+    )
+
+def _get_load_columns(oracle_config: Dict[str, str], sqlite_path: str, table_name: str) -> List[Tuple[str, str]]:
+    """
+    Détermine les colonnes à charger, présentes à la fois dans SQLite et dans Oracle.
+
+    Args:
+        oracle_config: Configuration Oracle
+        sqlite_path: Chemin vers le fichier SQLite
+        table_name: Nom de la table
+
+    Returns:
+        Liste de tuples (nom de colonne SQLite, type Oracle), dans l'ordre de SQLite
+    """
+    with oracledb.connect(
+        user=oracle_config["user"],
+        password=oracle_config["password"],
+        dsn=oracle_config["dsn"]
+    ) as oracle_conn:
+        cursor = oracle_conn.cursor()
+        cursor.execute(
+            "SELECT column_name, data_type FROM user_tab_columns WHERE table_name = :1",
+            [table_name.upper()]
+        )
+        oracle_types = dict(cursor.fetchall())
+
+    sqlite_conn = open_sqlite_readonly(sqlite_path)
+    try:
+        sqlite_columns = [row[0] for row in sqlite_conn.execute(
+            "SELECT name FROM pragma_table_info(?) ORDER BY cid", (table_name,)
+        )]
+    finally:
+        sqlite_conn.close()
+
+    return [(col, oracle_types[col.upper()]) for col in sqlite_columns if col.upper() in oracle_types]
+
+def _oracle_table_is_empty(oracle_config: Dict[str, str], table_name: str) -> bool:
+    """
+    Vérifie que la table Oracle ne contient encore aucune ligne.
+
+    Args:
+        oracle_config: Configuration Oracle
+        table_name: Nom de la table
+
+    Returns:
+        True si la table est vide
+    """
+    with oracledb.connect(
+        user=oracle_config["user"],
+        password=oracle_config["password"],
+        dsn=oracle_config["dsn"]
+    ) as oracle_conn:
+        cursor = oracle_conn.cursor()
+        cursor.execute(f"SELECT 1 FROM {table_name.upper()} WHERE ROWNUM = 1")
+        return cursor.fetchone() is None
+
+def _discard_partial_load(oracle_config: Dict[str, str], table_name: str) -> bool:
+    """
+    Vide la table après un échec de sqlldr.
+
+    Avec ROWS=n, le chemin direct sauvegarde les données tous les n enregistrements :
+    un échec peut donc laisser des lignes en base, que le chargeur Python dupliquerait.
+    La table étant vide avant le chargement, un TRUNCATE suffit à revenir à l'état initial.
+
+    Args:
+        oracle_config: Configuration Oracle
+        table_name: Nom de la table
+
+    Returns:
+        True si la table a été vidée et que le chargeur Python peut prendre le relais
+    """
+    try:
+        with oracledb.connect(
+            user=oracle_config["user"],
+            password=oracle_config["password"],
+            dsn=oracle_config["dsn"]
+        ) as oracle_conn:
+            oracle_conn.cursor().execute(f"TRUNCATE TABLE {table_name.upper()}")
+        return True
+    except oracledb.Error as e:
+        logger.error(f"Impossible de vider {table_name} après l'échec de SQL*Loader: {str(e)}")
+        return False
+
+def _read_output(path: str) -> str:
+    """
+    Lit la sortie d'erreur d'un processus redirigée dans un fichier.
+
+    Args:
+        path: Chemin du fichier de sortie
+
+    Returns:
+        Contenu du fichier, ou une chaîne vide s'il est illisible
+    """
+    try:
+        with open(path, "r", errors="replace") as f:
+            return f.read().strip()
+    except OSError:
+        return ""
+
+def _build_control_file(table_name: str, data_file: str, columns: List[Tuple[str, str]]) -> str:
+    """
+    Génère le fichier de contrôle SQL*Loader pour la table.
+
+    Args:
+        table_name: Nom de la table Oracle
+        data_file: Fichier (ou tube nommé) contenant les données CSV
+        columns: Colonnes à charger avec leur type Oracle
+
+    Returns:
+        Contenu du fichier de contrôle
+    """
+    fields = []
+    for col, oracle_type in columns:
+        if oracle_type == "DATE" or oracle_type.startswith("TIMESTAMP"):
+            fields.append(f'  {col.upper()} DATE "YYYY-MM-DD HH24:MI:SS"')
+        else:
+            fields.append(f"  {col.upper()} CHAR(4000)")
+
+    return (
+        "LOAD DATA\n"
+        f"INFILE '{data_file}'\n"
+        "APPEND\n"
+        f"INTO TABLE {table_name.upper()}\n"
+        "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"'\n"
+        "TRAILING NULLCOLS\n"
+        "(\n" + ",\n".join(fields) + "\n)\n"
+    )
+
+def _wait_for_pipeline(exporter: subprocess.Popen, loader: subprocess.Popen) -> Tuple[int, int]:
+    """
+    Attend la fin des deux processus du tube, en arrêtant l'un si l'autre échoue.
+
+    Sans cela, un processus resterait bloqué indéfiniment à l'ouverture du tube nommé.
+
+    Args:
+        exporter: Processus sqlite3 qui écrit dans le tube
+        loader: Processus sqlldr qui lit le tube
+
+    Returns:
+        Tuple (code de retour de sqlite3, code de retour de sqlldr)
+    """
+    while loader.poll() is None:
+        if exporter.poll() not in (None, 0):
+            loader.kill()
+            break
+        time.sleep(0.2)
+
+    if exporter.poll() is None and loader.returncode not in (_SQLLDR_EX_OK, _SQLLDR_EX_WARN):
+        exporter.kill()
+
+    return exporter.wait(), loader.wait()
+
+def load_table_sqlldr(
+    oracle_config: Dict[str, str],
+    sqlite_path: str,
+    table_name: str,
+    rows_per_commit: int = 50000
+) -> Optional[bool]:
+    """
+    Charge une table SQLite dans une table Oracle existante avec SQL*Loader (chemin direct).
+
+    Seules les tables Oracle vides sont chargées ainsi, pour pouvoir annuler un chargement
+    partiel (voir _discard_partial_load).
+
+    Args:
+        oracle_config: Configuration Oracle (les identifiants sont transmis à sqlldr)
+        sqlite_path: Chemin vers le fichier SQLite
+        table_name: Nom de la table à charger
+        rows_per_commit: Nombre de lignes entre deux sauvegardes de données
+
+    Returns:
+        True si le chargement a réussi, False s'il faut utiliser le chargeur Python,
+        None si la table contient des lignes d'un chargement partiel qui n'ont pas pu être supprimées
+    """
+    if not sqlldr_available():
+        logger.debug("sqlldr ou sqlite3 introuvable, chargement massif impossible")
+        return False
+
+    try:
+        columns = _get_load_columns(oracle_config, sqlite_path, table_name)
+        is_empty = bool(columns) and _oracle_table_is_empty(oracle_config, table_name)
+    except (oracledb.Error, sqlite3.Error) as e:
+        logger.warning(f"Impossible de préparer le chargement massif de {table_name}: {str(e)}")
+        return False
+
+    if not columns:
+        logger.debug(f"La table {table_name} n'existe pas dans Oracle, chargement massif impossible")
+        return False
+
+    if not is_empty:
+        logger.debug(f"La table {table_name} contient déjà des lignes, chargement massif ignoré")
+        return False
+
+    select_sql = "SELECT {} FROM \"{}\";".format(
+        ", ".join('"{}"'.format(col.replace('"', '""')) for col, _ in columns),
+        table_name.replace('"', '""')
+    )
+
+    with tempfile.TemporaryDirectory(prefix="sqlldr_") as work_dir:
+        fifo_path = os.path.join(work_dir, f"{table_name}.csv")
+        control_path = os.path.join(work_dir, f"{table_name}.ctl")
+        parfile_path = os.path.join(work_dir, f"{table_name}.par")
+        log_path = os.path.join(work_dir, f"{table_name}.log")
+        bad_path = os.path.join(work_dir, f"{table_name}.bad")
+        # Sorties dans des fichiers : un tube non lu pendant l'attente pourrait bloquer les processus
+        loader_err_path = os.path.join(work_dir, f"{table_name}.sqlldr.err")
+        exporter_err_path = os.path.join(work_dir, f"{table_name}.sqlite3.err")
+
+        os.mkfifo(fifo_path)
+
+        with open(control_path, "w") as f:
+            f.write(_build_control_file(table_name, fifo_path, columns))
+
+        # Identifiants dans un fichier de paramètres privé plutôt que sur la ligne de commande
+        fd = os.open(parfile_path, os.O_WRONLY | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(
+                f"userid={oracle_config['user']}/{oracle_config['password']}@{oracle_config['dsn']}\n"
+                f"control={control_path}\n"
+                f"log={log_path}\n"
+                f"bad={bad_path}\n"
+                "direct=true\n"
+                "streamsize=10485760\n"
+                "readsize=10485760\n"
+                f"rows={rows_per_commit}\n"
+                "errors=1000000\n"
+            )
+
+        logger.info(f"Chargement massif de {table_name} via SQL*Loader (chemin direct)")
+        start_time = time.time()
+
+        with open(loader_err_path, "wb") as loader_err, open(exporter_err_path, "wb") as exporter_err:
+            loader = subprocess.Popen(
+                ["sqlldr", f"parfile={parfile_path}", "silent=(header,feedback)"],
+                stdout=subprocess.DEVNULL,
+                stderr=loader_err
+            )
+            exporter = subprocess.Popen(
+                ["sqlite3", "-readonly", "-batch", "-csv", "-noheader",
+                 "-cmd", f".output {fifo_path}", sqlite_path, select_sql],
+                stdout=subprocess.DEVNULL,
+                stderr=exporter_err
+            )
+
+            export_code, load_code = _wait_for_pipeline(exporter, loader)
+
+        if export_code != 0 or load_code not in (_SQLLDR_EX_OK, _SQLLDR_EX_WARN):
+            if load_code not in (_SQLLDR_EX_OK, _SQLLDR_EX_WARN):
+                logger.warning(f"Échec de SQL*Loader pour {table_name} (code {load_code}): {_read_output(loader_err_path)}")
+            else:
+                logger.warning(f"Échec de l'export SQLite de {table_name}: {_read_output(exporter_err_path)}")
+            logger.debug(_read_output(log_path))
+            return False if _discard_partial_load(oracle_config, table_name) else None
+
+        if load_code == _SQLLDR_EX_WARN:
+            logger.warning(f"Certaines lignes de {table_name} ont été rejetées par SQL*Loader")
+
+        logger.info(f"Chargement massif de {table_name} terminé en {time.time() - start_time:.2f} secondes")
+        return True
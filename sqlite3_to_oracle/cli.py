@@ -14,7 +14,7 @@ import time
 from typing import Dict, Tuple, Optional, List, Any
 
 from . import ORACLE_CONFIG, logger
-from .config import load_oracle_config, save_oracle_config
+from .config import is_true_value, load_oracle_config, save_oracle_config
 from .converter import convert_sqlite_dump
 from .oracle_utils import (
     create_oracle_user, 
@@ -53,6 +53,7 @@ if RICH_AVAILABLE:
         from rich.panel import Panel
         from rich.table import Table
         from rich.text import Text
+        from .rich_logging import console as rich_console
     except ImportError:
         pass
 
@@ -61,7 +62,7 @@ class RichHelpFormatter(argparse.HelpFormatter):
     
     def __init__(self, prog, indent_increment=2, max_help_position=24, width=None):
         super().__init__(prog, indent_increment, max_help_position, width)
-        self.rich_console = Console() if RICH_AVAILABLE else None
+        self.rich_console = rich_console if RICH_AVAILABLE else None
     
     def _format_usage(self, usage, actions, groups, prefix):
         if not RICH_AVAILABLE:
@@ -92,7 +93,7 @@ def display_rich_help(parser: argparse.ArgumentParser) -> None:
         parser.print_help()
         return
     
-    console = Console()
+    console = rich_console
     
     console.print(f"\n[bold magenta]{parser.prog}[/bold magenta]")
     console.print("─" * len(parser.prog))
@@ -142,8 +143,11 @@ def display_rich_help(parser: argparse.ArgumentParser) -> None:
         md = Markdown(parser.epilog)
         console.print(md)
 
-def parse_arguments() -> argparse.Namespace:
-    """Parse les arguments de la ligne de commande."""
+# Analyseur des arguments, construit une seule fois à la première utilisation
+_PARSER: Optional[argparse.ArgumentParser] = None
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Construit l'analyseur des arguments de la ligne de commande."""
     parser = argparse.ArgumentParser(
         description="Convertisseur de base de données SQLite vers Oracle SQL",
         formatter_class=RichHelpFormatter if RICH_AVAILABLE else argparse.RawDescriptionHelpFormatter,
@@ -265,6 +269,15 @@ sqlite3-to-oracle --validate-credentials-only
     batch_group.add_argument('--continue-on-error', action='store_true',
                             help="Continuer le traitement par lots même en cas d'erreur sur une base")
     
+    return parser
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse les arguments de la ligne de commande."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    parser = _PARSER
+    
     if RICH_AVAILABLE and len(sys.argv) == 1 or '--help' in sys.argv or '-h' in sys.argv:
         display_rich_help(parser)
         sys.exit(0)
@@ -275,13 +288,7 @@ def setup_logging(args: argparse.Namespace) -> None:
     """Configure le niveau de log en fonction des arguments."""
     global logger
     
-    if args.quiet:
-        level = logging.ERROR
-    elif args.verbose:
-        level = logging.DEBUG
-    else:
-        level = logging.INFO
-    
+    level = logging.ERROR if args.quiet else logging.DEBUG if args.verbose else logging.INFO
     logger = setup_logger("sqlite3_to_oracle", level)
 
 def determine_oracle_username(db_path: str, args: argparse.Namespace) -> Tuple[str, str]:
@@ -295,20 +302,23 @@ def determine_oracle_username(db_path: str, args: argparse.Namespace) -> Tuple[s
     Returns:
         Tuple contenant (nom d'utilisateur, mot de passe)
     """
-    oracle_username = get_oracle_username_from_filepath(db_path)
-    
-    username = args.new_username if args.new_username else oracle_username
+    # Le nom dérivé du fichier n'est calculé que s'il n'est pas fourni explicitement
+    username = args.new_username if args.new_username else get_oracle_username_from_filepath(db_path)
     password = args.new_password if args.new_password else username
     
-    logger.info(f"Nom d'utilisateur Oracle sélectionné: {username}")
+    logger.info("Nom d'utilisateur Oracle sélectionné: %s", username)
     return username, password
 
 def save_oracle_sql(oracle_sql: str, output_file: str) -> None:
     """Sauvegarde le SQL Oracle dans un fichier."""
     try:
-        with open(output_file, 'w') as f:
-            f.write(oracle_sql)
-        logger.info(f"Script SQL Oracle sauvegardé dans {output_file}")
+        # Écriture bufferisée (elle reprend les écritures partielles), par tranches pour ne
+        # jamais garder en mémoire une copie encodée du script entier
+        chunk_size = 1 << 23
+        with open(output_file, 'w', encoding='utf-8', newline='\n', buffering=chunk_size) as f:
+            for start in range(0, len(oracle_sql), chunk_size):
+                f.write(oracle_sql[start:start + chunk_size])
+        logger.info("Script SQL Oracle sauvegardé dans %s", output_file)
     except Exception as e:
         logger.error(f"Erreur lors de l'écriture du fichier de sortie: {e}")
         sys.exit(1)
@@ -333,7 +343,7 @@ def process_single_database(sqlite_db_path: str, args: argparse.Namespace, log_m
             )
             
             if report_file:
-                logger.info(f"Rapport de validation exporté dans {report_file}")
+                logger.info("Rapport de validation exporté dans %s", report_file)
         
         return {
             "user": args.new_username,
@@ -373,7 +383,7 @@ def main() -> None:
         if env_cli_args:
             for key, value in env_cli_args.items():
                 if args.verbose:
-                    logger.debug(f"Traitement de la variable d'environnement {key}={value}")
+                    logger.debug("Traitement de la variable d'environnement %s=%s", key, value)
                 
                 if key == 'sqlite_db' and not args.sqlite_db:
                     args.sqlite_db = value
@@ -391,10 +401,10 @@ def main() -> None:
                     args.schema_only = value
                 elif key == 'batch' and not args.batch:
                     args.batch = value
-                    logger.debug(f"Mode batch activé depuis .env: {value}")
+                    logger.debug("Mode batch activé depuis .env: %s", value)
                 elif key == 'sqlite_dir' and not args.sqlite_dir:
                     args.sqlite_dir = value
-                    logger.debug(f"Répertoire SQLite défini via variable d'environnement: {value}")
+                    logger.debug("Répertoire SQLite défini via variable d'environnement: %s", value)
                 elif key == 'file_pattern' and not args.file_pattern:
                     args.file_pattern = value
                 elif key == 'uri_output_file' and not args.uri_output_file:
@@ -405,7 +415,7 @@ def main() -> None:
         # Vérifier explicitement si le mode batch est activé depuis l'environnement
         batch_from_env = False
         if not args.batch:
-            if os.environ.get('ORACLE_BATCH', '').lower() in ('true', 'yes', '1'):
+            if is_true_value(os.environ.get('ORACLE_BATCH')):
                 args.batch = True
                 batch_from_env = True
                 logger.debug("Mode batch activé directement depuis la variable d'environnement ORACLE_BATCH")
@@ -415,7 +425,7 @@ def main() -> None:
                 logger.debug("Mode batch activé depuis le fichier d'environnement")
         
         # Vérifier que les identifiants administrateur sont valides
-        if not all(key in ORACLE_CONFIG and ORACLE_CONFIG[key] for key in ("user", "password", "dsn")):
+        if not all(map(ORACLE_CONFIG.get, ("user", "password", "dsn"))):
             print_error_message("Erreur de configuration Oracle")
             logger.error("Vous devez fournir les identifiants administrateur Oracle (user, password, dsn)")
             logger.info("Options: --oracle-admin-user, --oracle-admin-password, --oracle-admin-dsn")
@@ -428,12 +438,13 @@ def main() -> None:
             
             if not args.sqlite_dir:
                 # Vérifier si le répertoire SQLite est dans les variables d'environnement
-                if 'ORACLE_SQLITE_DIR' in os.environ:
-                    args.sqlite_dir = os.environ.get('ORACLE_SQLITE_DIR')
-                    logger.info(f"Répertoire SQLite obtenu depuis ORACLE_SQLITE_DIR: {args.sqlite_dir}")
+                env_sqlite_dir = os.environ.get('ORACLE_SQLITE_DIR')
+                if env_sqlite_dir is not None:
+                    args.sqlite_dir = env_sqlite_dir
+                    logger.info("Répertoire SQLite obtenu depuis ORACLE_SQLITE_DIR: %s", args.sqlite_dir)
                 elif env_cli_args and 'sqlite_dir' in env_cli_args:
                     args.sqlite_dir = env_cli_args['sqlite_dir']
-                    logger.info(f"Répertoire SQLite obtenu depuis le fichier d'environnement: {args.sqlite_dir}")
+                    logger.info("Répertoire SQLite obtenu depuis le fichier d'environnement: %s", args.sqlite_dir)
                 else:
                     print_error_message("Répertoire SQLite non spécifié pour le mode batch")
                     logger.error("Utilisez --sqlite-dir ou la variable d'environnement ORACLE_SQLITE_DIR")
@@ -443,7 +454,7 @@ def main() -> None:
                 print_error_message(f"Le répertoire {args.sqlite_dir} n'existe pas.")
                 sys.exit(1)
             
-            logger.info(f"Validation des bases SQLite dans le répertoire: {args.sqlite_dir}")
+            logger.info("Validation des bases SQLite dans le répertoire: %s", args.sqlite_dir)
             successful_validations = process_batch_validation(
                 oracle_config=ORACLE_CONFIG,
                 sqlite_dir=args.sqlite_dir,
@@ -474,10 +485,9 @@ def main() -> None:
                 # Afficher les rapports si Rich est disponible
                 if RICH_AVAILABLE and not args.quiet:
                     try:
-                        from rich.console import Console
                         from rich.markdown import Markdown
                         
-                        console = Console()
+                        console = rich_console
                         
                         # Afficher directement le rapport global s'il existe
                         if has_overall_report:
@@ -492,7 +502,7 @@ def main() -> None:
                             print(f"\nRapport détaillé disponible: {latest_report}")
                             
                     except Exception as e:
-                        logger.debug(f"Erreur lors de l'affichage des rapports: {str(e)}")
+                        logger.debug("Erreur lors de l'affichage des rapports: %s", e)
                 
                 # Afficher simplement les chemins des rapports si on est en mode silencieux ou sans Rich
                 elif latest_report or has_overall_report:
@@ -515,12 +525,13 @@ def main() -> None:
                 # Rediriger vers le mode batch
                 if not args.sqlite_dir:
                     # Vérifier si le répertoire SQLite est dans les variables d'environnement
-                    if 'ORACLE_SQLITE_DIR' in os.environ:
-                        args.sqlite_dir = os.environ.get('ORACLE_SQLITE_DIR')
-                        logger.info(f"Répertoire SQLite obtenu depuis ORACLE_SQLITE_DIR: {args.sqlite_dir}")
+                    env_sqlite_dir = os.environ.get('ORACLE_SQLITE_DIR')
+                    if env_sqlite_dir is not None:
+                        args.sqlite_dir = env_sqlite_dir
+                        logger.info("Répertoire SQLite obtenu depuis ORACLE_SQLITE_DIR: %s", args.sqlite_dir)
                     elif env_cli_args and 'sqlite_dir' in env_cli_args:
                         args.sqlite_dir = env_cli_args['sqlite_dir']
-                        logger.info(f"Répertoire SQLite obtenu depuis le fichier d'environnement: {args.sqlite_dir}")
+                        logger.info("Répertoire SQLite obtenu depuis le fichier d'environnement: %s", args.sqlite_dir)
                     else:
                         print_error_message("Répertoire SQLite non spécifié pour le mode batch")
                         logger.error("Utilisez --sqlite-dir ou la variable d'environnement ORACLE_SQLITE_DIR")
@@ -530,7 +541,7 @@ def main() -> None:
                     print_error_message(f"Le répertoire {args.sqlite_dir} n'existe pas.")
                     sys.exit(1)
                 
-                logger.info(f"Validation des bases SQLite dans le répertoire: {args.sqlite_dir}")
+                logger.info("Validation des bases SQLite dans le répertoire: %s", args.sqlite_dir)
                 successful_validations = process_batch_validation(
                     oracle_config=ORACLE_CONFIG,
                     sqlite_dir=args.sqlite_dir,
@@ -561,10 +572,9 @@ def main() -> None:
                     # Afficher les rapports si Rich est disponible
                     if RICH_AVAILABLE and not args.quiet:
                         try:
-                            from rich.console import Console
                             from rich.markdown import Markdown
                             
-                            console = Console()
+                            console = rich_console
                             
                             # Afficher directement le rapport global s'il existe
                             if has_overall_report:
@@ -579,7 +589,7 @@ def main() -> None:
                                 print(f"\nRapport détaillé disponible: {latest_report}")
                                 
                         except Exception as e:
-                            logger.debug(f"Erreur lors de l'affichage des rapports: {str(e)}")
+                            logger.debug("Erreur lors de l'affichage des rapports: %s", e)
                     
                     # Afficher simplement les chemins des rapports si on est en mode silencieux ou sans Rich
                     elif latest_report or has_overall_report:
@@ -626,7 +636,7 @@ def main() -> None:
         
         sqlite_db_path = args.sqlite_db
         logger.info("Démarrage de la conversion SQLite vers Oracle...")
-        logger.info(f"Configuration Oracle Admin: [bold cyan]user={ORACLE_CONFIG['user']}, dsn={ORACLE_CONFIG['dsn']}[/bold cyan]")
+        logger.info("Configuration Oracle Admin: [bold cyan]user=%s, dsn=%s[/bold cyan]", ORACLE_CONFIG['user'], ORACLE_CONFIG['dsn'])
         
         user_config = process_single_database(sqlite_db_path, args, log_manager)
         
@@ -642,10 +652,9 @@ def main() -> None:
                     # Afficher directement le rapport si Rich est disponible
                     if RICH_AVAILABLE:
                         try:
-                            from rich.console import Console
                             from rich.markdown import Markdown
                             
-                            console = Console()
+                            console = rich_console
                             print(f"\nRapport de validation:")
                             with open(report_path, 'r', encoding='utf-8') as f:
                                 md = Markdown(f.read())
@@ -5,16 +5,153 @@ Module de gestion de la configuration Oracle.
 import os
 import json
 import logging
+import functools
+from types import MappingProxyType
 from typing import Dict, Optional, Tuple, Any
 from pathlib import Path
 from . import ORACLE_CONFIG, logger
 
-# Configuration par défaut pour Oracle
-DEFAULT_ORACLE_CONFIG = {
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# python-dotenv reste une dépendance optionnelle, importée une seule fois
+try:
+    from dotenv import load_dotenv as _load_dotenv
+    DOTENV_AVAILABLE = True
+except ImportError:
+    _load_dotenv = None
+    DOTENV_AVAILABLE = False
+
+# Configuration par défaut pour Oracle (en lecture seule)
+DEFAULT_ORACLE_CONFIG = MappingProxyType({
     "user": "system",
     "password": "YourPassword",
     "dsn": "localhost:1521/free"
-}
+})
+
+# Clés obligatoires d'une configuration de connexion Oracle
+_REQUIRED_CONFIG_KEYS = ("user", "password", "dsn")
+
+# Fichier de configuration par défaut, résolu une seule fois au chargement du module
+_DEFAULT_CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".oracle_config.json")
+
+# Valeurs reconnues pour les variables d'environnement booléennes (en minuscules)
+_TRUE_VALUES = frozenset(("true", "yes", "1", "on", "y", "t"))
+_FALSE_VALUES = frozenset(("false", "no", "0", "off", "n", "f"))
+
+def is_true_value(value: Optional[str]) -> bool:
+    """
+    Indique si la valeur d'une variable d'environnement désigne un booléen vrai.
+    
+    Args:
+        value: Valeur brute de la variable, ou None si elle n'est pas définie
+        
+    Returns:
+        True si la valeur fait partie des valeurs vraies reconnues
+    """
+    return value is not None and value.lower() in _TRUE_VALUES
+
+def _parse_env_flag(value: str) -> Any:
+    """
+    Convertit la valeur d'une variable d'environnement booléenne.
+    
+    Args:
+        value: Valeur brute de la variable
+        
+    Returns:
+        True ou False pour les valeurs reconnues, la valeur brute sinon
+    """
+    lowered = value.lower()
+    if lowered in _TRUE_VALUES:
+        return True
+    if lowered in _FALSE_VALUES:
+        return False
+    return value
+
+# Variables d'environnement de la connexion administrateur : (variable, clé de configuration)
+_ADMIN_ENV_MAP = (
+    ("ORACLE_ADMIN_USER", "user"),
+    ("ORACLE_ADMIN_PASSWORD", "password"),
+    ("ORACLE_ADMIN_DSN", "dsn"),
+)
+
+# Variables d'environnement utiles pour la CLI : (variable, option, conversion)
+_CLI_ENV_MAP = (
+    ("ORACLE_SQLITE_DB", "sqlite_db", str),
+    ("ORACLE_OUTPUT_FILE", "output_file", str),
+    ("ORACLE_NEW_USERNAME", "new_username", str),
+    ("ORACLE_NEW_PASSWORD", "new_password", str),
+    ("ORACLE_DROP_TABLES", "drop_tables", _parse_env_flag),
+    ("ORACLE_FORCE_RECREATE", "force_recreate", _parse_env_flag),
+    ("ORACLE_SCHEMA_ONLY", "schema_only", _parse_env_flag),
+    ("ORACLE_BATCH", "batch", _parse_env_flag),
+    ("ORACLE_SQLITE_DIR", "sqlite_dir", str),
+    ("ORACLE_FILE_PATTERN", "file_pattern", str),
+    ("ORACLE_URI_OUTPUT_FILE", "uri_output_file", str),
+    ("ORACLE_CONTINUE_ON_ERROR", "continue_on_error", _parse_env_flag),
+    ("ORACLE_USE_VARCHAR", "use_varchar", _parse_env_flag),
+    ("ORACLE_ONLY_FK_KEYS", "only_fk_keys", _parse_env_flag),
+)
+
+@functools.lru_cache(maxsize=8)
+def _parse_json_config(config_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Lit et décode un fichier de configuration JSON (mis en cache par chemin, date de modification et taille).
+    
+    Args:
+        config_file: Chemin absolu vers le fichier JSON
+        mtime_ns: Date de modification du fichier, pour invalider le cache
+        size: Taille du fichier, pour invalider le cache si la date n'a pas changé
+        
+    Returns:
+        Contenu décodé du fichier
+    """
+    data = Path(config_file).read_bytes()
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _read_json_config(config_file: str) -> Optional[Dict[str, Any]]:
+    """
+    Retourne le contenu d'un fichier de configuration JSON, ou None s'il n'existe pas.
+    
+    Args:
+        config_file: Chemin vers le fichier JSON
+        
+    Returns:
+        Copie du contenu décodé du fichier (le cache n'est jamais exposé) ou None
+    """
+    config_file = os.path.abspath(config_file)
+    try:
+        stat_result = os.stat(config_file)
+    except OSError:
+        return None
+    return dict(_parse_json_config(config_file, stat_result.st_mtime_ns, stat_result.st_size))
+
+def _pick_config_keys(source: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Extrait d'une source les clés de configuration Oracle connues et renseignées.
+    
+    Args:
+        source: Configuration lue depuis un fichier
+        
+    Returns:
+        Dictionnaire limité aux clés de ORACLE_CONFIG ayant une valeur
+    """
+    return {key: source[key] for key in ORACLE_CONFIG if source.get(key)}
+
+@functools.lru_cache(maxsize=8)
+def _load_env_path(env_path: str) -> None:
+    """
+    Charge un fichier .env une seule fois par chemin absolu.
+    
+    Args:
+        env_path: Chemin absolu du fichier .env
+    """
+    _load_dotenv(env_path)
 
 def load_dotenv_file(env_file: str = None) -> bool:
     """
@@ -26,23 +163,21 @@ def load_dotenv_file(env_file: str = None) -> bool:
     Returns:
         bool: True si le chargement a réussi, False sinon
     """
-    try:
-        from dotenv import load_dotenv
-        
-        if env_file and os.path.isfile(env_file):
-            # Charger le fichier .env spécifié
-            load_dotenv(env_file)
-            return True
-        else:
-            # Essayer de charger le fichier .env par défaut
-            default_env = os.path.join(os.getcwd(), '.env')
-            if os.path.isfile(default_env):
-                load_dotenv(default_env)
-                return True
-        
-        return False
-    except ImportError:
+    if not DOTENV_AVAILABLE:
         return False
+    
+    if env_file and os.path.isfile(env_file):
+        # Charger le fichier .env spécifié
+        _load_env_path(os.path.abspath(env_file))
+        return True
+    
+    # Essayer de charger le fichier .env par défaut
+    default_env = os.path.join(os.getcwd(), '.env')
+    if os.path.isfile(default_env):
+        _load_env_path(default_env)
+        return True
+    
+    return False
 
 def load_oracle_config(
     cli_config: Dict[str, Optional[str]] = None,
@@ -65,104 +200,67 @@ def load_oracle_config(
     Returns:
         Tuple contenant (config_oracle, variables_env_cli)
     """
-    # Commencer avec la configuration par défaut
-    oracle_config = ORACLE_CONFIG.copy()
-    
-    # Variables d'environnement à extraire pour la CLI
-    env_cli_vars = {}
-    
     # Charger depuis fichier .env si spécifié
     if env_file and os.path.exists(env_file):
         try:
-            # Import conditionnel pour éviter une dépendance stricte
-            try:
-                from dotenv import load_dotenv
+            if DOTENV_AVAILABLE:
                 # Charger les variables d'environnement depuis le fichier .env
-                load_dotenv(env_file)
+                _load_env_path(os.path.abspath(env_file))
                 logger.info(f"Variables d'environnement chargées depuis {env_file}")
-            except ImportError:
+            else:
                 logger.warning("Le module python-dotenv n'est pas installé, impossible de charger le fichier .env")
                 logger.info("Installez-le avec: pip install python-dotenv")
         except Exception as e:
             logger.warning(f"Erreur lors du chargement du fichier .env: {str(e)}")
     
-    # Vérifier les variables d'environnement
-    env_mapping = {
-        "ORACLE_ADMIN_USER": "user",
-        "ORACLE_ADMIN_PASSWORD": "password",
-        "ORACLE_ADMIN_DSN": "dsn",
-    }
-    
-    for env_var, config_key in env_mapping.items():
-        if os.environ.get(env_var):
-            oracle_config[config_key] = os.environ.get(env_var)
+    # Vérifier les variables d'environnement (une seule lecture par variable)
+    environ = os.environ
+    env_config = {}
+    for env_var, config_key in _ADMIN_ENV_MAP:
+        env_value = environ.get(env_var)
+        if env_value:
+            env_config[config_key] = env_value
     
     # Essayer de charger depuis ~/.oracle_config.json si existant
-    home_dir = os.path.expanduser("~")
-    default_config_file = os.path.join(home_dir, ".oracle_config.json")
+    default_config_file = _DEFAULT_CONFIG_FILE
     
-    if os.path.exists(default_config_file):
-        try:
-            with open(default_config_file, 'r') as f:
-                user_config = json.load(f)
-                # Mettre à jour uniquement les clés existantes
-                for key in oracle_config:
-                    if key in user_config and user_config[key]:
-                        oracle_config[key] = user_config[key]
+    user_config = {}
+    try:
+        user_file_config = _read_json_config(default_config_file)
+        if user_file_config is not None:
+            # Retenir uniquement les clés existantes
+            user_config = _pick_config_keys(user_file_config)
             logger.debug(f"Configuration Oracle chargée depuis {default_config_file}")
-        except Exception as e:
-            logger.debug(f"Erreur lors du chargement de {default_config_file}: {str(e)}")
+    except Exception as e:
+        logger.debug(f"Erreur lors du chargement de {default_config_file}: {str(e)}")
     
     # Charger depuis le fichier de configuration JSON spécifié
-    if config_file and os.path.exists(config_file):
+    file_config = {}
+    if config_file:
         try:
-            with open(config_file, 'r') as f:
-                file_config = json.load(f)
-                # Mettre à jour uniquement les clés existantes
-                for key in oracle_config:
-                    if key in file_config and file_config[key]:
-                        oracle_config[key] = file_config[key]
-            logger.debug(f"Configuration Oracle chargée depuis {config_file}")
+            json_config = _read_json_config(config_file)
+            if json_config is not None:
+                # Retenir uniquement les clés existantes
+                file_config = _pick_config_keys(json_config)
+                logger.debug(f"Configuration Oracle chargée depuis {config_file}")
         except Exception as e:
             logger.warning(f"Erreur lors du chargement de {config_file}: {str(e)}")
     
     # Extraire les variables d'environnement utiles pour la CLI
-    cli_env_vars = [
-        ("ORACLE_SQLITE_DB", "sqlite_db"),
-        ("ORACLE_OUTPUT_FILE", "output_file"),
-        ("ORACLE_NEW_USERNAME", "new_username"),
-        ("ORACLE_NEW_PASSWORD", "new_password"),
-        ("ORACLE_DROP_TABLES", "drop_tables"),
-        ("ORACLE_FORCE_RECREATE", "force_recreate"),
-        ("ORACLE_SCHEMA_ONLY", "schema_only"),
-        ("ORACLE_BATCH", "batch"),
-        ("ORACLE_SQLITE_DIR", "sqlite_dir"),
-        ("ORACLE_FILE_PATTERN", "file_pattern"),
-        ("ORACLE_URI_OUTPUT_FILE", "uri_output_file"),
-        ("ORACLE_CONTINUE_ON_ERROR", "continue_on_error"),
-        ("ORACLE_USE_VARCHAR", "use_varchar"),
-        ("ORACLE_ONLY_FK_KEYS", "only_fk_keys"),  # Ajout de la nouvelle option
-    ]
-    
-    for env_var, cli_var in cli_env_vars:
-        env_value = os.environ.get(env_var)
+    env_cli_vars = {}
+    for env_var, cli_var, convert in _CLI_ENV_MAP:
+        env_value = environ.get(env_var)
         if env_value:
-            # Convertir les valeurs booléennes
-            if env_value.lower() in ('true', 'yes', '1'):
-                env_cli_vars[cli_var] = True
-            elif env_value.lower() in ('false', 'no', '0'):
-                env_cli_vars[cli_var] = False
-            else:
-                env_cli_vars[cli_var] = env_value
+            env_cli_vars[cli_var] = convert(env_value)
+    
+    # Ne pas écraser avec None
+    cli_values = {key: value for key, value in (cli_config or {}).items() if value is not None}
     
-    # Appliquer la configuration CLI (priorité la plus élevée)
-    if cli_config:
-        for key, value in cli_config.items():
-            if value is not None:  # Ne pas écraser avec None
-                oracle_config[key] = value
+    # Superposer les sources (CLI en priorité) en une seule construction de dictionnaire
+    oracle_config = {**ORACLE_CONFIG, **env_config, **user_config, **file_config, **cli_values}
     
     # Valider la configuration finale
-    missing_keys = [key for key in ["user", "password", "dsn"] if not oracle_config.get(key)]
+    missing_keys = [key for key in _REQUIRED_CONFIG_KEYS if not oracle_config.get(key)]
     if missing_keys:
         logger.warning(f"Configuration Oracle incomplète: {', '.join(missing_keys)} manquant")
     
@@ -179,9 +277,7 @@ def save_oracle_config(config: Dict[str, str], config_file: str = None) -> bool:
     Returns:
         True si la sauvegarde a réussi, False sinon
     """
-    if not config_file:
-        home_dir = os.path.expanduser("~")
-        config_file = os.path.join(home_dir, ".oracle_config.json")
+    config_file = config_file or _DEFAULT_CONFIG_FILE
     
     try:
         # Vérifier si le répertoire existe
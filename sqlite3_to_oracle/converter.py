@@ -7,6 +7,19 @@ import sqlite3
 import datetime
 from . import logger
 
+# Colonnes et clés étrangères de toutes les tables utilisateur, chaque ligne préfixée
+# par le nom de la table (parcours de sqlite_master dans son ordre de stockage)
+_SQLITE_COLUMNS_SQL = """
+    SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk
+    FROM sqlite_master m JOIN pragma_table_info(m.name) p
+    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+"""
+_SQLITE_FOREIGN_KEYS_SQL = """
+    SELECT m.name, f.*
+    FROM sqlite_master m JOIN pragma_foreign_key_list(m.name) f
+    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+"""
+
 def filter_sqlite_specific_statements(sql):
     """
     Remove SQLite-specific commands that are not valid in Oracle.
@@ -468,19 +481,21 @@ def extract_sqlite_data(sqlite_db_path):
     cursor = conn.cursor()
     
     try:
-        # Récupérer la liste des tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';")
-        tables = cursor.fetchall()
+        # Récupérer les colonnes et les clés étrangères de toutes les tables en deux requêtes
+        # plutôt que deux requêtes par table
+        columns_by_table = {}
+        for row in cursor.execute(_SQLITE_COLUMNS_SQL):
+            columns_by_table.setdefault(row[0], []).append(row[1:])
+        fks_by_table = {}
+        for row in cursor.execute(_SQLITE_FOREIGN_KEYS_SQL):
+            fks_by_table.setdefault(row[0], []).append(row[1:])
         
         # Génération du script SQL
         sql_script = []
         
-        for table in tables:
-            table_name = table[0].decode('utf-8', errors='replace')
-            
-            # Récupérer les informations de schéma pour cette table
-            cursor.execute(f"PRAGMA table_info({table_name});")
-            columns = cursor.fetchall()
+        for raw_table_name, columns in columns_by_table.items():
+            table_name = raw_table_name.decode('utf-8', errors='replace')
+            quoted_table = '"' + table_name.replace('"', '""') + '"'
             
             # Identifier les colonnes de type date et binaires
             date_columns = []
@@ -520,8 +535,7 @@ def extract_sqlite_data(sqlite_db_path):
             create_table += ",\n".join(column_defs)
             
             # Récupérer les contraintes de clé étrangère
-            cursor.execute(f"PRAGMA foreign_key_list({table_name});")
-            fks = cursor.fetchall()
+            fks = fks_by_table.get(raw_table_name)
             
             if fks:
                 fk_constraints = []
@@ -546,7 +560,7 @@ def extract_sqlite_data(sqlite_db_path):
             # Récupérer et générer les INSERT pour cette table
             try:
                 with conn:
-                    cursor.execute(f"SELECT * FROM {table_name}")
+                    cursor.execute(f"SELECT * FROM {quoted_table}")
                     rows = cursor.fetchall()
                     
                     for row in rows:
@@ -583,11 +597,13 @@ def extract_sqlite_data(sqlite_db_path):
             except Exception as e:
                 logger.error(f"Erreur lors de la génération des INSERT pour {table_name}: {str(e)}")
         
-        conn.close()
         return "\n\n".join(sql_script)
     except Exception as e:
         logger.error(f"Erreur lors de l'extraction des données: {str(e)}")
         return ""  # Corriger cette ligne qui n'était pas indentée correctement
+    finally:
+        # Fermer la connexion aussi en cas d'erreur, sans attendre le ramasse-miettes
+        conn.close()
 
 def convert_date_format(date_str):
     """
@@ -10,10 +10,14 @@ import csv
 import os
 import tempfile
 import time
-from typing import Dict, List, Tuple, Optional, Iterator, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Tuple, Optional, Iterator, Any, Union
 from . import logger
 from .lookup_loader import create_simplified_lookup_table, parse_and_load_lookup_data
 from .performance_loader import load_performance_table
+from .bulk_loader import load_table_sqlldr
+from .oracle_utils import acquire_connection, release_connection, get_connection
+from .sqlite_utils import open_sqlite_readonly
 
 def extract_table_structure(sqlite_path: str, table_name: str) -> Tuple[List[str], List[str]]:
     """
@@ -26,7 +30,7 @@ def extract_table_structure(sqlite_path: str, table_name: str) -> Tuple[List[str
     Returns:
         Tuple contenant (colonnes, types)
     """
-    conn = sqlite3.connect(sqlite_path)
+    conn = open_sqlite_readonly(sqlite_path)
     cursor = conn.cursor()
     
     # Récupérer les infos sur les colonnes
@@ -59,9 +63,12 @@ def export_table_to_csv(sqlite_path: str, table_name: str, chunk_size: int = 500
     temp_dir = tempfile.gettempdir()
     csv_path = os.path.join(temp_dir, f"{table_name}_{int(time.time())}.csv")
     
-    conn = sqlite3.connect(sqlite_path)
+    conn = open_sqlite_readonly(sqlite_path)
     cursor = conn.cursor()
     
+    # Une seule transaction de lecture pour le comptage et l'export
+    cursor.execute("BEGIN")
+    
     # Récupérer les noms de colonnes
     cursor.execute(f"PRAGMA table_info({table_name})")
     columns = [row[1] for row in cursor.fetchall()]
@@ -75,13 +82,12 @@ def export_table_to_csv(sqlite_path: str, table_name: str, chunk_size: int = 500
         writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
         writer.writerow(columns)  # En-tête
         
-        # Traitement par lots
-        offset = 0
+        # Une seule requête lue par blocs (évite un LIMIT/OFFSET qui relit les lignes précédentes)
+        cursor.execute(f"SELECT * FROM {table_name}")
         rows_written = 0
         
-        while offset < total_rows:
-            cursor.execute(f"SELECT * FROM {table_name} LIMIT {chunk_size} OFFSET {offset}")
-            batch = cursor.fetchall()
+        while True:
+            batch = cursor.fetchmany(chunk_size)
             
             if not batch:
                 break
@@ -89,13 +95,13 @@ def export_table_to_csv(sqlite_path: str, table_name: str, chunk_size: int = 500
             writer.writerows(batch)
             
             rows_written += len(batch)
-            offset += chunk_size
             
             # Afficher la progression tous les 100 000 enregistrements
             if rows_written % 100000 == 0 or rows_written == total_rows:
                 progress_pct = (rows_written / total_rows) * 100 if total_rows > 0 else 100
                 logger.info(f"Export de {table_name}: {rows_written}/{total_rows} lignes ({progress_pct:.1f}%)")
     
+    conn.commit()
     cursor.close()
     conn.close()
     
@@ -180,7 +186,7 @@ def create_table_from_sqlite(
         # Ajouter les contraintes de clé étrangère si demandé
         fk_constraints = []
         if analyze_constraints:
-            conn = sqlite3.connect(sqlite_path)
+            conn = open_sqlite_readonly(sqlite_path)
             try:
                 fk_cursor = conn.cursor()
                 fk_cursor.execute(f"PRAGMA foreign_key_list({table_name})")
@@ -349,22 +355,29 @@ def load_csv_to_oracle(
                     loaded_rows += rows_inserted
             else:
                 # Pour les tables avec structure minimale, stocker en format pivot
+                pivot_sql = f"INSERT INTO {table_name} (COLUMN_NAME, VALUE, ROW_NUM) VALUES (:1, :2, :3)"
+                batch = []
                 row_num = 0
                 for row in reader:
                     row_num += 1
                     
-                    # Insérer chaque valeur comme une ligne séparée
-                    for i, (col_name, value) in enumerate(zip(headers, row)):
+                    # Chaque valeur devient une ligne séparée
+                    for col_name, value in zip(headers, row):
                         if value:  # Ne pas insérer les valeurs vides
-                            try:
-                                cursor.execute(
-                                    f"INSERT INTO {table_name} (COLUMN_NAME, VALUE, ROW_NUM) VALUES (:1, :2, :3)",
-                                    [col_name, str(value)[:4000], row_num]
-                                )
-                                oracle_conn.commit()
-                                loaded_rows += 1
-                            except Exception as e:
-                                logger.debug(f"Échec d'insertion dans {table_name}: {str(e)}")
+                            batch.append((col_name, value[:4000], row_num))
+                    
+                    if len(batch) >= batch_size:
+                        _, rows_inserted = _execute_batch_with_retry(
+                            oracle_conn, cursor, pivot_sql, batch, max_retries, True
+                        )
+                        loaded_rows += rows_inserted
+                        batch = []
+                
+                if batch:
+                    _, rows_inserted = _execute_batch_with_retry(
+                        oracle_conn, cursor, pivot_sql, batch, max_retries, True
+                    )
+                    loaded_rows += rows_inserted
         
         logger.info(f"Chargement terminé pour {table_name}: {loaded_rows} lignes insérées")
         return loaded_rows
@@ -402,9 +415,13 @@ def _execute_batch_with_retry(
     
     while retries < max_retries:
         try:
-            cursor.executemany(sql, batch)
+            # Les lignes invalides sont écartées par Oracle sans faire échouer le lot
+            cursor.executemany(sql, batch, batcherrors=True)
+            errors = cursor.getbatcherrors()
             conn.commit()
-            return True, len(batch)
+            for error in errors[:10]:
+                logger.debug(f"Ligne {error.offset} du lot rejetée: {error.message}")
+            return not errors, len(batch) - len(errors)
         except Exception as e:
             retries += 1
             error_info = str(e)
@@ -417,19 +434,16 @@ def _execute_batch_with_retry(
                 for i, row in enumerate(batch):
                     try:
                         cursor.execute(sql, row)
-                        if has_tx_support:
-                            conn.commit()
                         rows_inserted += 1
                     except Exception as row_error:
                         # Si une ligne échoue, continuer avec les autres
                         logger.debug(f"Ligne {i} ignorée: {str(row_error)}")
                 
-                # Commit final si pas de support de transactions par ligne
-                if not has_tx_support:
-                    try:
-                        conn.commit()
-                    except:
-                        pass
+                # Un seul commit pour les lignes du lot insérées individuellement
+                try:
+                    conn.commit()
+                except:
+                    pass
                         
                 return False, rows_inserted
             else:
@@ -443,24 +457,26 @@ def _execute_batch_with_retry(
                         pass
 
 def load_table_alternative(
-    oracle_config: Dict[str, str],
+    oracle_config: Union[Dict[str, str], oracledb.ConnectionPool],
     sqlite_path: str,
     table_name: str,
     sql_file_path: str = None,
     batch_size: int = 5000,
-    use_varchar_for_decimals: bool = False
+    use_varchar_for_decimals: bool = False,
+    nologging: bool = False
 ) -> bool:
     """
     Charge une table SQLite dans Oracle en utilisant une approche alternative
     via CSV quand la méthode standard échoue.
     
     Args:
-        oracle_config: Configuration Oracle
+        oracle_config: Configuration Oracle ou pool de sessions (voir get_oracle_pool)
         sqlite_path: Chemin vers le fichier SQLite
         table_name: Nom de la table à charger
         sql_file_path: Chemin vers le fichier SQL original (optionnel)
         batch_size: Taille des lots pour l'insertion
         use_varchar_for_decimals: Si True, utilise VARCHAR2 pour les nombres décimaux
+        nologging: Charger les tables volumineuses en chemin direct sans redo
         
     Returns:
         True si le chargement a réussi, False sinon
@@ -469,30 +485,21 @@ def load_table_alternative(
     
     # Détection des grandes tables ou tables spéciales qui nécessitent un traitement particulier
     if "ON_TIME_PERFORMANCE" in table_name.upper() or "ON_TIME_ON_TIME" in table_name.upper():
-        return load_performance_table(oracle_config, sqlite_path, table_name, use_varchar_for_decimals)
+        return load_performance_table(oracle_config, sqlite_path, table_name, use_varchar_for_decimals, nologging=nologging)
     
     # Détection des tables de lookup (L_*)
     if table_name.startswith("L_") and sql_file_path:
         try:
-            conn = oracledb.connect(
-                user=oracle_config["user"],
-                password=oracle_config["password"],
-                dsn=oracle_config["dsn"]
-            )
-            success = parse_and_load_lookup_data(conn, sql_file_path, table_name)
-            conn.close()
-            return success
+            with get_connection(oracle_config) as conn:
+                return parse_and_load_lookup_data(conn, sql_file_path, table_name)
         except Exception as e:
             logger.warning(f"Échec du chargement par parse_and_load_lookup_data: {str(e)}")
             # Continuer avec la méthode standard ci-dessous
     
+    conn = None
     try:
-        # Étape 1: Connexion à Oracle
-        conn = oracledb.connect(
-            user=oracle_config["user"],
-            password=oracle_config["password"],
-            dsn=oracle_config["dsn"]
-        )
+        # Étape 1: Connexion à Oracle (depuis le pool si oracle_config en est un)
+        conn = acquire_connection(oracle_config)
         
         # Étape 2: Créer la table dans Oracle
         success = create_table_from_sqlite(conn, sqlite_path, table_name)
@@ -516,9 +523,6 @@ def load_table_alternative(
         except:
             pass
         
-        # Fermer la connexion
-        conn.close()
-        
         if rows_loaded > 0:
             logger.info(f"Performance: {rows_loaded} lignes chargées en {elapsed_time:.2f} secondes ({rows_per_second} lignes/sec)")
             return True
@@ -527,6 +531,9 @@ def load_table_alternative(
     except Exception as e:
         logger.error(f"Erreur lors du chargement alternatif pour {table_name}: {str(e)}")
         return False
+    finally:
+        if conn is not None:
+            release_connection(oracle_config, conn)
 
 def load_failing_tables(
     oracle_config: Dict[str, str],
@@ -551,7 +558,7 @@ def load_failing_tables(
         
         for table_name in failed_tables:
             # Déterminer si c'est une table volumineuse
-            is_large_table = "ON_TIME" in table_name.upper()
+            is_large_table = is_performance_table(table_name)
             
             # La fonction détecte automatiquement s'il s'agit d'une table de lookup
             is_lookup = table_name.startswith('L_')
@@ -594,67 +601,177 @@ def load_failing_tables(
     
     return results
 
+# Chargeurs spécialisés, choisis d'après un marqueur contenu dans le nom de la table
+_TABLE_LOADERS = (
+    ("ON_TIME", load_performance_table),  # Tables volumineuses de performances des vols
+)
+
+def is_performance_table(table_name: str) -> bool:
+    """
+    Indique si une table doit être chargée par le chargeur des tables volumineuses.
+    
+    Args:
+        table_name: Nom de la table
+        
+    Returns:
+        True si load_performance_table doit être utilisé
+    """
+    return _select_loader(table_name) is load_performance_table
+
+def _select_loader(table_name: str):
+    """Retourne le chargeur adapté à la table (load_table_alternative par défaut)."""
+    name_upper = table_name.upper()
+    return next((loader for marker, loader in _TABLE_LOADERS if marker in name_upper), load_table_alternative)
+
+def _reload_one(
+    oracle_config: Union[Dict[str, str], oracledb.ConnectionPool],
+    sqlite_path: str,
+    table: str,
+    bulk_config: Optional[Dict[str, str]] = None,
+    nologging: bool = False
+) -> bool:
+    """
+    Recharge une table avec le chargeur adapté à son type.
+    
+    Args:
+        oracle_config: Configuration Oracle ou pool de sessions
+        sqlite_path: Chemin vers le fichier SQLite
+        table: Nom de la table à recharger
+        bulk_config: Configuration Oracle pour tenter d'abord un chargement SQL*Loader
+        nologging: Charger les tables volumineuses en chemin direct sans redo
+        
+    Returns:
+        True si le rechargement a réussi, False sinon
+    """
+    logger.info(f"Rechargement de la table {table}")
+    
+    if bulk_config:
+        bulk_status = load_table_sqlldr(bulk_config, sqlite_path, table)
+        if bulk_status is None:
+            # Des lignes partielles restent en base : le chargeur Python les dupliquerait
+            return False
+        if bulk_status:
+            return True
+    
+    loader = _select_loader(table)
+    return loader(oracle_config, sqlite_path, table, nologging=nologging)
+
+# Titres de section du rapport de validation (voir schema_validator.validate_schema)
+_REPORT_SECTION_RE = re.compile(
+    r"^(RÉCAPITULATIF DE LA VALIDATION|TABLES AVEC STRUCTURE SIMPLIFIÉE|DÉTAILS DES PROBLÈMES DE SCHÉMA"
+    r"|DÉTAILS DES DONNÉES MANQUANTES|STATISTIQUES GLOBALES)\s*$"
+)
+_REPORT_TABLE_RE = re.compile(r"^Table: (.+?)\s*$")
+_REPORT_SQLITE_ROWS_RE = re.compile(r"^\s*Lignes dans SQLite: (\d+)")
+_REPORT_ORACLE_ROWS_RE = re.compile(r"^\s*Lignes dans Oracle: (\d+)")
+_REPORT_SIMPLIFIED_RE = re.compile(r"^- (.+?)\s*$")
+
+def _iter_report_tables(report_lines: Iterable[str]) -> Iterator[str]:
+    """
+    Parcourt le rapport de validation ligne par ligne et produit les tables à recharger.
+    
+    Args:
+        report_lines: Lignes du rapport (fichier ouvert ou liste de lignes)
+        
+    Returns:
+        Itérateur sur les noms de tables (avec données manquantes ou structure simplifiée)
+    """
+    section = None
+    table_name = None
+    sqlite_rows = None
+    
+    for line in report_lines:
+        section_match = _REPORT_SECTION_RE.match(line)
+        if section_match:
+            section = section_match.group(1)
+            continue
+        
+        if section == "TABLES AVEC STRUCTURE SIMPLIFIÉE":
+            match = _REPORT_SIMPLIFIED_RE.match(line)
+            if match:
+                logger.info(f"Table identifiée avec structure simplifiée: {match.group(1)}")
+                yield match.group(1)
+        
+        elif section == "DÉTAILS DES DONNÉES MANQUANTES":
+            match = _REPORT_TABLE_RE.match(line)
+            if match:
+                table_name, sqlite_rows = match.group(1), None
+                continue
+            match = _REPORT_SQLITE_ROWS_RE.match(line)
+            if match:
+                sqlite_rows = int(match.group(1))
+                continue
+            match = _REPORT_ORACLE_ROWS_RE.match(line)
+            if match and table_name and sqlite_rows is not None:
+                oracle_rows = int(match.group(1))
+                if oracle_rows < sqlite_rows:
+                    logger.info(f"Table identifiée avec données manquantes: {table_name} ({oracle_rows}/{sqlite_rows} lignes)")
+                    yield table_name
+                table_name = None
+
 # Fonction principale pour recharger les tables manquantes depuis le rapport
-def reload_missing_tables(report_output: str, oracle_config: Dict[str, str], sqlite_path: str) -> Dict[str, bool]:
+def reload_missing_tables(
+    report_output: Union[str, Iterable[str]],
+    oracle_config: Union[Dict[str, str], oracledb.ConnectionPool],
+    sqlite_path: str,
+    jobs: int = 1,
+    bulk_config: Optional[Dict[str, str]] = None,
+    nologging: bool = False
+) -> Dict[str, bool]:
     """
     Recharge les tables manquantes identifiées dans le rapport de validation.
     
     Args:
-        report_output: Texte du rapport de validation
-        oracle_config: Configuration Oracle
+        report_output: Texte du rapport de validation, ou fichier ouvert lu ligne par ligne
+        oracle_config: Configuration Oracle ou pool de sessions (voir get_oracle_pool)
         sqlite_path: Chemin vers le fichier SQLite
+        jobs: Nombre de tables rechargées en parallèle
+        bulk_config: Configuration Oracle pour tenter d'abord un chargement SQL*Loader
+        nologging: Charger les tables volumineuses en chemin direct sans redo
         
     Returns:
         Résultats du rechargement
     """
-    # Extraire les tables avec données manquantes du rapport
-    tables_with_missing_data = []
-    
-    # Rechercher les sections du rapport
-    missing_data_section = re.search(
-        r"DÉTAILS DES DONNÉES MANQUANTES.*?Table: (.*?)\n.*?Lignes dans SQLite: (\d+).*?Lignes dans Oracle: (\d+)",
-        report_output, re.DOTALL
-    )
-    
-    if missing_data_section:
-        table_name = missing_data_section.group(1).strip()
-        sqlite_rows = int(missing_data_section.group(2))
-        oracle_rows = int(missing_data_section.group(3))
-        
-        if oracle_rows < sqlite_rows:
-            tables_with_missing_data.append(table_name)
-            logger.info(f"Table identifiée avec données manquantes: {table_name} ({oracle_rows}/{sqlite_rows} lignes)")
-    
-    # Extraire les tables avec structure simplifiée
-    simplified_tables_section = re.search(r"TABLES AVEC STRUCTURE SIMPLIFIÉE.*?- (.*?)$", report_output, re.MULTILINE)
-    if simplified_tables_section:
-        simplified_tables = re.findall(r"- (.*?)$", simplified_tables_section.group(0), re.MULTILINE)
-        for table in simplified_tables:
-            if table.strip() not in tables_with_missing_data:
-                tables_with_missing_data.append(table.strip())
-                logger.info(f"Table identifiée avec structure simplifiée: {table.strip()}")
+    if isinstance(report_output, str):
+        report_output = report_output.splitlines()
+    
+    # Extraire les tables à recharger du rapport, sans doublons et dans l'ordre du rapport
+    tables_with_missing_data = list(dict.fromkeys(_iter_report_tables(report_output)))
     
     # Recharger les tables manquantes
     if tables_with_missing_data:
         logger.info(f"Tentative de rechargement pour {len(tables_with_missing_data)} tables problématiques")
-        results = {}
-        
-        for table in tables_with_missing_data:
-            logger.info(f"Rechargement de la table {table}")
-            
-            if "ON_TIME" in table.upper():
-                # Utiliser le chargeur spécial pour les tables volumineuses
-                success = load_performance_table(oracle_config, sqlite_path, table)
-            else:
-                # Pour les tables de lookup
-                success = load_table_alternative(oracle_config, sqlite_path, table)
-            
-            results[table] = success
-            
-            if success:
-                logger.info(f"Rechargement réussi pour {table}")
-            else:
-                logger.warning(f"Échec du rechargement pour {table}")
+        # Résultats dans l'ordre du rapport, complétés au fil des fins de chargement
+        results = dict.fromkeys(tables_with_missing_data, False)
+        
+        # Les tables sont indépendantes : chaque thread utilise sa propre session Oracle
+        # et ouvre sa propre connexion SQLite dans le chargeur
+        max_workers = max(1, jobs)
+        if isinstance(oracle_config, oracledb.ConnectionPool) and max_workers > oracle_config.max:
+            # Au-delà de la taille du pool, les threads en trop resteraient bloqués dans
+            # acquire() (POOL_GETMODE_WAIT) sans charger quoi que ce soit
+            logger.warning(f"{max_workers} chargements parallèles demandés, limités à la taille du pool ({oracle_config.max})")
+            max_workers = oracle_config.max
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_reload_one, oracle_config, sqlite_path, table, bulk_config, nologging): table
+                for table in tables_with_missing_data
+            }
+            for future in as_completed(futures):
+                table = futures[future]
+                try:
+                    success = future.result()
+                except Exception as e:
+                    logger.error(f"Erreur lors du rechargement de {table}: {str(e)}")
+                    success = False
+                
+                results[table] = success
+                
+                if success:
+                    logger.info(f"Rechargement réussi pour {table}")
+                else:
+                    logger.warning(f"Échec du rechargement pour {table}")
         
         return results
     
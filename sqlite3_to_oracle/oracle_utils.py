@@ -4,13 +4,289 @@ Module pour interagir avec la base de données Oracle.
 
 import sys
 import re
+import atexit
+import asyncio
+import logging
+import collections
+import concurrent.futures
+import itertools
 import oracledb
 import os
 import time
-from typing import Dict, Optional, Tuple
+import datetime
+import decimal
+import functools
+import contextlib
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import quote_plus
 from . import ORACLE_CONFIG, logger
-from .converter import sanitize_sql_value, validate_numeric_precision
+from .config import is_true_value
+from .converter import validate_numeric_precision
 from .table_utils import sanitize_create_table_statement, process_large_table, diagnose_and_fix_ora_00922
+from .rich_logging import RICH_AVAILABLE, print_title
+
+if RICH_AVAILABLE:
+    from .rich_logging import console, Panel, Syntax
+
+def configure_oracledb_defaults(fetch_lobs: bool = False, arraysize: int = 5000) -> None:
+    """
+    Configure les valeurs par défaut du pilote oracledb pour les transferts volumineux.
+    
+    Avec fetch_lobs=False, les CLOB/BLOB sont renvoyés directement en str/bytes au lieu
+    d'objets LOB nécessitant un aller-retour chacun ; en contrepartie chaque LOB est
+    entièrement chargé en mémoire (à éviter pour des LOB de l'ordre du gigaoctet).
+    Les variables d'environnement ORACLE_FETCH_LOBS et ORACLE_ARRAYSIZE permettent
+    de surcharger ces valeurs.
+    
+    Args:
+        fetch_lobs: Si True, conserve les objets LOB (comportement par défaut d'oracledb)
+        arraysize: Nombre de lignes récupérées par aller-retour lors des fetch (également
+            utilisé pour le préchargement des lignes à l'exécution)
+    """
+    env_fetch_lobs = os.environ.get('ORACLE_FETCH_LOBS')
+    if env_fetch_lobs is not None:
+        fetch_lobs = is_true_value(env_fetch_lobs)
+    
+    env_arraysize = os.environ.get('ORACLE_ARRAYSIZE')
+    if env_arraysize and env_arraysize.isdigit():
+        arraysize = int(env_arraysize)
+    
+    oracledb.defaults.fetch_lobs = fetch_lobs
+    oracledb.defaults.arraysize = arraysize
+    oracledb.defaults.prefetchrows = arraysize
+
+configure_oracledb_defaults()
+
+_NONALNUM_RE = re.compile(r'[^a-zA-Z0-9]')
+_DSN_RE = re.compile(r'^(?P<host>[^:/]+)(?::(?P<port>\d+))?(?:/(?P<svc>.+))?$')
+
+# Bloc PL/SQL anonyme : la suppression et la récupération du code d'erreur
+# se font en un seul aller-retour, sans exception côté Python.
+_DROP_USER_PLSQL = """
+BEGIN
+    EXECUTE IMMEDIATE 'DROP USER ' || DBMS_ASSERT.SIMPLE_SQL_NAME(:username) || ' CASCADE';
+    :error_code := 0;
+EXCEPTION
+    WHEN OTHERS THEN
+        :error_code := SQLCODE;
+        :error_message := SQLERRM;
+END;
+"""
+
+_INSERT_VALUES_RE = re.compile(r'^INSERT\s+INTO\s+(\w+)\s+VALUES\s*\((.*)\)\s*;?\s*$', re.IGNORECASE | re.DOTALL)
+_TO_DATE_RE = re.compile(r"^TO_DATE\(\s*'([^']*)'\s*,\s*'([^']*)'\s*\)$", re.IGNORECASE)
+_ISO_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}$')
+_ISO_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_INSERT_TABLE_RE_BYTES = re.compile(rb'INSERT INTO\s+(\w+)', re.IGNORECASE)
+
+# Correspondance entre les formats TO_DATE générés par le convertisseur et strptime
+_ORACLE_DATE_FORMATS = {
+    'YYYY-MM-DD HH24:MI:SS': '%Y-%m-%d %H:%M:%S',
+    'YYYY-MM-DD': '%Y-%m-%d',
+}
+
+def _split_sql_values(values_str: str) -> List[str]:
+    """
+    Découpe la liste VALUES d'un INSERT en tenant compte des chaînes et des parenthèses.
+    
+    Args:
+        values_str: Contenu entre les parenthèses de la clause VALUES
+        
+    Returns:
+        Liste des littéraux SQL (non interprétés)
+    """
+    tokens = []
+    start = 0
+    depth = 0
+    in_quotes = False
+    
+    for i, char in enumerate(values_str):
+        if char == "'":
+            in_quotes = not in_quotes
+        elif in_quotes:
+            continue
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            tokens.append(values_str[start:i].strip())
+            start = i + 1
+    
+    tokens.append(values_str[start:].strip())
+    return tokens
+
+def _parse_sql_literal(token: str):
+    """
+    Convertit un littéral SQL en valeur Python utilisable comme variable de liaison.
+    
+    Args:
+        token: Littéral SQL (chaîne, nombre, NULL ou TO_DATE)
+        
+    Returns:
+        La valeur Python correspondante
+        
+    Raises:
+        ValueError: Si le littéral n'est pas pris en charge
+    """
+    if token.upper() == 'NULL':
+        return None
+    
+    if len(token) >= 2 and token[0] == "'" and token[-1] == "'":
+        # Les chaînes restent des chaînes : le type de la colonne cible décide
+        # d'une éventuelle conversion en date (voir _coerce_date_columns)
+        return token[1:-1].replace("''", "'")
+    
+    date_match = _TO_DATE_RE.match(token)
+    if date_match:
+        date_format = _ORACLE_DATE_FORMATS.get(date_match.group(2).upper())
+        if date_format is None:
+            raise ValueError(f"Format de date non pris en charge: {date_match.group(2)}")
+        return datetime.datetime.strptime(date_match.group(1), date_format)
+    
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    
+    # Decimal conserve la précision du littéral, comme l'INSERT littéral d'origine
+    try:
+        value = decimal.Decimal(token)
+    except decimal.InvalidOperation:
+        raise ValueError(f"Littéral non pris en charge: {token}")
+    if not value.is_finite():
+        raise ValueError(f"Littéral non pris en charge: {token}")
+    return value
+
+def _parse_insert_row(stmt: str) -> Optional[Tuple[str, tuple]]:
+    """
+    Extrait la table et les valeurs d'une instruction INSERT ... VALUES (...).
+    
+    Args:
+        stmt: Instruction INSERT générée par le convertisseur
+        
+    Returns:
+        Tuple (nom de table en majuscules, valeurs) ou None si l'instruction
+        ne peut pas être transformée en variables de liaison
+    """
+    match = _INSERT_VALUES_RE.match(stmt)
+    if not match:
+        return None
+    
+    try:
+        values = tuple(_parse_sql_literal(token) for token in _split_sql_values(match.group(2)))
+    except ValueError:
+        return None
+    
+    return match.group(1).upper(), values
+
+_NOT_NULL_COLUMNS_SQL = (
+    "SELECT column_name, data_type, nullable FROM user_tab_columns "
+    "WHERE table_name = :table_name ORDER BY column_id"
+)
+
+def _build_not_null_defaults(column_rows) -> Dict[str, Tuple[int, object]]:
+    """
+    Détermine une valeur de substitution pour chaque colonne NOT NULL d'une table.
+    
+    Args:
+        column_rows: Lignes (column_name, data_type, nullable) issues de user_tab_columns
+        
+    Returns:
+        Dictionnaire {nom de colonne: (position, valeur de substitution)}
+    """
+    defaults = {}
+    for position, (column_name, data_type, nullable) in enumerate(column_rows):
+        if nullable != 'N':
+            continue
+        if data_type in ('NUMBER', 'FLOAT', 'BINARY_FLOAT', 'BINARY_DOUBLE', 'INTEGER'):
+            defaults[column_name] = (position, 0)
+        elif data_type == 'DATE' or data_type.startswith('TIMESTAMP'):
+            defaults[column_name] = (position, datetime.datetime.now())
+        else:
+            # Une chaîne vide est considérée comme NULL par Oracle
+            defaults[column_name] = (position, ' ')
+    return defaults
+
+def _build_date_positions(column_rows) -> List[int]:
+    """
+    Détermine les positions des colonnes de type date d'une table.
+    
+    Args:
+        column_rows: Lignes (column_name, data_type, nullable) issues de user_tab_columns
+        
+    Returns:
+        Positions (à partir de 0) des colonnes DATE et TIMESTAMP
+    """
+    return [
+        position for position, (_, data_type, _) in enumerate(column_rows)
+        if data_type == 'DATE' or data_type.startswith('TIMESTAMP')
+    ]
+
+def _get_table_column_rules(cursor, table_name: str) -> Tuple[Dict[str, Tuple[int, object]], List[int]]:
+    """
+    Lit les colonnes d'une table pour préparer les lignes à insérer.
+    
+    Args:
+        cursor: Curseur Oracle
+        table_name: Nom de la table (majuscules)
+        
+    Returns:
+        Tuple (valeurs de substitution des colonnes NOT NULL, positions des colonnes de type date)
+    """
+    cursor.execute(_NOT_NULL_COLUMNS_SQL, table_name=table_name)
+    column_rows = cursor.fetchall()
+    return _build_not_null_defaults(column_rows), _build_date_positions(column_rows)
+
+def _parse_iso_date(value: str):
+    """
+    Convertit une chaîne ISO (date ou date et heure) en datetime.
+    
+    Args:
+        value: Valeur textuelle
+        
+    Returns:
+        Le datetime correspondant, ou la valeur inchangée si elle n'est pas au format ISO
+    """
+    if _ISO_DATETIME_RE.match(value):
+        return datetime.datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
+    if _ISO_DATE_RE.match(value):
+        return datetime.datetime.strptime(value, '%Y-%m-%d')
+    return value
+
+def _coerce_date_columns(row: tuple, date_positions: List[int]) -> tuple:
+    """
+    Convertit en datetime les chaînes ISO destinées aux colonnes de type date.
+    
+    Args:
+        row: Ligne à insérer
+        date_positions: Positions des colonnes DATE/TIMESTAMP de la table cible
+        
+    Returns:
+        La ligne avec des datetime pour ses colonnes de type date
+    """
+    values = list(row)
+    for position in date_positions:
+        if position < len(values) and isinstance(values[position], str):
+            values[position] = _parse_iso_date(values[position])
+    return tuple(values)
+
+def _substitute_nulls(row: tuple, not_null_defaults: Dict[str, Tuple[int, object]]) -> tuple:
+    """
+    Remplace les valeurs NULL des colonnes NOT NULL par leur valeur de substitution.
+    
+    Args:
+        row: Ligne à insérer
+        not_null_defaults: Valeurs de substitution retournées par _get_table_column_rules
+        
+    Returns:
+        La ligne corrigée
+    """
+    values = list(row)
+    for position, default in not_null_defaults.values():
+        if position < len(values) and values[position] is None:
+            values[position] = default
+    return tuple(values)
 
 def check_oracle_connection(config: Dict[str, str]) -> Tuple[bool, str]:
     """
@@ -252,74 +528,459 @@ def create_oracle_user(admin_config, new_username, new_password):
         logger.error(f"Error creating Oracle user: {e}")
         return False
 
-def execute_sql_file(oracle_config: Dict[str, str], sql_file: str, drop_tables: bool = False) -> None:
+def _prepare_rows(rows: List[tuple], not_null_defaults: Dict[str, Tuple[int, object]],
+                  date_positions: List[int]) -> List[tuple]:
     """
-    Exécute un fichier SQL dans Oracle.
+    Adapte les lignes aux colonnes de la table cible avant leur envoi.
+    
+    Les chaînes ISO des colonnes de type date deviennent des datetime et les NULL
+    des colonnes NOT NULL sont remplacés par leur valeur de substitution.
     
     Args:
-        oracle_config: Configuration Oracle cible
-        sql_file: Chemin vers le fichier SQL à exécuter
-        drop_tables: Si True, supprime les tables existantes avant la création
+        rows: Lignes à insérer
+        not_null_defaults: Valeurs de substitution des colonnes NOT NULL
+        date_positions: Positions des colonnes DATE/TIMESTAMP
         
-    Raises:
-        Exception: Si une erreur survient pendant l'exécution
+    Returns:
+        Les lignes prêtes à être envoyées à Oracle
+    """
+    if date_positions:
+        rows = [_coerce_date_columns(row, date_positions) for row in rows]
+    if not not_null_defaults:
+        return rows
+    return [_substitute_nulls(row, not_null_defaults) if None in row else row for row in rows]
+
+def _iter_insert_rows(lines: Iterable[str]) -> Iterator[Tuple[str, Union[tuple, str]]]:
     """
-    import oracledb
+    Parcourt un script SQL ligne par ligne et produit les lignes à insérer.
     
-    # Lire le fichier SQL
-    with open(sql_file, 'r') as f:
-        sql_script = f.read()
+    Les lignes sont transformées en variables de liaison pour permettre l'utilisation
+    de executemany ; les instructions non interprétables sont produites telles quelles
+    (sous forme de chaîne) pour être exécutées individuellement.
     
-    # Identifier les instructions CREATE TABLE et INSERT séparément
-    create_pattern = re.compile(r'CREATE\s+TABLE\s+(\w+)[^;]*;', re.DOTALL | re.IGNORECASE)
-    insert_pattern = re.compile(r'INSERT\s+INTO\s+(\w+)[^;]*;', re.DOTALL | re.IGNORECASE)
+    Args:
+        lines: Lignes du script SQL (fichier ouvert ou liste de lignes)
+        
+    Yields:
+        Tuple (nom de table en majuscules, tuple de valeurs ou instruction littérale)
+    """
+    for line in lines:
+        line = line.strip()
+        if not line or not line.upper().startswith('INSERT INTO'):
+            continue
+        
+        parsed = _parse_insert_row(line)
+        if parsed is not None:
+            yield parsed
+            continue
+        
+        table_match = re.search(r'INSERT INTO\s+(\w+)', line, re.IGNORECASE)
+        if table_match:
+            yield table_match.group(1).upper(), line.rstrip(';')
+
+def _scan_sql_file(sql_file: str) -> Tuple[List[str], Dict[str, List[Tuple[int, int]]]]:
+    """
+    Parcourt un script SQL une seule fois, sans charger les INSERT en mémoire.
     
-    # Extraire toutes les instructions CREATE TABLE
-    create_statements = create_pattern.findall(sql_script)
+    Les instructions autres que les INSERT (CREATE TABLE, index...) sont conservées ;
+    pour chaque table, seules les plages d'octets de ses lignes INSERT sont notées.
+    Les INSERT d'une même table n'ont donc pas besoin d'être consécutifs dans le
+    fichier : une table dont les INSERT sont entrecoupés a simplement plusieurs plages.
+    
+    Args:
+        sql_file: Chemin vers le fichier SQL
+        
+    Returns:
+        Tuple (instructions hors INSERT, {table en majuscules: [(début, fin), ...]})
+    """
+    other_lines = []
+    insert_runs = {}
+    offset = 0
+    with open(sql_file, 'rb') as f:
+        for line in f:
+            start = offset
+            offset += len(line)
+            
+            stripped = line.strip()
+            if not stripped.upper().startswith(b'INSERT INTO'):
+                other_lines.append(line.decode('utf-8', errors='replace'))
+                continue
+            
+            table_match = _INSERT_TABLE_RE_BYTES.match(stripped)
+            if not table_match:
+                continue
+            
+            runs = insert_runs.setdefault(table_match.group(1).decode('ascii').upper(), [])
+            if runs and runs[-1][1] == start:
+                runs[-1] = (runs[-1][0], offset)
+            else:
+                runs.append((start, offset))
     
-    # Sanitiser le script SQL pour les requêtes d'insertion
-    insert_pattern_raw = r"(INSERT INTO \w+\s+VALUES\s*\()([^;]+)(\);)"
+    statements = [stmt.strip() + ";" for stmt in "".join(other_lines).split(';') if stmt.strip()]
+    return statements, insert_runs
+
+def _iter_run_lines(f, runs: List[Tuple[int, int]]) -> Iterator[str]:
+    """
+    Relit ligne par ligne les plages d'un fichier notées par _scan_sql_file.
     
-    def sanitize_insert_values(match):
-        prefix = match.group(1)
-        values_str = match.group(2).strip()
-        suffix = match.group(3)
+    Args:
+        f: Fichier SQL ouvert en mode binaire
+        runs: Plages d'octets (début, fin) à relire
         
-        # S'assurer que les valeurs sont correctement formattées
-        sanitized_values = []
-        current_value = ""
-        in_quotes = False
-        i = 0
+    Yields:
+        Lignes décodées du fichier
+    """
+    for start, end in runs:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode('utf-8', errors='replace')
+
+def _iter_batches(rows: Iterable, batch_size: int) -> Iterator[List]:
+    """
+    Découpe un itérable en lots sans le matérialiser entièrement.
+    
+    Args:
+        rows: Itérable de lignes
+        batch_size: Taille maximale d'un lot
         
-        while i < len(values_str):
-            char = values_str[i]
-            
-            if char == "'" and (i == 0 or values_str[i-1] != '\\'):
-                in_quotes = not in_quotes
-                current_value += char
-            elif char == ',' and not in_quotes:
-                # Traiter la valeur complète
-                sanitized_values.append(sanitize_sql_value(current_value.strip()))
-                current_value = ""
+    Yields:
+        Listes d'au plus batch_size éléments
+    """
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def _build_insert_sql(table_name: str, width: int) -> str:
+    """
+    Construit l'INSERT paramétré d'une ligne de width valeurs.
+    
+    Args:
+        table_name: Nom de la table cible
+        width: Nombre de valeurs de la ligne
+        
+    Returns:
+        Instruction INSERT avec variables de liaison positionnelles
+    """
+    placeholders = ", ".join(f":{n}" for n in range(1, width + 1))
+    return f"INSERT INTO {table_name} VALUES ({placeholders})"
+
+def _insert_rows_individually(cursor, table_name: str, rows: List[Union[tuple, str]],
+                              error_counts: collections.Counter) -> int:
+    """
+    Insère les lignes d'un lot une par une, après l'échec du lot complet.
+    
+    Seules les lignes rejetées par Oracle sont perdues ; elles sont journalisées.
+    
+    Args:
+        cursor: Curseur Oracle
+        table_name: Nom de la table cible
+        rows: Lignes du lot (tuples de variables de liaison ou instructions littérales)
+        error_counts: Compteur des erreurs par code ORA, mis à jour
+        
+    Returns:
+        Nombre de lignes insérées
+    """
+    successes = 0
+    for row in rows:
+        try:
+            if isinstance(row, str):
+                cursor.execute(row)
             else:
-                current_value += char
+                cursor.execute(_build_insert_sql(table_name, len(row)), row)
+            successes += 1
+        except Exception as e:
+            error = e.args[0] if e.args else None
+            error_counts[getattr(error, 'code', None)] += 1
+            logger.debug("Ligne rejetée pour %s: %s - %s", table_name, str(e), row)
+    return successes
+
+def _insert_table_rows(conn, cursor, table_name: str, rows: Iterable[Union[tuple, str]], batch_size: int = 1000) -> int:
+    """
+    Insère les lignes d'une table par lots avec executemany.
+    
+    Les erreurs de ligne sont isolées par batcherrors ; si un lot échoue malgré tout,
+    il est annulé puis rejoué ligne par ligne pour ne perdre que les lignes rejetées.
+    
+    Args:
+        conn: Connexion Oracle
+        cursor: Curseur Oracle
+        table_name: Nom de la table cible
+        rows: Lignes à insérer (tuples de variables de liaison ou instructions littérales)
+        batch_size: Nombre de lignes envoyées par executemany
+        
+    Returns:
+        Nombre de lignes insérées
+    """
+    logger.info(f"Traitement des insertions pour la table {table_name}")
+    
+    successes = 0
+    processed = 0
+    error_counts = collections.Counter()
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    # Les NULL des colonnes NOT NULL sont remplacés avant l'envoi, ce qui évite
+    # la plupart des aller-retours ORA-01400 ; les dates suivent le type des colonnes
+    not_null_defaults, date_positions = _get_table_column_rules(cursor, table_name)
+    
+    for chunk in _iter_batches(rows, batch_size):
+        batch = _prepare_rows([row for row in chunk if not isinstance(row, str)], not_null_defaults, date_positions)
+        literals = [row for row in chunk if isinstance(row, str)]
+        chunk_successes = 0
+        chunk_errors = collections.Counter()
+        
+        try:
+            if batch:
+                insert_sql = _build_insert_sql(table_name, len(batch[0]))
+                
+                cursor.executemany(insert_sql, batch, batcherrors=True)
+                batch_errors = cursor.getbatcherrors()
+                chunk_successes += len(batch) - len(batch_errors)
+                
+                # Seules les lignes en erreur sont examinées ; ORA-01400 est
+                # corrigé par substitution, les doublons (ORA-00001) sont ignorés
+                retry_buf = []
+                for error in batch_errors:
+                    chunk_errors[error.code] += 1
+                    if error.code == 1400:
+                        retry_buf.append(_substitute_nulls(batch[error.offset], not_null_defaults))
+                    elif error.code != 1 and debug_enabled:
+                        logger.debug("Erreur d'insertion dans %s (ligne %d): %s - %s",
+                                     table_name, processed + error.offset + 1, error.code, error.message)
+                
+                if retry_buf:
+                    cursor.executemany(insert_sql, retry_buf, batcherrors=True)
+                    retry_errors = cursor.getbatcherrors()
+                    chunk_successes += len(retry_buf) - len(retry_errors)
+                    for error in retry_errors:
+                        chunk_errors[error.code] += 1
             
-            i += 1
+            for insert_stmt in literals:
+                try:
+                    cursor.execute(insert_stmt)
+                    chunk_successes += 1
+                except oracledb.DatabaseError as e:
+                    chunk_errors[getattr(e.args[0], 'code', None)] += 1
             
-        # Ajouter la dernière valeur
-        if current_value:
-            sanitized_values.append(sanitize_sql_value(current_value.strip()))
+            # Valider le lot
+            conn.commit()
+            if debug_enabled:
+                logger.debug("Lot d'insertions validé pour %s (%d-%d)",
+                             table_name, processed + 1, processed + len(chunk))
+        except Exception as e:
+            logger.warning(f"Échec du lot d'insertions {processed + 1}-{processed + len(chunk)} pour {table_name}, "
+                           f"nouvel essai ligne par ligne: {str(e)}")
+            conn.rollback()
+            chunk_errors = collections.Counter()
+            chunk_successes = _insert_rows_individually(cursor, table_name, batch + literals, chunk_errors)
+            conn.commit()
+        
+        successes += chunk_successes
+        error_counts.update(chunk_errors)
+        processed += len(chunk)
+    
+    logger.info("%s: %d/%d lignes insérées", table_name, successes, processed)
+    if error_counts:
+        logger.info("%s: erreurs par code ORA: %s", table_name, dict(error_counts))
+    
+    return successes
+
+def _load_table_runs(conn, cursor, f, table_name: str, runs: List[Tuple[int, int]], batch_size: int = 1000) -> int:
+    """
+    Charge une table en relisant en flux ses plages de lignes INSERT.
+    
+    Args:
+        conn: Connexion Oracle
+        cursor: Curseur Oracle
+        f: Fichier SQL ouvert en mode binaire
+        table_name: Nom de la table cible
+        runs: Plages d'octets des INSERT de la table, notées par _scan_sql_file
+        batch_size: Nombre de lignes envoyées par executemany
+        
+    Returns:
+        Nombre de lignes insérées
+    """
+    rows = (row for _, row in _iter_insert_rows(_iter_run_lines(f, runs)))
+    return _insert_table_rows(conn, cursor, table_name, rows, batch_size)
+
+def _load_table_from_pool(pool, sql_file: str, table_name: str, runs: List[Tuple[int, int]],
+                          batch_size: int = 1000) -> int:
+    """
+    Charge une table sur une connexion du pool, avec son propre curseur et son propre fichier.
+    
+    Args:
+        pool: Pool de connexions Oracle
+        sql_file: Chemin vers le fichier SQL
+        table_name: Nom de la table cible
+        runs: Plages d'octets des INSERT de la table
+        batch_size: Nombre de lignes envoyées par executemany
+        
+    Returns:
+        Nombre de lignes insérées
+    """
+    with pool.acquire() as conn, open(sql_file, 'rb') as f:
+        cursor = conn.cursor()
+        try:
+            return _load_table_runs(conn, cursor, f, table_name, runs, batch_size)
+        finally:
+            cursor.close()
+
+async def _insert_table_rows_async(executor: concurrent.futures.Executor, pool, sql_file: str, table_name: str,
+                                   runs: List[Tuple[int, int]], batch_size: int = 1000) -> int:
+    """
+    Variante asynchrone de _insert_table_rows : la table est chargée dans un thread
+    de l'exécuteur, avec exactement la même logique de lots et de reprise d'erreurs.
+    
+    Args:
+        executor: Exécuteur dont le nombre de threads borne les tables chargées simultanément
+        pool: Pool de connexions Oracle
+        sql_file: Chemin vers le fichier SQL
+        table_name: Nom de la table cible
+        runs: Plages d'octets des INSERT de la table
+        batch_size: Nombre de lignes envoyées par executemany
+        
+    Returns:
+        Nombre de lignes insérées
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        executor,
+        functools.partial(_load_table_from_pool, pool, sql_file, table_name, runs, batch_size)
+    )
+
+async def execute_sql_file_async(oracle_config: Dict[str, str], sql_file: str, drop_tables: bool = False,
+                                 concurrency: int = 4) -> Set[str]:
+    """
+    Exécute un fichier SQL dans Oracle en chargeant plusieurs tables simultanément.
+    
+    La création des tables reste séquentielle ; seules les insertions sont réparties
+    sur un pool de connexions. Les lignes de chaque table sont relues en flux depuis
+    le fichier, sans que le contenu d'une table soit conservé en mémoire.
+    
+    Args:
+        oracle_config: Configuration Oracle cible
+        sql_file: Chemin vers le fichier SQL à exécuter
+        drop_tables: Si True, supprime les tables existantes avant la création
+        concurrency: Nombre maximal de tables chargées en parallèle
+        
+    Returns:
+        Ensemble des tables créées et chargées
+    """
+    loop = asyncio.get_running_loop()
+    statements, insert_runs = await loop.run_in_executor(None, _scan_sql_file, sql_file)
+    loadable_tables = await loop.run_in_executor(
+        None,
+        functools.partial(_run_sql_statements, oracle_config, sql_file, statements, insert_runs,
+                          drop_tables, load_data=False)
+    )
+    
+    pool = oracledb.create_pool(
+        user=oracle_config["user"],
+        password=oracle_config["password"],
+        dsn=oracle_config["dsn"],
+        min=1,
+        max=concurrency,
+        getmode=oracledb.POOL_GETMODE_WAIT
+    )
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = await asyncio.gather(*[
+                _insert_table_rows_async(executor, pool, sql_file, table_name, runs)
+                for table_name, runs in insert_runs.items()
+                if table_name in loadable_tables
+            ])
+    finally:
+        pool.close()
+    
+    successes = sum(results)
+    if successes > 0:
+        logger.info(f"Insertions réussies: {successes}")
+    
+    await loop.run_in_executor(None, _add_bitmap_indexes, oracle_config, loadable_tables)
+    
+    return loadable_tables
+
+def _add_bitmap_indexes(oracle_config: Dict[str, str], tables: List[str]) -> None:
+    """
+    Ajoute des index bitmap pour améliorer les performances analytiques.
+    
+    Args:
+        oracle_config: Configuration Oracle cible
+        tables: Tables pour lesquelles créer des index
+    """
+    try:
+        from .bitmap_indexes import add_bitmap_indexes_to_database
+        logger.info("Création d'index bitmap pour les tables...")
+        bitmap_results = add_bitmap_indexes_to_database(oracle_config, list(tables))
+        
+        # Afficher un résumé des index bitmap
+        total_indexes = sum(len(indexes) for indexes in bitmap_results.values())
+        successful_indexes = sum(sum(1 for status in indexes.values() if status) for indexes in bitmap_results.values())
+        
+        if total_indexes > 0:
+            logger.info(f"Index bitmap créés: {successful_indexes}/{total_indexes}")
             
-        # Reconstruire l'instruction INSERT avec des valeurs sanitisées
-        return f"{prefix}{', '.join(sanitized_values)}{suffix}"
+            # Afficher le détail des index créés
+            for table, indexes in bitmap_results.items():
+                if indexes:
+                    success_count = sum(1 for status in indexes.values() if status)
+                    logger.info(f"  - Table {table}: {success_count}/{len(indexes)} index bitmap")
+    except Exception as e:
+        logger.warning(f"Impossible de créer les index bitmap: {str(e)}")
+
+def execute_sql_file(oracle_config: Dict[str, str], sql_file: str, drop_tables: bool = False,
+                     load_data: bool = True, use_async: bool = False, concurrency: int = 4) -> Set[str]:
+    """
+    Exécute un fichier SQL dans Oracle.
     
-    # Appliquer la sanitisation
-    sanitized_script = re.sub(insert_pattern_raw, sanitize_insert_values, sql_script, flags=re.DOTALL)
+    Args:
+        oracle_config: Configuration Oracle cible
+        sql_file: Chemin vers le fichier SQL à exécuter
+        drop_tables: Si True, supprime les tables existantes avant la création
+        load_data: Si False, seules les tables sont créées (pas d'insertion ni d'index bitmap)
+        use_async: Si True, les tables sont chargées en parallèle via execute_sql_file_async
+        concurrency: Nombre maximal de tables chargées en parallèle en mode asynchrone
+        
+    Returns:
+        Ensemble des tables créées et prêtes à recevoir des données
+        
+    Raises:
+        Exception: Si une erreur survient pendant l'exécution
+    """
+    if use_async:
+        return asyncio.run(execute_sql_file_async(oracle_config, sql_file, drop_tables, concurrency))
     
-    # Diviser le script en instructions individuelles
-    statements = [stmt.strip() + ";" for stmt in re.split(r';', sanitized_script) if stmt.strip()]
+    # Un seul parcours du fichier : les instructions de schéma sont gardées, les INSERT
+    # sont seulement repérés et seront relus table par table au moment du chargement
+    statements, insert_runs = _scan_sql_file(sql_file)
+    return _run_sql_statements(oracle_config, sql_file, statements, insert_runs, drop_tables, load_data)
+
+def _run_sql_statements(oracle_config: Dict[str, str], sql_file: str, statements: List[str],
+                        insert_runs: Dict[str, List[Tuple[int, int]]], drop_tables: bool = False,
+                        load_data: bool = True) -> Set[str]:
+    """
+    Crée les tables d'un script SQL déjà parcouru par _scan_sql_file, puis les charge.
     
+    Args:
+        oracle_config: Configuration Oracle cible
+        sql_file: Chemin vers le fichier SQL, relu pour les INSERT
+        statements: Instructions hors INSERT du script
+        insert_runs: Plages d'octets des INSERT de chaque table
+        drop_tables: Si True, supprime les tables existantes avant la création
+        load_data: Si False, seules les tables sont créées (pas d'insertion ni d'index bitmap)
+        
+    Returns:
+        Ensemble des tables créées et prêtes à recevoir des données
+    """
     # Se connecter à Oracle
+    conn = cursor = None
     try:
         conn = oracledb.connect(
             user=oracle_config["user"],
@@ -492,97 +1153,20 @@ def execute_sql_file(oracle_config: Dict[str, str], sql_file: str, drop_tables:
                         # (Code omis pour brièveté, mais identique à ce qui précède)
                     
         # Deuxième passe: Traiter les INSERT
-        # Diviser le script en instructions individuelles pour les insertions
-        insert_statements = []
-        current_table = None
-        batch_values = []
-        batch_size = 50  # Nombre d'insertions à traiter en lot
-        
-        # Extraire toutes les instructions INSERT
-        for line in sanitized_script.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-                
-            if line.upper().startswith('INSERT INTO'):
-                # Extraire le nom de la table
-                table_match = re.search(r'INSERT INTO\s+(\w+)', line, re.IGNORECASE)
-                if table_match:
-                    table_name = table_match.group(1).upper()
-                    
-                    # Vérifier si la table est abandonnée
-                    if table_name in abandoned_tables:
+        successes = 0
+        loadable_tables = tables_created - simplified_tables - abandoned_tables
+        
+        if load_data:
+            # Chaque table est chargée une seule fois, en relisant en flux ses seules
+            # plages de lignes INSERT, même si elles sont dispersées dans le fichier
+            with open(sql_file, 'rb') as f:
+                for table_name, runs in insert_runs.items():
+                    # Les tables abandonnées ou simplifiées sont ignorées pour l'instant
+                    if table_name not in loadable_tables:
                         continue
-                        
-                    # Nettoyer l'instruction pour Oracle
-                    clean_insert = line
                     
-                    # Remplacer les dates explicites
-                    if "'" in clean_insert:
-                        # Format ISO date-time
-                        clean_insert = re.sub(r"'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'", 
-                                             r"TO_DATE('\1', 'YYYY-MM-DD HH24:MI:SS')", clean_insert)
-                        # Format ISO date
-                        clean_insert = re.sub(r"'(\d{4}-\d{2}-\d{2})'", 
-                                             r"TO_DATE('\1', 'YYYY-MM-DD')", clean_insert)
-                    
-                    # S'assurer que l'instruction se termine par un point-virgule
-                    if not clean_insert.endswith(';'):
-                        clean_insert += ';'
-                        
-                    insert_statements.append((table_name, clean_insert))
+                    successes += _load_table_runs(conn, cursor, f, table_name, runs)
         
-        # Exécuter les insertions par lots pour chaque table
-        successes = 0
-        table_stats = {}
-        
-        # Grouper les insertions par table
-        table_inserts = {}
-        for table_name, insert_stmt in insert_statements:
-            if table_name not in table_inserts:
-                table_inserts[table_name] = []
-            table_inserts[table_name].append(insert_stmt)
-        
-        # Traiter chaque table séparément
-        for table_name, inserts in table_inserts.items():
-            if table_name in abandoned_tables or table_name not in tables_created:
-                continue
-                
-            logger.info(f"Traitement des insertions pour la table {table_name} ({len(inserts)} insertions)")
-            
-            # Si la table est simplifiée, adapter les insertions
-            if table_name in simplified_tables:
-                continue  # Sauter pour l'instant (peut être traité différemment)
-                
-            # Traiter les insertions par lots
-            for i in range(0, len(inserts), batch_size):
-                batch = inserts[i:i+batch_size]
-                try:
-                    for insert_stmt in batch:
-                        try:
-                            cursor.execute(insert_stmt)
-                            successes += 1
-                        except oracledb.DatabaseError as e:
-                            error_code = getattr(e.args[0], 'code', None)
-                            error_message = str(e)
-                            logger.debug(f"Erreur d'insertion dans {table_name} ({i+1}/{len(inserts)}): {error_code} - {error_message}")
-                            
-                            # Traitement spécifique selon le code d'erreur
-                            if error_code == 1:  # ORA-00001: violation de contrainte unique
-                                continue  # Ignorer les doublons
-                    
-                    # Valider le lot
-                    conn.commit()
-                    logger.debug(f"Lot d'insertions validé pour {table_name} ({i+1}-{min(i+batch_size, len(inserts))}/{len(inserts)})")
-                except Exception as e:
-                    logger.warning(f"Erreur lors du traitement d'un lot d'insertions pour {table_name}: {str(e)}")
-                    conn.rollback()
-            
-            # Statistiques par table
-            if table_name not in table_stats:
-                table_stats[table_name] = 0
-            table_stats[table_name] += len(inserts)
-            
         # Afficher les statistiques finales
         logger.info("Statistiques d'exécution:")
         logger.info(f"  - Tables créées: {len(tables_created)}")
@@ -597,32 +1181,19 @@ def execute_sql_file(oracle_config: Dict[str, str], sql_file: str, drop_tables:
         if successes > 0:
             logger.info(f"Insertions réussies: {successes}")
             
-        # Ajouter des index bitmap pour améliorer les performances analytiques
-        try:
-            from .bitmap_indexes import add_bitmap_indexes_to_database
-            logger.info("Création d'index bitmap pour les tables...")
-            bitmap_results = add_bitmap_indexes_to_database(oracle_config, list(tables_created))
-            
-            # Afficher un résumé des index bitmap
-            total_indexes = sum(len(indexes) for indexes in bitmap_results.values())
-            successful_indexes = sum(sum(1 for status in indexes.values() if status) for indexes in bitmap_results.values())
-            
-            if total_indexes > 0:
-                logger.info(f"Index bitmap créés: {successful_indexes}/{total_indexes}")
-                
-                # Afficher le détail des index créés
-                for table, indexes in bitmap_results.items():
-                    if indexes:
-                        success_count = sum(1 for status in indexes.values() if status)
-                        logger.info(f"  - Table {table}: {success_count}/{len(indexes)} index bitmap")
-        except Exception as e:
-            logger.warning(f"Impossible de créer les index bitmap: {str(e)}")
-            
-        conn.close()
+        if load_data:
+            _add_bitmap_indexes(oracle_config, tables_created)
+        
+        return loadable_tables
         
     except Exception as e:
         logger.error(f"Erreur lors de l'exécution du script SQL: {str(e)}")
         raise
+    finally:
+        if cursor is not None:
+            cursor.close()
+        if conn is not None:
+            conn.close()
 
 def get_sqlalchemy_uri(config):
     """
@@ -634,20 +1205,204 @@ def get_sqlalchemy_uri(config):
     Returns:
         str: URI SQLAlchemy pour se connecter à la base de données Oracle
     """
-    username = config["user"]
-    password = config["password"]
-    dsn = config["dsn"]
+    return _build_uri(config["user"], config["password"], config["dsn"])
+
+@functools.lru_cache(maxsize=32)
+def _build_uri(username: str, password: str, dsn: str) -> str:
+    """
+    Construit (et met en cache) l'URI SQLAlchemy correspondant aux paramètres fournis.
     
-    dsn_parts = dsn.split('/')
-    service_name = dsn_parts[1] if len(dsn_parts) > 1 else ''
+    Args:
+        username: Nom d'utilisateur Oracle
+        password: Mot de passe Oracle
+        dsn: DSN Oracle (host[:port][/service])
+        
+    Returns:
+        L'URI SQLAlchemy
+    """
+    match = _DSN_RE.match(dsn)
+    if match:
+        host = match.group('host')
+        port = match.group('port') or '1521'
+        service_name = match.group('svc') or ''
+    else:
+        host, port, service_name = dsn, '1521', ''
     
-    host_port = dsn_parts[0]
-    host_port_parts = host_port.split(':')
-    host = host_port_parts[0]
-    port = host_port_parts[1] if len(host_port_parts) > 1 else '1521'
+    # Échapper le mot de passe pour supporter les caractères réservés (@, /, :...)
+    password = quote_plus(password)
     
-    uri = f"oracle+oracledb://{username}:{password}@{host}:{port}/{service_name}"
-    return uri
+    return f"oracle+oracledb://{username}:{password}@{host}:{port}/{service_name}"
+
+# Pools de sessions partagés par les chargeurs, par (dsn, user)
+_oracle_pools: Dict[Tuple[str, str], "oracledb.ConnectionPool"] = {}
+
+def get_oracle_pool(oracle_config: Dict[str, str]) -> "oracledb.ConnectionPool":
+    """
+    Retourne le pool de sessions du processus pour cette configuration, créé au premier appel.
+    
+    Args:
+        oracle_config: Configuration Oracle (user, password, dsn)
+        
+    Returns:
+        Pool de sessions Oracle
+    """
+    key = (oracle_config["dsn"], oracle_config["user"])
+    pool = _oracle_pools.get(key)
+    if pool is None:
+        pool = oracledb.create_pool(
+            user=oracle_config["user"],
+            password=oracle_config["password"],
+            dsn=oracle_config["dsn"],
+            min=2,
+            max=max(4, (os.cpu_count() or 1) * 2 + 1),
+            increment=1,
+            getmode=oracledb.POOL_GETMODE_WAIT,
+            wait_timeout=5000,
+            homogeneous=True,
+            stmtcachesize=50
+        )
+        _oracle_pools[key] = pool
+    return pool
+
+def acquire_connection(
+    oracle_source: Union[Dict[str, str], "oracledb.ConnectionPool"]
+) -> "oracledb.Connection":
+    """
+    Obtient une connexion Oracle, prise dans le pool si oracle_source en est un.
+    
+    Args:
+        oracle_source: Pool de sessions ou configuration Oracle (user, password, dsn)
+        
+    Returns:
+        Connexion Oracle, à rendre avec release_connection
+    """
+    if isinstance(oracle_source, oracledb.ConnectionPool):
+        conn = oracle_source.acquire()
+    else:
+        conn = oracledb.connect(
+            user=oracle_source["user"],
+            password=oracle_source["password"],
+            dsn=oracle_source["dsn"]
+        )
+    # Les chargeurs valident explicitement une fois par lot
+    conn.autocommit = False
+    return conn
+
+def release_connection(
+    oracle_source: Union[Dict[str, str], "oracledb.ConnectionPool"],
+    conn: "oracledb.Connection"
+) -> None:
+    """
+    Rend la connexion au pool dont elle provient, ou la ferme.
+    
+    Args:
+        oracle_source: Pool de sessions ou configuration passé à acquire_connection
+        conn: Connexion Oracle à libérer
+    """
+    if isinstance(oracle_source, oracledb.ConnectionPool):
+        oracle_source.release(conn)
+    else:
+        conn.close()
+
+@contextlib.contextmanager
+def get_connection(
+    oracle_source: Union[Dict[str, str], "oracledb.ConnectionPool"]
+) -> Iterator["oracledb.Connection"]:
+    """
+    Gestionnaire de contexte autour de acquire_connection / release_connection.
+    
+    Args:
+        oracle_source: Pool de sessions ou configuration Oracle (user, password, dsn)
+        
+    Returns:
+        Connexion Oracle libérée automatiquement en sortie de bloc
+    """
+    conn = acquire_connection(oracle_source)
+    try:
+        yield conn
+    finally:
+        release_connection(oracle_source, conn)
+
+def set_table_logging(conn: "oracledb.Connection", table_name: str, enabled: bool) -> bool:
+    """
+    Active ou désactive la journalisation (redo) d'une table pour les chargements en chemin direct.
+    
+    Args:
+        conn: Connexion Oracle
+        table_name: Nom de la table
+        enabled: True pour LOGGING, False pour NOLOGGING
+        
+    Returns:
+        True si la modification a été appliquée, False sinon
+    """
+    mode = "LOGGING" if enabled else "NOLOGGING"
+    try:
+        cursor = conn.cursor()
+        cursor.execute(f"ALTER TABLE {table_name} {mode}")
+        cursor.close()
+        logger.debug(f"Table {table_name} passée en {mode}")
+        return True
+    except oracledb.DatabaseError as e:
+        logger.warning(f"Impossible de passer la table {table_name} en {mode}: {str(e)}")
+        return False
+
+@atexit.register
+def _close_oracle_pools() -> None:
+    """Ferme les pools de sessions à l'arrêt de l'interpréteur."""
+    while _oracle_pools:
+        _, pool = _oracle_pools.popitem()
+        try:
+            pool.close(force=True)
+        except Exception:
+            pass
+
+# Connexions administrateur réutilisées entre plusieurs recréations (mode multi-bases)
+_admin_connections: Dict[Tuple[str, str], "oracledb.Connection"] = {}
+
+def _get_admin_connection(admin_config: Dict[str, str]) -> "oracledb.Connection":
+    """
+    Retourne une connexion administrateur mise en cache par (dsn, user).
+    
+    Args:
+        admin_config: Configuration administrateur Oracle (user, password, dsn)
+        
+    Returns:
+        Connexion Oracle ouverte
+    """
+    key = (admin_config["dsn"], admin_config["user"])
+    conn = _admin_connections.get(key)
+    if conn is None:
+        conn = oracledb.connect(
+            user=admin_config["user"],
+            password=admin_config["password"],
+            dsn=admin_config["dsn"]
+        )
+        _admin_connections[key] = conn
+    return conn
+
+def _discard_admin_connection(admin_config: Dict[str, str]) -> None:
+    """
+    Retire (et ferme) la connexion administrateur en cache, par exemple après une erreur.
+    
+    Args:
+        admin_config: Configuration administrateur Oracle (user, password, dsn)
+    """
+    conn = _admin_connections.pop((admin_config.get("dsn"), admin_config.get("user")), None)
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+@atexit.register
+def _close_admin_connections() -> None:
+    """Ferme les connexions administrateur en cache à l'arrêt de l'interpréteur."""
+    while _admin_connections:
+        _, conn = _admin_connections.popitem()
+        try:
+            conn.close()
+        except Exception:
+            pass
 
 def recreate_oracle_user(username: str, password: str, admin_config: Dict[str, str], force_recreate: bool = False) -> None:
     """
@@ -665,44 +1420,52 @@ def recreate_oracle_user(username: str, password: str, admin_config: Dict[str, s
     logger.info(f"Recréation de l'utilisateur {username} demandée...")
     
     try:
-        admin_conn = oracledb.connect(
-            user=admin_config["user"],
-            password=admin_config["password"],
-            dsn=admin_config["dsn"]
-        )
-        cursor = admin_conn.cursor()
-        
-        try:
-            logger.info(f"Suppression de l'utilisateur {username} et de tous ses objets...")
-            cursor.execute(f"DROP USER {username} CASCADE")
-            logger.info(f"Utilisateur {username} supprimé avec succès")
-        except oracledb.DatabaseError as e:
-            error, = e.args
-            error_code = getattr(error, 'code', 'N/A')
-            error_message = getattr(error, 'message', str(error))
-            
-            if "ORA-01918" in str(error):
-                logger.info(f"L'utilisateur {username} n'existe pas, création d'un nouvel utilisateur")
-            elif "ORA-42299" in str(error):
-                from .rich_logging import print_warning_message
-                print_warning_message(f"Problème lors de la suppression de l'utilisateur {username}")
-                logger.warning(f"Erreur Oracle {error_code}: {error_message}")
-                logger.info("Documentation Oracle: https://docs.oracle.com/error-help/db/ora-42299/")
-                logger.info("Tentative de poursuite du processus...")
-            else:
-                from .rich_logging import print_warning_message
-                print_warning_message(f"Avertissement lors de la suppression de l'utilisateur: {error_code}")
-                logger.warning(f"Erreur Oracle: {error_message}")
-        
-        admin_conn.commit()
-        cursor.close()
-        admin_conn.close()
+        admin_conn = _get_admin_connection(admin_config)
+        with admin_conn.cursor() as cursor:
+            _drop_oracle_user(cursor, username)
     except Exception as e:
+        _discard_admin_connection(admin_config)
         from .rich_logging import print_warning_message
         print_warning_message(f"Problème lors de la récréation de l'utilisateur {username}")
         logger.warning(f"Détail: {str(e)}")
         logger.warning("Poursuite du processus...")
 
+def _drop_oracle_user(cursor, username: str) -> None:
+    """
+    Supprime un utilisateur Oracle et journalise le résultat.
+    
+    Args:
+        cursor: Curseur sur une connexion administrateur
+        username: Nom de l'utilisateur à supprimer
+    """
+    logger.info(f"Suppression de l'utilisateur {username} et de tous ses objets...")
+    error_code_var = cursor.var(int)
+    error_message_var = cursor.var(str)
+    cursor.execute(
+        _DROP_USER_PLSQL,
+        username=username,
+        error_code=error_code_var,
+        error_message=error_message_var
+    )
+    error_code = error_code_var.getvalue() or 0
+    error_message = error_message_var.getvalue() or ""
+    
+    if error_code == 0:
+        logger.info(f"Utilisateur {username} supprimé avec succès")
+    elif error_code == -1918:
+        logger.info(f"L'utilisateur {username} n'existe pas, création d'un nouvel utilisateur")
+    elif error_code == -42299:
+        from .rich_logging import print_warning_message
+        print_warning_message(f"Problème lors de la suppression de l'utilisateur {username}")
+        logger.warning(f"Erreur Oracle {error_code}: {error_message}")
+        logger.info("Documentation Oracle: https://docs.oracle.com/error-help/db/ora-42299/")
+        logger.info("Tentative de poursuite du processus...")
+    else:
+        from .rich_logging import print_warning_message
+        print_warning_message(f"Avertissement lors de la suppression de l'utilisateur: {error_code}")
+        logger.warning(f"Erreur Oracle: {error_message}")
+
+@functools.lru_cache(maxsize=128)
 def get_oracle_username_from_filepath(db_path: str) -> str:
     """
     Détermine un nom d'utilisateur Oracle valide à partir d'un chemin de fichier.
@@ -713,13 +1476,10 @@ def get_oracle_username_from_filepath(db_path: str) -> str:
     Returns:
         Un nom d'utilisateur Oracle valide
     """
-    import os
-    import re
-    
     db_filename = os.path.basename(db_path)
     db_name = os.path.splitext(db_filename)[0]
     
-    oracle_username = re.sub(r'[^a-zA-Z0-9]', '', db_name).lower()
+    oracle_username = _NONALNUM_RE.sub('', db_name).lower()
     
     if not oracle_username or not oracle_username[0].isalpha():
         oracle_username = f"db{oracle_username}"
@@ -728,6 +1488,30 @@ def get_oracle_username_from_filepath(db_path: str) -> str:
     
     return oracle_username
 
+_SQLALCHEMY_EXAMPLE_TEMPLATE = """from sqlalchemy import create_engine
+
+engine = create_engine("{uri}")
+
+with engine.connect() as connection:
+    result = connection.execute("SELECT * FROM <table_name>")
+    for row in result:
+        print(row)
+"""
+
+@functools.lru_cache(maxsize=32)
+def _render_example(sqlalchemy_uri: str):
+    """
+    Construit (une seule fois par URI) le bloc Syntax de l'exemple SQLAlchemy.
+    
+    Args:
+        sqlalchemy_uri: URI SQLAlchemy à intégrer dans l'exemple
+        
+    Returns:
+        Objet rich.syntax.Syntax prêt à être affiché
+    """
+    example_code = _SQLALCHEMY_EXAMPLE_TEMPLATE.format(uri=sqlalchemy_uri)
+    return Syntax(example_code, "python", theme="monokai", line_numbers=True)
+
 def display_sqlalchemy_info(user_config: Dict[str, str], print_example: bool = True) -> str:
     """
     Génère et affiche les informations de connexion SQLAlchemy.
@@ -739,8 +1523,6 @@ def display_sqlalchemy_info(user_config: Dict[str, str], print_example: bool = T
     Returns:
         L'URI SQLAlchemy généré
     """
-    from .rich_logging import print_title, RICH_AVAILABLE
-    
     sqlalchemy_uri = get_sqlalchemy_uri(user_config)
     
     logger.info("Connexion à la base de données via SQLAlchemy générée")
@@ -749,48 +1531,16 @@ def display_sqlalchemy_info(user_config: Dict[str, str], print_example: bool = T
         print_title("Informations de connexion SQLAlchemy")
         
         if RICH_AVAILABLE:
-            try:
-                from rich.syntax import Syntax
-                from rich.console import Console
-                from rich.panel import Panel
-                
-                console = Console()
-                
-                console.print("[bold cyan]SQLAlchemy URI:[/bold cyan]")
-                console.print(Panel(sqlalchemy_uri, expand=False, border_style="cyan"))
-                
-                example_code = f"""from sqlalchemy import create_engine
-
-engine = create_engine("{sqlalchemy_uri}")
-
-with engine.connect() as connection:
-    result = connection.execute("SELECT * FROM <table_name>")
-    for row in result:
-        print(row)
-"""
-                print("\n[bold cyan]Exemple de code Python:[/bold cyan]")
-                syntax = Syntax(example_code, "python", theme="monokai", line_numbers=True)
-                console.print(syntax)
-                
-            except ImportError:
-                print("\nPour vous connecter à cette base de données avec SQLAlchemy, utilisez l'URI suivant:")
-                print(f"SQLAlchemy URI: {sqlalchemy_uri}")
-                print("\nExemple de code Python:")
-                print(example_code)
+            console.print("[bold cyan]SQLAlchemy URI:[/bold cyan]")
+            console.print(Panel(sqlalchemy_uri, expand=False, border_style="cyan"))
+            
+            console.print("\n[bold cyan]Exemple de code Python:[/bold cyan]")
+            console.print(_render_example(sqlalchemy_uri))
         else:
             print("\nPour vous connecter à cette base de données avec SQLAlchemy, utilisez l'URI suivant:")
             print(f"SQLAlchemy URI: {sqlalchemy_uri}")
             print("\nExemple de code Python:")
-            print(f"""
-from sqlalchemy import create_engine
-
-engine = create_engine("{sqlalchemy_uri}")
-
-with engine.connect() as connection:
-    result = connection.execute("SELECT * FROM <table_name>")
-    for row in result:
-        print(row)
-""")
+            print("\n" + _SQLALCHEMY_EXAMPLE_TEMPLATE.format(uri=sqlalchemy_uri))
     
     return sqlalchemy_uri
 
@@ -8,41 +8,122 @@ import oracledb
 import re
 import time
 import os
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Tuple, Any, Union
 from . import logger
+from .oracle_utils import acquire_connection, release_connection, set_table_logging
+from .sqlite_utils import open_sqlite_readonly
+
+def _insert_batch(
+    oracle_conn: oracledb.Connection,
+    cursor: oracledb.Cursor,
+    insert_sql: str,
+    batch: List[List[Any]],
+    log_errors_sql: Optional[str] = None
+) -> Tuple[int, int]:
+    """
+    Insère un lot en un seul appel executemany puis valide la transaction.
+    
+    Les lignes rejetées par Oracle sont écartées via batcherrors au lieu de
+    faire échouer tout le lot (et de réessayer ligne par ligne).
+    
+    Args:
+        oracle_conn: Connexion Oracle
+        cursor: Curseur Oracle
+        insert_sql: Instruction INSERT avec variables de liaison
+        batch: Lignes à insérer
+        log_errors_sql: Variante LOG ERRORS de l'INSERT, si une table d'erreurs existe
+        
+    Returns:
+        Tuple (lignes insérées, lignes ignorées)
+    """
+    if log_errors_sql:
+        try:
+            cursor.executemany(log_errors_sql, batch)
+            oracle_conn.commit()
+            return len(batch), 0
+        except Exception as e:
+            logger.warning(f"Échec d'insertion par lot avec LOG ERRORS: {e}")
+            oracle_conn.rollback()
+    
+    try:
+        cursor.executemany(insert_sql, batch, batcherrors=True)
+        errors = cursor.getbatcherrors()
+        oracle_conn.commit()
+    except Exception as e:
+        logger.warning(f"Échec d'insertion par lot: {e}")
+        oracle_conn.rollback()
+        return 0, len(batch)
+    
+    # Limiter le nombre de messages d'erreur
+    for error in errors[:10]:
+        logger.debug(f"Ligne {error.offset} du lot rejetée: {error.message}")
+    
+    return len(batch) - len(errors), len(errors)
+
+def _to_varchar(value: Any) -> Any:
+    """Convertit les nombres en chaînes pour une colonne VARCHAR2."""
+    if isinstance(value, (float, int)):
+        return str(value)
+    return value
+
+def _to_number(value: Any) -> Any:
+    """Convertit les chaînes numériques en nombres pour une colonne NUMBER."""
+    if isinstance(value, str) and value.strip():
+        try:
+            return float(value)
+        except ValueError:
+            # Si la conversion échoue, laisser la valeur comme chaîne
+            return value
+    return value
+
+def _column_converter(oracle_type: str):
+    """
+    Retourne la fonction de conversion à appliquer aux valeurs d'une colonne.
+    
+    Args:
+        oracle_type: Type Oracle de la colonne cible (data_type de user_tab_columns)
+        
+    Returns:
+        Fonction de conversion, ou None si la valeur peut être passée telle quelle
+    """
+    if oracle_type == 'VARCHAR2':
+        return _to_varchar
+    if oracle_type.startswith('NUMBER'):
+        return _to_number
+    return None
 
 def load_performance_table(
-    oracle_config: Dict[str, str],
+    oracle_config: Union[Dict[str, str], oracledb.ConnectionPool],
     sqlite_path: str, 
     table_name: str,
     use_varchar_for_decimals: bool = True,
     batch_size: int = 10000,
-    enable_parallel: bool = True
+    enable_parallel: bool = True,
+    nologging: bool = False
 ) -> bool:
     """
     Fonction spécialisée pour charger la table de performance des vols.
     Cette fonction traite correctement les types décimaux/flottants et gère le grand volume de données.
     
     Args:
-        oracle_config: Configuration Oracle
+        oracle_config: Configuration Oracle ou pool de sessions (voir get_oracle_pool)
         sqlite_path: Chemin vers le fichier SQLite
         table_name: Nom de la table à charger
         use_varchar_for_decimals: Si True, utilise VARCHAR2 au lieu de NUMBER pour les décimaux
         batch_size: Nombre de lignes à traiter par lot
         enable_parallel: Activer le chargement parallèle si possible
+        nologging: Charger en chemin direct sans redo (table en NOLOGGING le temps du chargement)
         
     Returns:
         True si le chargement a réussi, False sinon
     """
     logger.info(f"Chargement spécialisé pour la table volumineuse {table_name}")
     
+    oracle_conn = None
+    nologging_enabled = False
     try:
-        # Connexion à Oracle
-        oracle_conn = oracledb.connect(
-            user=oracle_config["user"],
-            password=oracle_config["password"],
-            dsn=oracle_config["dsn"]
-        )
+        # Connexion à Oracle (depuis le pool si oracle_config en est un)
+        oracle_conn = acquire_connection(oracle_config)
         
         # Vérifier si le chargement parallèle est possible
         parallel_enabled = False
@@ -78,7 +159,7 @@ def load_performance_table(
         # Si la table n'existe pas, la créer avec les types adaptés
         if not existing_columns:
             # Connexion à SQLite pour récupérer la structure
-            sqlite_conn = sqlite3.connect(sqlite_path)
+            sqlite_conn = open_sqlite_readonly(sqlite_path)
             sqlite_cursor = sqlite_conn.cursor()
             
             # Récupérer la structure de la table
@@ -194,9 +275,12 @@ def load_performance_table(
         
         # Charger les données en lots avec mesure de performance
         start_time = time.time()
-        sqlite_conn = sqlite3.connect(sqlite_path)
+        sqlite_conn = open_sqlite_readonly(sqlite_path)
         sqlite_cursor = sqlite_conn.cursor()
         
+        # Une seule transaction de lecture côté SQLite pour toute l'extraction
+        sqlite_cursor.execute("BEGIN")
+        
         # Récupérer le nombre total de lignes pour le log
         sqlite_cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
         total_rows = sqlite_cursor.fetchone()[0]
@@ -270,107 +354,93 @@ def load_performance_table(
         logger.info(f"Début du chargement pour {table_name} ({total_rows} lignes à traiter)")
         progress_interval = max(1, total_rows // 20)  # 5% du progrès
         
-        # Utiliser l'API d'itération pour économiser la mémoire
-        sqlite_cursor.execute(f"SELECT * FROM {table_name}")
+        # Plan de conversion calculé une fois par colonne plutôt qu'à chaque valeur
+        converters = [
+            (i, converter)
+            for i, converter in enumerate(
+                _column_converter(column_types.get(col.upper(), 'VARCHAR2')) for col in columns_to_use
+            )
+            if converter is not None
+        ]
+        
+        # Lire la source par blocs de la taille d'un lot (une seule requête SELECT),
+        # en ne sélectionnant que les colonnes présentes dans Oracle
+        sqlite_cursor.execute(f"SELECT {', '.join(columns_to_use)} FROM {table_name}")
         
-        batch = []
         oracle_cursor = oracle_conn.cursor()
         
         # Optimiser pour Oracle
         oracle_cursor.arraysize = adaptive_batch_size
         
-        for i, row in enumerate(sqlite_cursor):
-            # Créer un tuple avec seulement les colonnes existantes dans Oracle
-            filtered_row = []
-            for j, col in enumerate(columns):
-                if col.upper() in existing_columns:
-                    value = row[j]
-                    
-                    # Traitement adapté au type cible dans Oracle
-                    col_type = column_types.get(col.upper(), 'VARCHAR2')
-                    
-                    if value is None:
-                        # NULL reste NULL quel que soit le type
-                        filtered_row.append(None)
-                    elif col_type == 'VARCHAR2' and isinstance(value, (float, int)):
-                        # Pour les colonnes VARCHAR2, convertir les nombres en chaînes
-                        filtered_row.append(str(value))
-                    elif col_type.startswith('NUMBER') and isinstance(value, str) and value.strip():
-                        # Pour les colonnes NUMBER, essayer de convertir les chaînes en nombres
-                        try:
-                            filtered_row.append(float(value))
-                        except:
-                            # Si la conversion échoue, laisser la valeur comme chaîne
-                            filtered_row.append(value)
-                    else:
-                        # Utiliser la valeur telle quelle
-                        filtered_row.append(value)
+        # Texte SQL constant : Oracle analyse l'INSERT une fois et le réutilise pour chaque lot
+        log_errors_sql = None
+        if array_dml_errors_supported:
+            # Utiliser LOG ERRORS pour capturer les erreurs sans interrompre le processus
+            log_errors_sql = f"{insert_sql} LOG ERRORS INTO {error_logging_table} ('RELOAD') REJECT LIMIT UNLIMITED"
+        
+        # Insertion en chemin direct (APPEND_VALUES) sur une table sans journalisation
+        direct_sql = None
+        if nologging:
+            nologging_enabled = set_table_logging(oracle_conn, table_name, False)
+            if nologging_enabled:
+                hints = "APPEND_VALUES ENABLE_PARALLEL_DML" if parallel_enabled else "APPEND_VALUES"
+                direct_sql = f"INSERT /*+ {hints} */" + insert_sql[insert_sql.index(" INTO "):]
+                logger.warning(f"Table {table_name} en NOLOGGING : une sauvegarde est recommandée après le chargement")
+        
+        rows_read = 0
+        next_progress = progress_interval
+        
+        while True:
+            rows = sqlite_cursor.fetchmany(adaptive_batch_size)
+            if not rows:
+                break
             
-            # Ajouter la ligne au lot
-            batch.append(filtered_row)
+            if converters:
+                batch = []
+                for row in rows:
+                    values = list(row)
+                    # NULL reste NULL quel que soit le type
+                    for i, converter in converters:
+                        value = values[i]
+                        if value is not None:
+                            values[i] = converter(value)
+                    batch.append(values)
+            else:
+                # Aucune conversion nécessaire : les tuples SQLite sont liés directement
+                batch = rows
             
-            # Insérer le lot lorsqu'il atteint la taille souhaitée
-            if len(batch) >= adaptive_batch_size:
+            inserted = None
+            if direct_sql:
+                # Le chemin direct ne supporte pas batcherrors : au premier échec, revenir
+                # définitivement à l'insertion conventionnelle
                 try:
-                    if array_dml_errors_supported:
-                        # Utiliser LOG ERRORS pour capturer les erreurs sans interrompre le processus
-                        modified_sql = f"{insert_sql} LOG ERRORS INTO {error_logging_table} ('BATCH_{i}') REJECT LIMIT UNLIMITED"
-                        oracle_cursor.executemany(modified_sql, batch)
-                    else:
-                        oracle_cursor.executemany(insert_sql, batch)
-                    
+                    oracle_cursor.executemany(direct_sql, batch)
                     oracle_conn.commit()
-                    total_inserted += len(batch)
+                    inserted, rejected = len(batch), 0
                 except Exception as e:
-                    logger.warning(f"Échec d'insertion par lot: {e}")
-                    # Essayer ligne par ligne
-                    for row_idx, row_data in enumerate(batch):
-                        try:
-                            oracle_cursor.execute(insert_sql, row_data)
-                            oracle_conn.commit()
-                            total_inserted += 1
-                        except Exception as row_e:
-                            skipped += 1
-                            if skipped < 10:  # Limiter le nombre de messages d'erreur
-                                logger.debug(f"Échec d'insertion individuelle (ligne {i-len(batch)+row_idx+1}): {row_e}")
-                
-                # Vider le lot
-                batch = []
-                
-                # Afficher le progrès
-                if i % progress_interval == 0:
-                    elapsed = time.time() - start_time
-                    rows_per_sec = int(i / elapsed) if elapsed > 0 else 0
-                    estimated_total = (elapsed / i) * total_rows if i > 0 else 0
-                    estimated_remaining = estimated_total - elapsed
-                    
-                    logger.info(
-                        f"Progression: {i}/{total_rows} lignes ({(i/total_rows)*100:.1f}%) - "
-                        f"{rows_per_sec} lignes/sec - "
-                        f"Temps restant estimé: {int(estimated_remaining/60)}:{int(estimated_remaining%60):02d}"
-                    )
-        
-        # Traiter le dernier lot s'il y en a un
-        if batch:
-            try:
-                if array_dml_errors_supported:
-                    modified_sql = f"{insert_sql} LOG ERRORS INTO {error_logging_table} ('BATCH_FINAL') REJECT LIMIT UNLIMITED"
-                    oracle_cursor.executemany(modified_sql, batch)
-                else:
-                    oracle_cursor.executemany(insert_sql, batch)
+                    logger.warning(f"Échec de l'insertion en chemin direct, retour à l'insertion classique: {e}")
+                    oracle_conn.rollback()
+                    direct_sql = None
+            
+            if inserted is None:
+                inserted, rejected = _insert_batch(oracle_conn, oracle_cursor, insert_sql, batch, log_errors_sql)
+            total_inserted += inserted
+            skipped += rejected
+            rows_read += len(rows)
+            
+            # Afficher le progrès
+            if rows_read >= next_progress:
+                next_progress = rows_read + progress_interval
+                elapsed = time.time() - start_time
+                rows_per_sec = int(rows_read / elapsed) if elapsed > 0 else 0
+                estimated_total = (elapsed / rows_read) * total_rows
+                estimated_remaining = max(0, estimated_total - elapsed)
                 
-                oracle_conn.commit()
-                total_inserted += len(batch)
-            except Exception as e:
-                logger.warning(f"Échec d'insertion du dernier lot: {e}")
-                # Essayer ligne par ligne
-                for row in batch:
-                    try:
-                        oracle_cursor.execute(insert_sql, row)
-                        oracle_conn.commit()
-                        total_inserted += 1
-                    except:
-                        skipped += 1
+                logger.info(
+                    f"Progression: {rows_read}/{total_rows} lignes ({(rows_read/total_rows)*100:.1f}%) - "
+                    f"{rows_per_sec} lignes/sec - "
+                    f"Temps restant estimé: {int(estimated_remaining/60)}:{int(estimated_remaining%60):02d}"
+                )
         
         # Vérifier les erreurs enregistrées si le log d'erreurs est activé
         if array_dml_errors_supported:
@@ -395,7 +465,6 @@ def load_performance_table(
         
         # Fermer les curseurs et connexions
         oracle_cursor.close()
-        oracle_conn.close()
         sqlite_cursor.close()
         sqlite_conn.close()
         
@@ -414,3 +483,8 @@ def load_performance_table(
     except Exception as e:
         logger.error(f"Erreur lors du chargement de la table {table_name}: {str(e)}")
         return False
+    finally:
+        if oracle_conn is not None:
+            if nologging_enabled:
+                set_table_logging(oracle_conn, table_name, True)
+            release_connection(oracle_config, oracle_conn)
@@ -15,6 +15,7 @@ try:
     from rich.progress import Progress, TaskID, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
     from rich.style import Style
     from rich.panel import Panel
+    from rich.syntax import Syntax
     from rich.theme import Theme
     RICH_AVAILABLE = True
 except ImportError:
@@ -181,8 +182,14 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     logger = logging.getLogger(name)
     logger.setLevel(level)
     
+    # Handler déjà en place et sans filtre de niveau propre : seul le niveau du logger change
+    handler_class = RichHandler if RICH_AVAILABLE else logging.StreamHandler
+    handlers = logger.handlers
+    if len(handlers) == 1 and type(handlers[0]) is handler_class and handlers[0].level == logging.NOTSET:
+        return logger
+    
     # Supprimer les handlers existants
-    for handler in logger.handlers[:]:
+    for handler in handlers[:]:
         logger.removeHandler(handler)
     
     # Configurer avec rich si disponible
@@ -2,35 +2,132 @@
 Module pour valider l'importation du schéma et des données dans Oracle.
 """
 
+import sys
+import atexit
 import oracledb
 import sqlite3
 import re
 import datetime
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Any, Optional
 from . import logger
 from .rich_logging import print_title, print_success_message, print_error_message, print_warning_message, RICH_AVAILABLE
 from .converter import sanitize_sql_value
 
-def connect_to_oracle(config: Dict[str, str]) -> Tuple[Optional[oracledb.Connection], Optional[str]]:
+# Taille éventuelle d'un type, ex. VARCHAR(255) ou NUMBER(10,2)
+_PAREN_RE = re.compile(r'\([^)]*\)')
+
+_SQLITE_TABLES_SQL = "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+_SQLITE_SCHEMAS_SQL = """
+    SELECT m.name, p.name, p.type
+    FROM sqlite_master m JOIN pragma_table_info(m.name) p
+    WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%'
+    ORDER BY m.name, p.cid
+"""
+
+# Pools de sessions Oracle réutilisés entre les appels à run_validation, par (dsn, user)
+_oracle_pools: Dict[Tuple[str, str], oracledb.ConnectionPool] = {}
+
+def _init_session(connection: oracledb.Connection, requested_tag: Optional[str]) -> None:
+    """
+    Initialise une nouvelle session du pool (appelé une seule fois par session).
+    
+    Args:
+        connection: Connexion Oracle nouvellement créée
+        requested_tag: Étiquette demandée (non utilisée)
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("ALTER SESSION SET NLS_DATE_FORMAT = 'YYYY-MM-DD HH24:MI:SS'")
+
+def _get_oracle_pool(config: Dict[str, str]) -> oracledb.ConnectionPool:
     """
-    Établit une connexion à la base de données Oracle.
+    Retourne le pool de sessions associé à la configuration, en le créant au premier appel.
     
     Args:
         config: Configuration Oracle (user, password, dsn)
         
     Returns:
-        Tuple contenant (connexion, message d'erreur)
+        Pool de sessions Oracle
     """
-    try:
-        conn = oracledb.connect(
+    key = (config["dsn"], config["user"])
+    pool = _oracle_pools.get(key)
+    if pool is None:
+        pool = oracledb.create_pool(
             user=config["user"],
             password=config["password"],
-            dsn=config["dsn"]
+            dsn=config["dsn"],
+            min=1,
+            max=8,
+            increment=1,
+            stmtcachesize=40,
+            session_callback=_init_session
         )
+        _oracle_pools[key] = pool
+    return pool
+
+def _release_oracle_connection(config: Dict[str, str], conn: oracledb.Connection) -> None:
+    """
+    Rend au pool une connexion obtenue via connect_to_oracle.
+    
+    Args:
+        config: Configuration Oracle utilisée pour obtenir la connexion
+        conn: Connexion Oracle à libérer
+    """
+    pool = _oracle_pools.get((config["dsn"], config["user"]))
+    if pool is not None:
+        pool.release(conn)
+    else:
+        conn.close()
+
+@atexit.register
+def _close_oracle_pools() -> None:
+    """Ferme les pools de sessions à l'arrêt de l'interpréteur."""
+    while _oracle_pools:
+        _, pool = _oracle_pools.popitem()
+        try:
+            pool.close(force=True)
+        except Exception:
+            pass
+
+def connect_to_oracle(config: Dict[str, str]) -> Tuple[Optional[oracledb.Connection], Optional[str]]:
+    """
+    Établit une connexion à la base de données Oracle depuis un pool de sessions réutilisable.
+    
+    Args:
+        config: Configuration Oracle (user, password, dsn)
+        
+    Returns:
+        Tuple contenant (connexion, message d'erreur)
+    """
+    try:
+        conn = _get_oracle_pool(config).acquire()
         return conn, None
     except Exception as e:
+        pool = _oracle_pools.pop((config.get("dsn"), config.get("user")), None)
+        if pool is not None:
+            try:
+                pool.close(force=True)
+            except Exception:
+                pass
         return None, str(e)
 
+def _bulk_cursor(conn: oracledb.Connection, arraysize: int = 1000) -> oracledb.Cursor:
+    """
+    Crée un curseur Oracle configuré pour récupérer beaucoup de lignes par aller-retour.
+    
+    Args:
+        conn: Connexion Oracle
+        arraysize: Nombre de lignes récupérées par fetch
+        
+    Returns:
+        Curseur configuré
+    """
+    cursor = conn.cursor()
+    cursor.arraysize = arraysize
+    cursor.prefetchrows = arraysize + 1
+    return cursor
+
 def connect_to_sqlite(sqlite_path: str) -> Tuple[Optional[sqlite3.Connection], Optional[str]]:
     """
     Établit une connexion à la base de données SQLite.
@@ -42,7 +139,7 @@ def connect_to_sqlite(sqlite_path: str) -> Tuple[Optional[sqlite3.Connection], O
         Tuple contenant (connexion, message d'erreur)
     """
     try:
-        conn = sqlite3.connect(sqlite_path)
+        conn = sqlite3.connect(sqlite_path, cached_statements=200)
         return conn, None
     except Exception as e:
         return None, str(e)
@@ -58,7 +155,7 @@ def get_sqlite_tables(conn: sqlite3.Connection) -> List[str]:
         Liste des noms de tables
     """
     cursor = conn.cursor()
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+    cursor.execute(_SQLITE_TABLES_SQL)
     tables = [row[0] for row in cursor.fetchall()]
     cursor.close()
     return tables
@@ -73,7 +170,7 @@ def get_oracle_tables(conn: oracledb.Connection) -> List[str]:
     Returns:
         Liste des noms de tables
     """
-    cursor = conn.cursor()
+    cursor = _bulk_cursor(conn)
     cursor.execute("SELECT table_name FROM user_tables")
     tables = [row[0] for row in cursor.fetchall()]
     cursor.close()
@@ -91,8 +188,8 @@ def get_sqlite_table_schema(conn: sqlite3.Connection, table: str) -> List[Tuple[
         Liste de tuples (nom_colonne, type_colonne)
     """
     cursor = conn.cursor()
-    cursor.execute(f"PRAGMA table_info({table})")
-    columns = [(row[1], row[2]) for row in cursor.fetchall()]
+    cursor.execute("SELECT name, type FROM pragma_table_info(?) ORDER BY cid", (table,))
+    columns = cursor.fetchall()
     cursor.close()
     return columns
 
@@ -107,12 +204,12 @@ def get_oracle_table_schema(conn: oracledb.Connection, table: str) -> List[Tuple
     Returns:
         Liste de tuples (nom_colonne, type_colonne)
     """
-    cursor = conn.cursor()
-    cursor.execute(f"""
+    cursor = _bulk_cursor(conn)
+    cursor.execute("""
         SELECT column_name, data_type
         FROM user_tab_columns
-        WHERE table_name = '{table.upper()}'
-    """)
+        WHERE table_name = :t
+    """, {"t": table.upper()})
     columns = [(row[0], row[1]) for row in cursor.fetchall()]
     cursor.close()
     return columns
@@ -129,7 +226,7 @@ def get_sqlite_row_count(conn: sqlite3.Connection, table: str) -> int:
         Nombre de lignes
     """
     cursor = conn.cursor()
-    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table)}")
     count = cursor.fetchone()[0]
     cursor.close()
     return count
@@ -146,11 +243,244 @@ def get_oracle_row_count(conn: oracledb.Connection, table: str) -> int:
         Nombre de lignes
     """
     cursor = conn.cursor()
-    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+    # Le nom de table ne peut pas être lié : il est normalisé pour garder un texte SQL stable
+    cursor.execute(f"SELECT COUNT(*) FROM {_quote_identifier(table.upper())}")
     count = cursor.fetchone()[0]
     cursor.close()
     return count
 
+def get_sqlite_schemas(conn: sqlite3.Connection) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Récupère le schéma de toutes les tables SQLite en une seule requête.
+    
+    Args:
+        conn: Connexion SQLite
+        
+    Returns:
+        Dictionnaire {table: liste de tuples (nom_colonne, type_colonne)}
+    """
+    cursor = conn.cursor()
+    cursor.execute(_SQLITE_SCHEMAS_SQL)
+    schemas = {}
+    for table, column, column_type in cursor.fetchall():
+        schemas.setdefault(table, []).append((column, column_type))
+    cursor.close()
+    return schemas
+
+def get_oracle_schemas(conn: oracledb.Connection) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Récupère le schéma de toutes les tables Oracle de l'utilisateur en une seule requête.
+    
+    Args:
+        conn: Connexion Oracle
+        
+    Returns:
+        Dictionnaire {table: liste de tuples (nom_colonne, type_colonne)}
+    """
+    cursor = _bulk_cursor(conn, arraysize=5000)
+    cursor.execute("""
+        SELECT table_name, column_name, data_type
+        FROM user_tab_columns
+        ORDER BY table_name, column_id
+    """)
+    schemas = {}
+    for table, column, column_type in cursor.fetchall():
+        schemas.setdefault(table, []).append((column, column_type))
+    cursor.close()
+    return schemas
+
+# Nombre de COUNT(*) combinés par UNION ALL dans une même requête
+_COUNT_CHUNK_SIZE = 50
+
+def _quote_identifier(name: str) -> str:
+    """
+    Entoure un identifiant de guillemets doubles (syntaxe commune à SQLite et Oracle).
+    
+    Args:
+        name: Nom de la table ou de la colonne
+        
+    Returns:
+        Identifiant échappé
+    """
+    return '"' + name.replace('"', '""') + '"'
+
+def _count_rows(cursor, tables: List[str]) -> Dict[str, int]:
+    """
+    Compte les lignes de plusieurs tables avec une requête UNION ALL par groupe de tables.
+    
+    Args:
+        cursor: Curseur SQLite ou Oracle
+        tables: Noms exacts des tables
+        
+    Returns:
+        Dictionnaire {table: nombre de lignes}
+    """
+    counts = {}
+    for start in range(0, len(tables), _COUNT_CHUNK_SIZE):
+        chunk = tables[start:start + _COUNT_CHUNK_SIZE]
+        query = " UNION ALL ".join(
+            f"SELECT {index}, COUNT(*) FROM {_quote_identifier(table)}"
+            for index, table in enumerate(chunk)
+        )
+        cursor.execute(query)
+        for index, count in cursor.fetchall():
+            counts[chunk[index]] = count
+    return counts
+
+def _get_row_counts(conn, tables: List[str]) -> Dict[str, int]:
+    """
+    Compte les lignes de plusieurs tables sur un curseur dédié.
+    
+    Args:
+        conn: Connexion SQLite ou Oracle
+        tables: Noms exacts des tables
+        
+    Returns:
+        Dictionnaire {table: nombre de lignes}
+    """
+    cursor = conn.cursor()
+    try:
+        return _count_rows(cursor, tables)
+    finally:
+        cursor.close()
+
+def get_sqlite_row_counts(conn: sqlite3.Connection, tables: List[str]) -> Dict[str, int]:
+    """
+    Récupère le nombre de lignes de plusieurs tables SQLite en une seule requête.
+    
+    Args:
+        conn: Connexion SQLite
+        tables: Noms des tables
+        
+    Returns:
+        Dictionnaire {table: nombre de lignes}
+    """
+    return _get_row_counts(conn, tables)
+
+def get_oracle_row_counts(conn: oracledb.Connection, tables: List[str]) -> Dict[str, int]:
+    """
+    Récupère le nombre de lignes de plusieurs tables Oracle (une requête par lot de 50 tables).
+    
+    Args:
+        conn: Connexion Oracle
+        tables: Noms des tables (en majuscules)
+        
+    Returns:
+        Dictionnaire {table: nombre de lignes}
+    """
+    return _get_row_counts(conn, tables)
+
+class TableDetail:
+    """
+    Résultat compact de la comparaison d'une table (sans __dict__ par instance).
+    
+    Args:
+        table: Nom de la table SQLite
+        sqlite_columns: Nombre de colonnes dans SQLite
+        oracle_columns: Nombre de colonnes dans Oracle
+        sqlite_count: Nombre de lignes dans SQLite
+        oracle_count: Nombre de lignes dans Oracle
+    """
+    __slots__ = ("table", "sqlite_columns", "oracle_columns", "sqlite_count", "oracle_count")
+    
+    def __init__(self, table: str, sqlite_columns: int, oracle_columns: int,
+                 sqlite_count: int, oracle_count: int):
+        self.table = table
+        self.sqlite_columns = sqlite_columns
+        self.oracle_columns = oracle_columns
+        self.sqlite_count = sqlite_count
+        self.oracle_count = oracle_count
+    
+    def __repr__(self) -> str:
+        return (f"TableDetail({self.table!r}, {self.sqlite_columns}, {self.oracle_columns}, "
+                f"{self.sqlite_count}, {self.oracle_count})")
+
+class SQLiteIntrospector:
+    """
+    Regroupe les lectures de métadonnées SQLite sur un seul curseur et une seule transaction.
+    
+    Utilisé comme gestionnaire de contexte, il ouvre une transaction de lecture
+    (BEGIN différé) conservée pendant toute la validation, puis la termine.
+    """
+    
+    def __init__(self, conn: sqlite3.Connection):
+        """
+        Initialise l'introspecteur.
+        
+        Args:
+            conn: Connexion SQLite
+        """
+        self.conn = conn
+        self.cursor = conn.cursor()
+        self._tables = None
+        self._schemas = None
+    
+    def __enter__(self) -> "SQLiteIntrospector":
+        if not self.conn.in_transaction:
+            self.cursor.execute("BEGIN")
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.conn.in_transaction:
+            self.conn.commit()
+        self.cursor.close()
+    
+    def get_tables(self) -> List[str]:
+        """
+        Retourne (et met en cache) la liste des tables.
+        
+        Returns:
+            Liste des noms de tables
+        """
+        if self._tables is None:
+            self.cursor.execute(_SQLITE_TABLES_SQL)
+            self._tables = [row[0] for row in self.cursor.fetchall()]
+        return self._tables
+    
+    def get_schemas(self) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Retourne (et met en cache) le schéma de toutes les tables.
+        
+        Returns:
+            Dictionnaire {table: liste de tuples (nom_colonne, type_colonne)}
+        """
+        if self._schemas is None:
+            self.cursor.execute(_SQLITE_SCHEMAS_SQL)
+            self._schemas = {}
+            for table, column, column_type in self.cursor.fetchall():
+                self._schemas.setdefault(table, []).append((column, column_type))
+        return self._schemas
+    
+    def get_row_counts(self, tables: List[str]) -> Dict[str, int]:
+        """
+        Compte les lignes des tables demandées.
+        
+        Args:
+            tables: Noms des tables
+            
+        Returns:
+            Dictionnaire {table: nombre de lignes}
+        """
+        return _count_rows(self.cursor, tables)
+
+# Correspondance des types SQLite (sans taille) vers les types Oracle
+_TYPE_MAP = {
+    "INTEGER": "NUMBER",
+    "INT": "NUMBER",
+    "REAL": "FLOAT",
+    "TEXT": "VARCHAR2",
+    "VARCHAR": "VARCHAR2",
+    "DATETIME": "DATE",
+    "DATE": "DATE",
+    "BLOB": "BLOB",
+    "BOOLEAN": "NUMBER(1)",
+}
+
+# Types Oracle considérés comme équivalents à NUMBER et à VARCHAR2
+_NUMBER_EQUIV = frozenset({"INTEGER", "NUMBER", "FLOAT"})
+_VARCHAR_EQUIV = frozenset({"VARCHAR2", "CLOB", "NVARCHAR2", "CHAR"})
+
+@functools.lru_cache(maxsize=256)
 def map_sqlite_type_to_oracle(sqlite_type: str) -> str:
     """
     Mappe un type SQLite vers son équivalent Oracle.
@@ -161,24 +491,13 @@ def map_sqlite_type_to_oracle(sqlite_type: str) -> str:
     Returns:
         Type Oracle équivalent
     """
-    type_map = {
-        "INTEGER": "NUMBER",
-        "INT": "NUMBER",
-        "REAL": "FLOAT",
-        "TEXT": "VARCHAR2",
-        "VARCHAR": "VARCHAR2",
-        "DATETIME": "DATE",
-        "DATE": "DATE",
-        "BLOB": "BLOB",
-        "BOOLEAN": "NUMBER(1)",
-    }
-    
     # Gérer les types avec taille (VARCHAR(255) -> VARCHAR2)
-    base_type = re.sub(r'\(.*\)', '', sqlite_type.upper())
+    base_type = _PAREN_RE.sub('', sqlite_type.upper())
     
     # Retourner le type Oracle équivalent ou le type SQLite si aucune correspondance
-    return type_map.get(base_type, sqlite_type)
+    return _TYPE_MAP.get(base_type, sqlite_type)
 
+@functools.lru_cache(maxsize=1024)
 def compare_types(sqlite_type: str, oracle_type: str) -> bool:
     """
     Compare un type SQLite et un type Oracle pour vérifier leur équivalence.
@@ -194,17 +513,35 @@ def compare_types(sqlite_type: str, oracle_type: str) -> bool:
     expected_oracle_type = map_sqlite_type_to_oracle(sqlite_type)
     
     # Comparer les bases des types (ignorer les tailles)
-    base_expected = re.sub(r'\(.*\)', '', expected_oracle_type.upper())
-    base_actual = re.sub(r'\(.*\)', '', oracle_type.upper())
+    base_expected = _PAREN_RE.sub('', expected_oracle_type.upper())
+    base_actual = _PAREN_RE.sub('', oracle_type.upper())
     
     # Gérer les cas spéciaux
-    if base_expected == "NUMBER" and base_actual in ["INTEGER", "NUMBER", "FLOAT"]:
+    if base_expected == "NUMBER" and base_actual in _NUMBER_EQUIV:
         return True
-    if base_expected == "VARCHAR2" and base_actual in ["VARCHAR2", "CLOB", "NVARCHAR2", "CHAR"]:
+    if base_expected == "VARCHAR2" and base_actual in _VARCHAR_EQUIV:
         return True
     
     return base_expected == base_actual
 
+def _schemas_match(sqlite_schema: List[Tuple[str, str]], oracle_schema: List[Tuple[str, str]]) -> bool:
+    """
+    Vérifie rapidement, colonne par colonne et dans l'ordre, que deux schémas correspondent.
+    
+    Args:
+        sqlite_schema: Colonnes SQLite (nom, type) dans l'ordre de déclaration
+        oracle_schema: Colonnes Oracle (nom, type) dans l'ordre de column_id
+        
+    Returns:
+        True si les noms et les types concordent, False si une comparaison détaillée est nécessaire
+    """
+    if len(sqlite_schema) != len(oracle_schema):
+        return False
+    for (sqlite_name, sqlite_type), (oracle_name, oracle_type) in zip(sqlite_schema, oracle_schema):
+        if sqlite_name.upper() != oracle_name.upper() or not compare_types(sqlite_type, oracle_type):
+            return False
+    return True
+
 def validate_schema(
     sqlite_conn: sqlite3.Connection, 
     oracle_conn: oracledb.Connection, 
@@ -221,42 +558,50 @@ def validate_schema(
     Returns:
         Dictionnaire de résultats de validation
     """
-    # Récupérer les tables
-    sqlite_tables = get_sqlite_tables(sqlite_conn)
-    oracle_tables = get_oracle_tables(oracle_conn)
-    
-    # Normaliser les noms de tables Oracle (les convertir en majuscules)
-    oracle_tables = [table.upper() for table in oracle_tables]
+    # Les requêtes Oracle (réseau) sont exécutées dans un thread pendant que la
+    # base SQLite est interrogée dans le thread courant : une connexion par thread
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        oracle_future = executor.submit(
+            lambda: (get_oracle_tables(oracle_conn), get_oracle_schemas(oracle_conn))
+        )
+        
+        with SQLiteIntrospector(sqlite_conn) as introspector:
+            # Récupérer les tables et les schémas de toutes les tables en une requête par base
+            sqlite_tables = introspector.get_tables()
+            sqlite_schemas = introspector.get_schemas()
+            oracle_tables, oracle_schemas = oracle_future.result()
+        
+            
+            # Normaliser les noms de tables Oracle (les convertir en majuscules)
+            oracle_tables = [table.upper() for table in oracle_tables]
+            oracle_tables_set = set(oracle_tables)
+            
+            # Nom Oracle (majuscules) de chaque table SQLite, calculé une seule fois
+            upper_names = {table: table.upper() for table in sqlite_tables}
+            
+            # Compter les lignes de toutes les tables présentes des deux côtés en une fois
+            common_tables = [table for table in sqlite_tables if upper_names[table] in oracle_tables_set]
+            oracle_counts_future = executor.submit(
+                get_oracle_row_counts, oracle_conn, [upper_names[table] for table in common_tables]
+            )
+            sqlite_counts = introspector.get_row_counts(common_tables)
+            oracle_counts = oracle_counts_future.result()
+    finally:
+        executor.shutdown(wait=True)
     
     # Détecter les tables qui semblent avoir été créées avec une structure simplifiée
     simplified_tables = []
-    try:
-        # Vérifier les tables qui ont exactement les colonnes standard des tables simplifiées
-        cursor = oracle_conn.cursor()
-        for table in oracle_tables:
-            try:
-                # Vérifier si la table a les colonnes standard de la structure simplifiée
-                query = f"""
-                SELECT COUNT(*) FROM user_tab_columns 
-                WHERE table_name = '{table}' 
-                AND column_name IN ('ID', 'NAME', 'VALUE', 'CREATED_DATE', 'DESCRIPTION')
-                """
-                cursor.execute(query)
-                standard_cols_count = cursor.fetchone()[0]
-                
-                query = f"SELECT COUNT(*) FROM user_tab_columns WHERE table_name = '{table}'"
-                cursor.execute(query)
-                total_cols_count = cursor.fetchone()[0]
-                
-                # Si toutes les colonnes sont des colonnes standard et il y en a peu (2-5)
-                if standard_cols_count >= 2 and standard_cols_count == total_cols_count and total_cols_count <= 5:
-                    simplified_tables.append(table)
-                    logger.debug(f"Table {table} détectée comme table simplifiée")
-            except:
-                pass
-        cursor.close()
-    except:
-        logger.debug("Impossible de détecter les tables simplifiées")
+    standard_columns = {'ID', 'NAME', 'VALUE', 'CREATED_DATE', 'DESCRIPTION'}
+    for table in oracle_tables:
+        columns = oracle_schemas.get(table, [])
+        standard_cols_count = sum(1 for column, _ in columns if column in standard_columns)
+        total_cols_count = len(columns)
+        
+        # Si toutes les colonnes sont des colonnes standard et il y en a peu (2-5)
+        if standard_cols_count >= 2 and standard_cols_count == total_cols_count and total_cols_count <= 5:
+            simplified_tables.append(table)
+            logger.debug(f"Table {table} détectée comme table simplifiée")
     
     # Résultats de validation
     results = {
@@ -266,7 +611,10 @@ def validate_schema(
             "total_oracle": len(oracle_tables),
             "missing": [],
             "simplified": simplified_tables,
-            "details": {}
+            # Un TableDetail par table présente dans les deux bases
+            "details": [],
+            # Détails conservés uniquement pour les tables présentant des différences
+            "issues": []
         },
         "data": {
             "tables_with_issues": 0,
@@ -278,8 +626,7 @@ def validate_schema(
     
     # Vérifier les tables manquantes
     for table in sqlite_tables:
-        oracle_table = table.upper()
-        if oracle_table not in oracle_tables:
+        if upper_names[table] not in oracle_tables_set:
             results["success"] = False
             results["tables"]["missing"].append(table)
     
@@ -296,20 +643,20 @@ def validate_schema(
         print_success_message(success_msg)
         logger.info(success_msg)
     
-    # Vérifier les colonnes et comparer les schémas
-    for table in sqlite_tables:
-        oracle_table = table.upper()
-        
-        # Ignorer les tables qui n'ont pas été créées
-        if oracle_table not in oracle_tables:
-            continue
+    # Totaux accumulés pendant la comparaison (évite de reparcourir les détails)
+    total_cols_sq = total_cols_or = 0
+    successful_tables = []
+    
+    # Vérifier les colonnes et comparer les schémas (tables présentes dans Oracle uniquement)
+    for table in common_tables:
+        oracle_table = upper_names[table]
         
-        sqlite_schema = get_sqlite_table_schema(sqlite_conn, table)
-        oracle_schema = get_oracle_table_schema(oracle_conn, oracle_table)
+        sqlite_schema = sqlite_schemas.get(table, [])
+        oracle_schema = oracle_schemas.get(oracle_table, [])
         
         # Compter les lignes
-        sqlite_count = get_sqlite_row_count(sqlite_conn, table)
-        oracle_count = get_oracle_row_count(oracle_conn, oracle_table)
+        sqlite_count = sqlite_counts[table]
+        oracle_count = oracle_counts[oracle_table]
         
         results["data"]["total_row_count_sqlite"] += sqlite_count
         results["data"]["total_row_count_oracle"] += oracle_count
@@ -323,6 +670,16 @@ def validate_schema(
                 "missing": sqlite_count - oracle_count
             })
         
+        # Chemin rapide : même nombre de lignes et colonnes identiques dans le même ordre
+        if sqlite_count == oracle_count and _schemas_match(sqlite_schema, oracle_schema):
+            results["tables"]["details"].append(
+                TableDetail(table, len(sqlite_schema), len(oracle_schema), sqlite_count, oracle_count)
+            )
+            total_cols_sq += len(sqlite_schema)
+            total_cols_or += len(oracle_schema)
+            successful_tables.append(table)
+            continue
+        
         # Comparaison des colonnes
         sqlite_columns = {col[0].upper(): col[1] for col in sqlite_schema}
         oracle_columns = {col[0].upper(): col[1] for col in oracle_schema}
@@ -342,19 +699,23 @@ def validate_schema(
                 })
         
         # Stocker les résultats
-        results["tables"]["details"][table] = {
-            "sqlite_columns": len(sqlite_columns),
-            "oracle_columns": len(oracle_columns),
-            "missing_columns": missing_columns,
-            "type_mismatches": type_mismatches,
-            "sqlite_rows": sqlite_count,
-            "oracle_rows": oracle_count
-        }
+        results["tables"]["details"].append(
+            TableDetail(table, len(sqlite_columns), len(oracle_columns), sqlite_count, oracle_count)
+        )
+        total_cols_sq += len(sqlite_columns)
+        total_cols_or += len(oracle_columns)
         
         # Mettre à jour le statut global
         if missing_columns or type_mismatches:
+            results["tables"]["issues"].append({
+                "table": table,
+                "missing_columns": missing_columns,
+                "type_mismatches": type_mismatches
+            })
             results["success"] = False
             results["data"]["tables_with_issues"] += 1
+        elif sqlite_count == oracle_count:
+            successful_tables.append(table)
     
     # Afficher les résultats des colonnes et types
     if results["data"]["tables_with_issues"] > 0:
@@ -363,19 +724,18 @@ def validate_schema(
         logger.warning(schema_issues_msg)
         
         if verbose:
-            for table, details in results["tables"]["details"].items():
-                if details["missing_columns"] or details["type_mismatches"]:
-                    table_msg = f"Table {table}"
-                    logger.warning(table_msg)
-                    
-                    if details["missing_columns"]:
-                        missing_cols_msg = f"  - Colonnes manquantes: {', '.join(details['missing_columns'])}"
-                        logger.warning(missing_cols_msg)
-                    
-                    if details["type_mismatches"]:
-                        for mismatch in details["type_mismatches"]:
-                            type_msg = f"  - Type différent pour {mismatch['column']}: SQLite={mismatch['sqlite_type']}, Oracle={mismatch['oracle_type']}"
-                            logger.warning(type_msg)
+            for details in results["tables"]["issues"]:
+                table_msg = f"Table {details['table']}"
+                logger.warning(table_msg)
+                
+                if details["missing_columns"]:
+                    missing_cols_msg = f"  - Colonnes manquantes: {', '.join(details['missing_columns'])}"
+                    logger.warning(missing_cols_msg)
+                
+                if details["type_mismatches"]:
+                    for mismatch in details["type_mismatches"]:
+                        type_msg = f"  - Type différent pour {mismatch['column']}: SQLite={mismatch['sqlite_type']}, Oracle={mismatch['oracle_type']}"
+                        logger.warning(type_msg)
     else:
         schema_success_msg = "Tous les schémas de tables correspondent"
         print_success_message(schema_success_msg)
@@ -397,86 +757,82 @@ def validate_schema(
         print_success_message(data_success_msg)
         logger.info(data_success_msg)
     
-    # Afficher un récapitulatif des statistiques
-    print("\n" + "=" * 50)
-    print("RÉCAPITULATIF DE LA VALIDATION")
-    print("=" * 50)
-    print(f"Tables SQLite: {results['tables']['total_sqlite']}")
-    print(f"Tables Oracle: {results['tables']['total_oracle']}")
-    print(f"Tables avec structure simplifiée: {len(simplified_tables)}")
-    print(f"Tables avec problèmes de schéma: {results['data']['tables_with_issues']}")
-    print(f"Lignes dans SQLite: {results['data']['total_row_count_sqlite']}")
-    print(f"Lignes dans Oracle: {results['data']['total_row_count_oracle']}")
+    # Afficher un récapitulatif des statistiques (écrit en une seule fois)
+    buf = []
+    buf.append("\n" + "=" * 50)
+    buf.append("RÉCAPITULATIF DE LA VALIDATION")
+    buf.append("=" * 50)
+    buf.append(f"Tables SQLite: {results['tables']['total_sqlite']}")
+    buf.append(f"Tables Oracle: {results['tables']['total_oracle']}")
+    buf.append(f"Tables avec structure simplifiée: {len(simplified_tables)}")
+    buf.append(f"Tables avec problèmes de schéma: {results['data']['tables_with_issues']}")
+    buf.append(f"Lignes dans SQLite: {results['data']['total_row_count_sqlite']}")
+    buf.append(f"Lignes dans Oracle: {results['data']['total_row_count_oracle']}")
     
     # Calculer le pourcentage de données importées avec succès
     if results['data']['total_row_count_sqlite'] > 0:
         success_percentage = (results['data']['total_row_count_oracle'] / results['data']['total_row_count_sqlite']) * 100
-        print(f"Pourcentage de données importées: {success_percentage:.2f}%")
+        buf.append(f"Pourcentage de données importées: {success_percentage:.2f}%")
     
-    print(f"Tables avec données manquantes: {len(results['data']['tables_with_missing_data'])}")
+    buf.append(f"Tables avec données manquantes: {len(results['data']['tables_with_missing_data'])}")
     
     # Ajouter des détails supplémentaires en mode verbose
     if verbose:
         # Détails des tables avec structure simplifiée
         if simplified_tables:
-            print("\n" + "-" * 50)
-            print("TABLES AVEC STRUCTURE SIMPLIFIÉE")
-            print("-" * 50)
+            buf.append("\n" + "-" * 50)
+            buf.append("TABLES AVEC STRUCTURE SIMPLIFIÉE")
+            buf.append("-" * 50)
             for table in simplified_tables:
-                print(f"- {table}")
-            print("\nCes tables ont été créées avec une structure simplifiée car leur schéma d'origine n'était pas compatible avec Oracle.")
-            print("Les données d'origine n'ont pas pu être importées pour ces tables.")
+                buf.append(f"- {table}")
+            buf.append("\nCes tables ont été créées avec une structure simplifiée car leur schéma d'origine n'était pas compatible avec Oracle.")
+            buf.append("Les données d'origine n'ont pas pu être importées pour ces tables.")
         
         # Détails des tables avec problèmes de schéma
         if results['data']['tables_with_issues'] > 0:
-            print("\n" + "-" * 50)
-            print("DÉTAILS DES PROBLÈMES DE SCHÉMA")
-            print("-" * 50)
-            for table, details in results['tables']['details'].items():
-                if details['missing_columns'] or details['type_mismatches']:
-                    print(f"\nTable: {table}")
-                    if details['missing_columns']:
-                        print(f"  Colonnes manquantes ({len(details['missing_columns'])}):")
-                        for col in details['missing_columns']:
-                            print(f"    - {col}")
-                    if details['type_mismatches']:
-                        print(f"  Types incompatibles ({len(details['type_mismatches'])}):")
-                        for mismatch in details['type_mismatches']:
-                            print(f"    - {mismatch['column']}: SQLite={mismatch['sqlite_type']}, Oracle={mismatch['oracle_type']}")
+            buf.append("\n" + "-" * 50)
+            buf.append("DÉTAILS DES PROBLÈMES DE SCHÉMA")
+            buf.append("-" * 50)
+            for details in results['tables']['issues']:
+                buf.append(f"\nTable: {details['table']}")
+                if details['missing_columns']:
+                    buf.append(f"  Colonnes manquantes ({len(details['missing_columns'])}):")
+                    for col in details['missing_columns']:
+                        buf.append(f"    - {col}")
+                if details['type_mismatches']:
+                    buf.append(f"  Types incompatibles ({len(details['type_mismatches'])}):")
+                    for mismatch in details['type_mismatches']:
+                        buf.append(f"    - {mismatch['column']}: SQLite={mismatch['sqlite_type']}, Oracle={mismatch['oracle_type']}")
         
         # Détails des tables avec données manquantes
         if results['data']['tables_with_missing_data']:
-            print("\n" + "-" * 50)
-            print("DÉTAILS DES DONNÉES MANQUANTES")
-            print("-" * 50)
+            buf.append("\n" + "-" * 50)
+            buf.append("DÉTAILS DES DONNÉES MANQUANTES")
+            buf.append("-" * 50)
             for table_info in results['data']['tables_with_missing_data']:
                 percentage = (table_info['oracle_count'] / table_info['sqlite_count']) * 100 if table_info['sqlite_count'] > 0 else 0
-                print(f"\nTable: {table_info['table']}")
-                print(f"  Lignes dans SQLite: {table_info['sqlite_count']}")
-                print(f"  Lignes dans Oracle: {table_info['oracle_count']}")
-                print(f"  Lignes manquantes: {table_info['missing']} ({100 - percentage:.2f}% des données)")
+                buf.append(f"\nTable: {table_info['table']}")
+                buf.append(f"  Lignes dans SQLite: {table_info['sqlite_count']}")
+                buf.append(f"  Lignes dans Oracle: {table_info['oracle_count']}")
+                buf.append(f"  Lignes manquantes: {table_info['missing']} ({100 - percentage:.2f}% des données)")
         
         # Statistiques globales des colonnes
-        total_columns_sqlite = sum(details['sqlite_columns'] for details in results['tables']['details'].values())
-        total_columns_oracle = sum(details['oracle_columns'] for details in results['tables']['details'].values())
-        print("\n" + "-" * 50)
-        print("STATISTIQUES GLOBALES")
-        print("-" * 50)
-        print(f"Total des colonnes SQLite: {total_columns_sqlite}")
-        print(f"Total des colonnes Oracle: {total_columns_oracle}")
+        buf.append("\n" + "-" * 50)
+        buf.append("STATISTIQUES GLOBALES")
+        buf.append("-" * 50)
+        buf.append(f"Total des colonnes SQLite: {total_cols_sq}")
+        buf.append(f"Total des colonnes Oracle: {total_cols_or}")
         
         # Ajouter un résumé des tables importées avec succès
-        successful_tables = [table for table, details in results['tables']['details'].items() 
-                           if not details['missing_columns'] and not details['type_mismatches'] and 
-                           details['sqlite_rows'] == details['oracle_rows']]
-        
-        print(f"\nTables importées avec succès (schéma et données): {len(successful_tables)}/{len(results['tables']['details'])}")
+        buf.append(f"\nTables importées avec succès (schéma et données): {len(successful_tables)}/{len(results['tables']['details'])}")
         if successful_tables:
-            print("Tables validées sans problème:")
+            buf.append("Tables validées sans problème:")
             for i, table in enumerate(sorted(successful_tables)):
-                print(f"  {i+1}. {table}")
+                buf.append(f"  {i+1}. {table}")
     
-    print("=" * 50)
+    buf.append("=" * 50)
+    sys.stdout.write("\n".join(buf) + "\n")
+    sys.stdout.flush()
     
     if results["success"]:
         print_success_message("VALIDATION RÉUSSIE")
@@ -604,4 +960,4 @@ def run_validation(
     finally:
         # Fermeture des connexions
         sqlite_conn.close()
-        oracle_conn.close()
+        _release_oracle_connection(oracle_config, oracle_conn)
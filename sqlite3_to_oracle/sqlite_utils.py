@@ -4,17 +4,46 @@ Utilitaires pour les opérations liées à SQLite.
 Ce module fournit des fonctions utilitaires pour travailler avec des bases de données SQLite,
 comme l'extraction de contenu SQL et la gestion des structures de données.
 """
+import os
 import sys
+import sqlite3
+from pathlib import Path
 from typing import Dict, List, Tuple, Any, Optional
 
 from . import logger
 from .converter import extract_sqlite_data
 from .rich_logging import print_error_message, print_exception
 
+# Réglages pour une extraction en lecture seule : cache de 256 Mo, fichier projeté en mémoire
+_READONLY_PRAGMAS = """
+PRAGMA query_only = 1;
+PRAGMA cache_size = -262144;
+PRAGMA mmap_size = 1073741824;
+PRAGMA temp_store = MEMORY;
+"""
+
+def open_sqlite_readonly(sqlite_path: str) -> sqlite3.Connection:
+    """
+    Ouvre une base SQLite source en lecture seule, configurée pour les lectures massives.
+    
+    Pas de immutable=1 : SQLite ignorerait le fichier -wal et perdrait les transactions
+    d'une base en mode WAL qui ne sont pas encore reportées dans le fichier principal.
+    
+    Args:
+        sqlite_path: Chemin vers le fichier SQLite
+        
+    Returns:
+        Connexion SQLite en lecture seule
+    """
+    uri = Path(sqlite_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+    conn.executescript(_READONLY_PRAGMAS)
+    return conn
+
 def extract_sqlite_content(sqlite_path: str) -> str:
     """
     Extrait le contenu SQL de la base SQLite.
-    Utilise d'abord extract_sqlite_data, puis une méthode alternative en cas d'échec.
+    Utilise extract_sqlite_data, sauf pour une base vide qui ne contient aucune table.
     
     Args:
         sqlite_path: Chemin vers le fichier SQLite
@@ -25,10 +54,15 @@ def extract_sqlite_content(sqlite_path: str) -> str:
     Raises:
         SystemExit: Si l'extraction échoue avec les deux méthodes
     """
+    # Base en mémoire ou fichier vide : aucune table, inutile d'ouvrir une connexion
+    if sqlite_path == ":memory:" or (os.path.isfile(sqlite_path) and os.path.getsize(sqlite_path) == 0):
+        logger.debug("Base SQLite vide, aucun contenu à extraire: %s", sqlite_path)
+        return ""
+    
     try:
-        logger.info(f"Extraction du contenu de la base SQLite: {sqlite_path}")
+        logger.info("Extraction du contenu de la base SQLite: %s", sqlite_path)
         sql_content = extract_sqlite_data(sqlite_path)
-        logger.debug(f"Extraction réussie: {len(sql_content)} caractères")
+        logger.debug("Extraction réussie: %s caractères", len(sql_content))
         return sql_content
     except Exception as e:
         logger.error(f"Erreur lors de l'extraction de la base SQLite: {str(e)}")
@@ -5,7 +5,7 @@ import unittest
 import os
 import tempfile
 import json
-from sqlite3_to_oracle.config import load_oracle_config, save_oracle_config, get_connection_string
+from sqlite3_to_oracle.config import load_oracle_config, save_oracle_config, get_connection_string, is_true_value
 
 class TestConfig(unittest.TestCase):
     """Tests pour les fonctions de gestion de configuration."""
@@ -86,6 +86,20 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(config["password"], "cli_password")
         self.assertEqual(config["dsn"], "cli_host:1521/cli_service")
     
+    def test_config_file_cache_follows_changes(self):
+        """Vérifie que le fichier mis en cache est relu après modification et que le cache n'est pas altérable."""
+        from sqlite3_to_oracle.config import _read_json_config
+        
+        first = _read_json_config(self.config_file)
+        first["user"] = "modified"
+        self.assertEqual(_read_json_config(self.config_file)["user"], self.test_config["user"])
+        
+        with open(self.config_file, 'w') as f:
+            json.dump(dict(self.test_config, user="other_user"), f)
+        
+        config, _ = load_oracle_config(config_file=self.config_file)
+        self.assertEqual(config["user"], "other_user")
+    
     def test_save_oracle_config(self):
         """Teste la sauvegarde de la configuration."""
         save_path = os.path.join(self.temp_dir, "saved_config.json")
@@ -109,6 +123,13 @@ class TestConfig(unittest.TestCase):
         expected = f"{self.test_config['user']}/{self.test_config['password']}@{self.test_config['dsn']}"
         
         self.assertEqual(connection_string, expected)
+    
+    def test_is_true_value(self):
+        """Vérifie la reconnaissance des valeurs booléennes des variables d'environnement."""
+        for value in ("true", "YES", "1", "On"):
+            self.assertTrue(is_true_value(value))
+        for value in ("false", "0", "", None):
+            self.assertFalse(is_true_value(value))
 
 if __name__ == '__main__':
     unittest.main()
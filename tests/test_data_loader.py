@@ -0,0 +1,58 @@
+"""
+Tests pour le module data_loader.py
+"""
+
+import pytest
+from sqlite3_to_oracle.data_loader import _iter_report_tables, is_performance_table
+
+SAMPLE_REPORT = """
+==================================================
+RÉCAPITULATIF DE LA VALIDATION
+==================================================
+Tables SQLite: 3
+
+--------------------------------------------------
+TABLES AVEC STRUCTURE SIMPLIFIÉE
+--------------------------------------------------
+- L_AIRPORT
+
+Ces tables ont été créées avec une structure simplifiée car leur schéma d'origine n'était pas compatible avec Oracle.
+
+--------------------------------------------------
+DÉTAILS DES DONNÉES MANQUANTES
+--------------------------------------------------
+
+Table: users
+  Lignes dans SQLite: 2
+  Lignes dans Oracle: 1
+  Lignes manquantes: 1 (50.00% des données)
+
+Table: on_time
+  Lignes dans SQLite: 10
+  Lignes dans Oracle: 0
+  Lignes manquantes: 10 (100.00% des données)
+==================================================
+"""
+
+class TestIterReportTables:
+    """Tests pour l'analyse ligne par ligne du rapport de validation."""
+
+    def test_extracts_all_tables(self):
+        """Vérifie que toutes les tables simplifiées ou incomplètes sont extraites."""
+        tables = list(_iter_report_tables(SAMPLE_REPORT.splitlines(keepends=True)))
+
+        assert tables == ["L_AIRPORT", "users", "on_time"]
+
+    def test_ignores_report_without_issues(self):
+        """Vérifie qu'un rapport sans section problématique ne produit aucune table."""
+        report = "RÉCAPITULATIF DE LA VALIDATION\n- pas une table\n"
+
+        assert list(_iter_report_tables(report.splitlines())) == []
+
+class TestIsPerformanceTable:
+    """Tests pour le choix du chargeur des tables volumineuses."""
+
+    def test_detects_on_time_tables(self):
+        """Vérifie que les tables ON_TIME sont reconnues quelle que soit la casse."""
+        assert is_performance_table("on_time_on_time_performance_2016_1")
+        assert not is_performance_table("L_AIRPORT")